@@ -28,12 +28,13 @@ export DJANGO_SETTINGS_MODULE="pythonkr_backend.settings.prod"
 
 ./manage.py migrate --no-input
 ./manage.py migrate django_celery_results
+./manage.py createcachetable
 ./manage.py tailwind install && ./manage.py tailwind build
 ./manage.py loaddata fixtures.json
 ./manage.py collectstatic  --clear --noinput
 
 # stop celery worker with beat
-celery -A pythonkr_backend multi stop worker -c2 -B \
+celery -A pythonkr_backend multi stop worker -c2 -B -Q celery,llm \
        --pidfile=/home/pk/celery-%n.pid \
        --logfile=/home/pk/logs/celery-%n-%i.log
 
@@ -61,7 +62,7 @@ gunicorn --workers=2  \
     pythonkr_backend.wsgi
 
 # start celery worker with beat
-celery -A pythonkr_backend multi start worker -c2 -B \
+celery -A pythonkr_backend multi start worker -c2 -B -Q celery,llm \
        --loglevel=info \
        --pidfile=/home/pk/celery-%n.pid \
        --logfile=/home/pk/logs/celery-%n-%i.log
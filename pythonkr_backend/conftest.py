@@ -0,0 +1,5 @@
+def pytest_configure(config):
+    from django.conf import settings
+
+    # 테스트에서 만드는 사용자의 비밀번호 해시를 PBKDF2 대신 빠른 해셔로 처리합니다
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -1,4 +1,9 @@
+import logging
+from functools import cache
+
 from django.contrib import admin, messages
+from django.db.models import Case, Count, F, TextField, When
+from django.db.models.functions import Substr
 from django.urls import reverse
 from django.utils.html import format_html
 from .models import (
@@ -8,9 +13,13 @@ from .models import (
     RSSItem,
     LLMService,
     LLMUsage,
+    LLMUsageDaily,
+    Tag,
     TranslatedContent,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -19,28 +28,49 @@ class CategoryAdmin(admin.ModelAdmin):
     prepopulated_fields = {"slug": ("name",)}  # Auto-populate slug from name
 
 
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ("name", "slug")
+    search_fields = ("name",)
+    prepopulated_fields = {"slug": ("name",)}
+
+
+MAX_REPORTED_ERRORS = 20
+
+
+def _message_errors(modeladmin, request, errors):
+    """Report the first few action errors and summarize the rest as a count."""
+    error_message = "Errors encountered:\n" + "\n".join(errors[:MAX_REPORTED_ERRORS])
+    remaining = len(errors) - MAX_REPORTED_ERRORS
+    if remaining > 0:
+        error_message += f"\n...and {remaining} more"
+    modeladmin.message_user(request, error_message, messages.WARNING)
+
+
 @admin.action(description="Fetch content, summarize, and translate selected articles")
 def summarize_selected_articles(modeladmin, request, queryset):
-    success_count = 0
+    from .tasks import process_article
+
+    task_ids = []
     errors = []
 
-    for article in queryset:
-        result = article.fetch_and_summarize()
-        if result.startswith("Error"):
-            errors.append(f"{article.url}: {result}")
-        else:
-            success_count += 1
+    # Each article waits on the scraper and LLM APIs, so hand it to a Celery worker
+    for article in queryset.only("id", "url"):
+        try:
+            task_ids.append(process_article.delay(article.id).id)
+        except Exception as e:
+            logger.exception("Failed to queue summarize for article id=%s", article.id)
+            errors.append(f"{article.url}: {e}")
 
-    if success_count > 0:
+    if task_ids:
         modeladmin.message_user(
             request,
-            f"Successfully processed {success_count} article(s) (fetch, summarize, translate).",
+            f"Queued {len(task_ids)} article(s) for fetch, summarize, and translate.",
             messages.SUCCESS,
         )
 
     if errors:
-        error_message = "Errors encountered:\n" + "\n".join(errors)
-        modeladmin.message_user(request, error_message, messages.WARNING)
+        _message_errors(modeladmin, request, errors)
 
 
 @admin.register(Article)
@@ -55,8 +85,9 @@ class ArticleAdmin(admin.ModelAdmin):
         "updated_at",
         "created_at",
     )
-    list_filter = ("categories", "created_at", "updated_at")
-    search_fields = ("url", "title", "summary", "summary_ko", "categories__name")
+    list_filter = ("categories", "summary_ko_error", "created_at", "updated_at")
+    # categories are filtered through list_filter; summaries are not searched
+    search_fields = ("=url", "^title")
     readonly_fields = (
         "created_at",
         "updated_at",
@@ -65,7 +96,6 @@ class ArticleAdmin(admin.ModelAdmin):
         "reading_time_minutes",
     )
     actions = [summarize_selected_articles]
-    filter_horizontal = ("categories",)
 
     fieldsets = (
         ("Article Information", {"fields": ("url", "title", "categories")}),
@@ -85,9 +115,27 @@ class ArticleAdmin(admin.ModelAdmin):
     @admin.display(description="Categories")
     def display_categories(self, obj):
         """Displays categories as a comma-separated string in the list view."""
-        if obj.categories.exists():
-            return ", ".join([category.name for category in obj.categories.all()])
-        return "-"  # Or None, or empty string
+        # categories are prefetched in get_queryset, so .all() hits the cache
+        names = [category.name for category in obj.categories.all()]
+        return ", ".join(names) if names else "-"
+
+    def get_queryset(self, request):
+        # Only the first characters of the summaries are rendered in the list,
+        # one past the preview length so we can tell whether to add "...".
+        # A failed translation keeps its whole (short) error message.
+        return (
+            super()
+            .get_queryset(request)
+            .defer("summary", "summary_ko")
+            .annotate(
+                _summary_preview=Substr("summary", 1, 101),
+                _summary_ko_preview=Case(
+                    When(summary_ko_error=True, then=F("summary_ko")),
+                    default=Substr("summary_ko", 1, 51),
+                    output_field=TextField(),
+                ),
+            )
+        )
 
     def get_readonly_fields(self, request, obj=None):
         # Make 'categories' always read-only as it's set by the LLM
@@ -98,18 +146,20 @@ class ArticleAdmin(admin.ModelAdmin):
 
     @admin.display(description="Summary Preview")
     def summary_preview(self, obj):
-        if obj.summary:
-            preview = obj.summary[:100]
-            return f"{preview}..." if len(obj.summary) > 100 else preview
+        summary = obj._summary_preview
+        if summary:
+            preview = summary[:100]
+            return f"{preview}..." if len(summary) > 100 else preview
         return "No summary available"
 
     @admin.display(description="Korean Summary Preview")
     def summary_ko_preview(self, obj):
-        if obj.summary_ko:
-            if obj.summary_ko.startswith("Translation Error"):
-                return obj.summary_ko
-            preview = obj.summary_ko[:50]
-            return f"{preview}..." if len(obj.summary_ko) > 50 else preview
+        if obj.summary_ko_error:
+            return obj._summary_ko_preview
+        summary_ko = obj._summary_ko_preview
+        if summary_ko:
+            preview = summary_ko[:50]
+            return f"{preview}..." if len(summary_ko) > 50 else preview
         return "No Korean summary"
 
 
@@ -129,7 +179,10 @@ class RSSFeedAdmin(admin.ModelAdmin):
     readonly_fields = ("last_fetched", "created_at", "updated_at")
 
     fieldsets = (
-        ("Feed Information", {"fields": ("name", "url", "is_active", "is_newsletter")}),
+        (
+            "Feed Information",
+            {"fields": ("name", "url", "is_active", "is_newsletter", "max_items")},
+        ),
         (
             "Status",
             {
@@ -139,9 +192,12 @@ class RSSFeedAdmin(admin.ModelAdmin):
         ),
     )
 
-    @admin.display(description="Items Count")
+    @admin.display(description="Items Count", ordering="_item_count")
     def item_count(self, obj):
-        return obj.items.count()
+        return obj._item_count
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_item_count=Count("items"))
 
     actions = ["crawl_selected_feeds"]
 
@@ -149,28 +205,110 @@ class RSSFeedAdmin(admin.ModelAdmin):
     def crawl_selected_feeds(self, request, queryset):
         from .tasks import crawl_single_rss_feed
 
-        success_count = 0
-        total_new_items = 0
+        task_ids = []
         errors = []
 
-        for feed in queryset:
+        # Crawling blocks on the network, so hand each feed to a Celery worker
+        for feed in queryset.only("id", "name"):
             try:
-                result = crawl_single_rss_feed(feed.id)
-                success_count += 1
-                total_new_items += result.get("new_items", 0)
+                task_ids.append(crawl_single_rss_feed.delay(feed.id).id)
             except Exception as e:
-                errors.append(f"{feed.name}: {str(e)}")
+                logger.exception("Failed to queue crawl for feed id=%s", feed.id)
+                errors.append(f"{feed.name}: {e}")
 
-        if success_count > 0:
+        if task_ids:
             self.message_user(
                 request,
-                f"Successfully crawled {success_count} feed(s). Found {total_new_items} new items.",
+                f"Queued {len(task_ids)} crawl job(s).",
                 messages.SUCCESS,
             )
 
         if errors:
-            error_message = "Errors encountered:\n" + "\n".join(errors)
-            self.message_user(request, error_message, messages.WARNING)
+            _message_errors(self, request, errors)
+
+
+_RSSITEM_LEGAL_NOTICE_HTML = (
+    "<div style='background-color: #fff3cd; border: 1px solid #ffeaa7; "
+    "padding: 15px; border-radius: 5px; margin-bottom: 20px;'>"
+    "<strong>🚨 중요 안내:</strong><br>"
+    "본 AI 분석 결과는 참고용이며 <strong>법적 효력이 없습니다</strong>. "
+    "콘텐츠의 최종 사용 결정은 반드시 관리자의 책임하에 이루어져야 하며, "
+    "필요시 법무 전문가의 자문을 받으시기 바랍니다.<br>"
+    "<em>AI analysis results are for reference only and have no legal validity. "
+    "Final content usage decisions must be made under administrator responsibility.</em>"
+    "</div>"
+)
+
+# RSSItemAdmin fieldsets; only the language section varies per object
+_RSSITEM_FIELDSETS_HEAD = (
+    (
+        "⚠️ 법적 고지",
+        {"fields": (), "description": _RSSITEM_LEGAL_NOTICE_HTML},
+    ),
+    (
+        "Item Information",
+        {"fields": ("feed", "title", "link", "author", "category", "source_item")},
+    ),
+    ("Content", {"fields": ("description",), "classes": ("collapse",)}),
+)
+
+# Korean content - show summary
+_RSSITEM_KOREAN_FIELDSET = (
+    "🇰🇷 Korean Content Processing",
+    {
+        "fields": ("language", "summary"),
+        "description": "한국어 콘텐츠는 AI 요약이 생성됩니다.",
+    },
+)
+
+# Foreign content - show copyright analysis
+_RSSITEM_COPYRIGHT_FIELDSET = (
+    "🌐 Copyright Analysis (Foreign Content)",
+    {
+        "fields": (
+            "language",
+            "license_type",
+            "is_translation_allowed",
+            "attribution_required",
+            "confidence_score",
+            "reasoning",
+        ),
+        "description": "외국어 콘텐츠의 저작권 분석 결과입니다.",
+    },
+)
+
+# No language detected yet
+_RSSITEM_ANALYSIS_PENDING_FIELDSET = (
+    "🔍 Content Analysis",
+    {
+        "fields": ("language",),
+        "description": "콘텐츠 분석이 완료되면 언어별 처리 결과가 표시됩니다.",
+    },
+)
+
+_RSSITEM_FIELDSETS_TAIL = (
+    (
+        "Crawling Status",
+        {
+            "fields": (
+                "crawling_status",
+                "crawled_content",
+                "crawled_at",
+                "error_message",
+            ),
+        },
+    ),
+    (
+        "Translation Status",
+        {
+            "fields": ("translate_status", "translate_error_message"),
+        },
+    ),
+    (
+        "Metadata",
+        {"fields": ("guid", "pub_date", "created_at"), "classes": ("collapse",)},
+    ),
+)
 
 
 @admin.register(RSSItem)
@@ -197,100 +335,28 @@ class RSSItemAdmin(admin.ModelAdmin):
         "created_at",
         "author",
     )
-    search_fields = ("title", "description", "author", "link", "license_type")
+    # description is left out: a LIKE over the full text column scans every row
+    search_fields = ("^title", "=author", "link", "=license_type")
     readonly_fields = ("created_at", "crawled_at", "confidence_score")
     date_hierarchy = "pub_date"
+    list_select_related = ("feed",)
+    show_full_result_count = False
 
     def get_fieldsets(self, request, obj=None):
         """Dynamic fieldsets based on content language and analysis status."""
-        base_fieldsets = [
-            (
-                "⚠️ 법적 고지",
-                {
-                    "fields": (),
-                    "description": (
-                        "<div style='background-color: #fff3cd; border: 1px solid #ffeaa7; "
-                        "padding: 15px; border-radius: 5px; margin-bottom: 20px;'>"
-                        "<strong>🚨 중요 안내:</strong><br>"
-                        "본 AI 분석 결과는 참고용이며 <strong>법적 효력이 없습니다</strong>. "
-                        "콘텐츠의 최종 사용 결정은 반드시 관리자의 책임하에 이루어져야 하며, "
-                        "필요시 법무 전문가의 자문을 받으시기 바랍니다.<br>"
-                        "<em>AI analysis results are for reference only and have no legal validity. "
-                        "Final content usage decisions must be made under administrator responsibility.</em>"
-                        "</div>"
-                    ),
-                },
-            ),
-            (
-                "Item Information",
-                {"fields": ("feed", "title", "link", "author", "category", "source_item")},
-            ),
-            ("Content", {"fields": ("description",), "classes": ("collapse",)}),
-        ]
-        
-        # Language and processing fields
         if obj and obj.language:
-            if obj.language == 'ko':
-                # Korean content - show summary
-                base_fieldsets.append((
-                    "🇰🇷 Korean Content Processing",
-                    {
-                        "fields": ("language", "summary"),
-                        "description": "한국어 콘텐츠는 AI 요약이 생성됩니다.",
-                    },
-                ))
+            if obj.language == "ko":
+                language_fieldset = _RSSITEM_KOREAN_FIELDSET
             else:
-                # Foreign content - show copyright analysis
-                base_fieldsets.append((
-                    "🌐 Copyright Analysis (Foreign Content)",
-                    {
-                        "fields": (
-                            "language",
-                            "license_type",
-                            "is_translation_allowed",
-                            "attribution_required",
-                            "confidence_score",
-                            "reasoning",
-                        ),
-                        "description": "외국어 콘텐츠의 저작권 분석 결과입니다.",
-                    },
-                ))
+                language_fieldset = _RSSITEM_COPYRIGHT_FIELDSET
         else:
-            # No language detected yet
-            base_fieldsets.append((
-                "🔍 Content Analysis",
-                {
-                    "fields": ("language",),
-                    "description": "콘텐츠 분석이 완료되면 언어별 처리 결과가 표시됩니다.",
-                },
-            ))
-        
-        # Standard status fields
-        base_fieldsets.extend([
-            (
-                "Crawling Status",
-                {
-                    "fields": (
-                        "crawling_status",
-                        "crawled_content",
-                        "crawled_at",
-                        "error_message",
-                    ),
-                },
-            ),
-            (
-                "Translation Status",
-                {
-                    "fields": ("translate_status", "translate_error_message"),
-                },
-            ),
-            (
-                "Metadata",
-                {"fields": ("guid", "pub_date", "created_at"), "classes": ("collapse",)},
-            ),
-        ])
-        
-        return base_fieldsets
+            language_fieldset = _RSSITEM_ANALYSIS_PENDING_FIELDSET
+
+        return [
+            *_RSSITEM_FIELDSETS_HEAD,
+            language_fieldset,
+            *_RSSITEM_FIELDSETS_TAIL,
+        ]
 
     @admin.display(description="Translation Allowed", boolean=True)
     def translation_allowed_display(self, obj):
@@ -309,7 +375,11 @@ class RSSItemAdmin(admin.ModelAdmin):
         return "📰 Regular Feed"
 
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related("feed")
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("feed", "source_item", "source_item__feed")
+        )
 
 
 @admin.register(LLMService)
@@ -342,6 +412,7 @@ class LLMUsageAdmin(admin.ModelAdmin):
     search_fields = ("model_name",)
     readonly_fields = ("date", "created_at")
     date_hierarchy = "date"
+    show_full_result_count = False
 
     fieldsets = (
         (
@@ -351,9 +422,19 @@ class LLMUsageAdmin(admin.ModelAdmin):
         ("Metadata", {"fields": ("created_at",), "classes": ("collapse",)}),
     )
 
-    @admin.display(description="Total Tokens")
-    def total_tokens(self, obj):
-        return obj.input_tokens + obj.output_tokens
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(LLMUsageDaily)
+class LLMUsageDailyAdmin(admin.ModelAdmin):
+    list_display = ("day", "model_name", "total_requests", "total_tokens")
+    list_filter = ("day", "model_name")
+    search_fields = ("model_name",)
+    date_hierarchy = "day"
 
     def has_add_permission(self, request):
         return False
@@ -362,6 +443,12 @@ class LLMUsageAdmin(admin.ModelAdmin):
         return False
 
 
+@cache
+def _translated_content_detail_url_parts():
+    """Split the detail URL around its id so each row doesn't call reverse()."""
+    return tuple(reverse("curation:translated_content_detail", args=[0]).rsplit("0", 1))
+
+
 @admin.register(TranslatedContent)
 class TranslatedContentAdmin(admin.ModelAdmin):
     list_display = (
@@ -378,6 +465,8 @@ class TranslatedContentAdmin(admin.ModelAdmin):
     search_fields = ("title", "slug", "description", "author", "source_url")
     readonly_fields = ("created_at", "updated_at")
     date_hierarchy = "written_date"
+    list_select_related = ("source_rss_item", "source_rss_item__feed")
+    filter_horizontal = ("tags",)
 
     fieldsets = (
         (
@@ -407,8 +496,10 @@ class TranslatedContentAdmin(admin.ModelAdmin):
     @admin.display(description="View")
     def view_link(self, obj):
         if obj.pk:
-            url = reverse("curation:translated_content_detail", args=[obj.pk])
-            return format_html('<a href="{}" target="_blank">보기</a>', url)
+            prefix, suffix = _translated_content_detail_url_parts()
+            return format_html(
+                '<a href="{}{}{}" target="_blank">보기</a>', prefix, obj.pk, suffix
+            )
         return "-"
 
     def get_queryset(self, request):
@@ -416,4 +507,5 @@ class TranslatedContentAdmin(admin.ModelAdmin):
             super()
             .get_queryset(request)
             .select_related("source_rss_item", "source_rss_item__feed")
+            .prefetch_related("tags")
         )
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0015_rssfeed_is_newsletter_rssitem_attribution_required_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='llmusage',
+            index=models.Index(fields=['date', 'model_name'], name='curation_ll_date_762711_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rssitem',
+            index=models.Index(fields=['pub_date'], name='curation_rs_pub_dat_558f5e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rssitem',
+            index=models.Index(fields=['crawling_status', 'pub_date'], name='curation_rs_crawlin_ccad3d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rssitem',
+            index=models.Index(fields=['language', 'translate_status'], name='curation_rs_languag_bb4bf9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='translatedcontent',
+            index=models.Index(fields=['written_date'], name='curation_tr_written_2e0298_idx'),
+        ),
+    ]
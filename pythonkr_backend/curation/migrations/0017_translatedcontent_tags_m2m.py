@@ -0,0 +1,80 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:45
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def _unique_slug(name, taken):
+    # Same rule as Tag._unique_slug: slug, slug-2, slug-3, ... within 100 characters
+    base = slugify(name, allow_unicode=True)[:100] or "tag"
+    slug = base
+    suffix = 1
+    while slug in taken:
+        suffix += 1
+        slug = f"{base[: 100 - len(str(suffix)) - 1]}-{suffix}"
+    return slug
+
+
+def copy_json_tags_to_m2m(apps, schema_editor):
+    Tag = apps.get_model("curation", "Tag")
+    TranslatedContent = apps.get_model("curation", "TranslatedContent")
+
+    taken = set(Tag.objects.values_list("slug", flat=True))
+    for content in TranslatedContent.objects.all():
+        if not content.legacy_tags:
+            continue
+        tags = []
+        for name in content.legacy_tags:
+            name = str(name).strip()[:100]
+            if not name:
+                continue
+            tag = Tag.objects.filter(name=name).first()
+            if tag is None:
+                tag = Tag.objects.create(name=name, slug=_unique_slug(name, taken))
+                taken.add(tag.slug)
+            tags.append(tag)
+        content.tags.set(tags)
+
+
+def copy_m2m_tags_to_json(apps, schema_editor):
+    TranslatedContent = apps.get_model("curation", "TranslatedContent")
+
+    for content in TranslatedContent.objects.prefetch_related("tags"):
+        content.legacy_tags = [tag.name for tag in content.tags.all()]
+        content.save(update_fields=["legacy_tags"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0016_llmusage_curation_ll_date_762711_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='태그 이름', max_length=100, unique=True)),
+                ('slug', models.SlugField(allow_unicode=True, blank=True, help_text='태그 slug', max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RenameField(
+            model_name='translatedcontent',
+            old_name='tags',
+            new_name='legacy_tags',
+        ),
+        migrations.AddField(
+            model_name='translatedcontent',
+            name='tags',
+            field=models.ManyToManyField(blank=True, help_text='태그', related_name='translated_contents', to='curation.tag'),
+        ),
+        migrations.RunPython(copy_json_tags_to_m2m, copy_m2m_tags_to_json),
+        migrations.RemoveField(
+            model_name='translatedcontent',
+            name='legacy_tags',
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:49
+
+from django.db import migrations, models
+
+
+def flag_translation_errors(apps, schema_editor):
+    # Errors used to be stored as prose in summary_ko
+    Article = apps.get_model("curation", "Article")
+    Article.objects.filter(summary_ko__startswith="Translation Error").update(
+        summary_ko_error=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0017_translatedcontent_tags_m2m'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='summary_ko_error',
+            field=models.BooleanField(db_index=True, default=False, help_text='Whether the last translation of the summary failed.'),
+        ),
+        migrations.RunPython(flag_translation_errors, migrations.RunPython.noop),
+    ]
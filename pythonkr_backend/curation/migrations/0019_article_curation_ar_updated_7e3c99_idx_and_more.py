@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0018_article_summary_ko_error'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-updated_at'], name='curation_ar_updated_7e3c99_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-created_at'], name='curation_ar_created_3de09f_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0019_article_curation_ar_updated_7e3c99_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='llmusage',
+            index=models.Index(fields=['model_name', '-date'], name='curation_ll_model_n_9f4fd4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rssitem',
+            index=models.Index(fields=['feed', '-pub_date'], name='curation_rs_feed_id_00c3d9_idx'),
+        ),
+        migrations.AlterField(
+            model_name='rssitem',
+            name='feed',
+            field=models.ForeignKey(db_index=False, help_text='이 아이템이 속한 RSS 피드', on_delete=django.db.models.deletion.CASCADE, related_name='items', to='curation.rssfeed'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0020_alter_rssitem_feed_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rssfeed',
+            name='etag',
+            field=models.CharField(blank=True, help_text='마지막 응답의 ETag (조건부 요청용)', max_length=200),
+        ),
+        migrations.AddField(
+            model_name='rssfeed',
+            name='last_modified',
+            field=models.CharField(blank=True, help_text='마지막 응답의 Last-Modified (조건부 요청용)', max_length=200),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:29
+
+from collections import defaultdict
+
+import pytz
+from django.db import migrations, models
+
+
+def backfill_daily_usage(apps, schema_editor):
+    LLMUsage = apps.get_model("curation", "LLMUsage")
+    LLMUsageDaily = apps.get_model("curation", "LLMUsageDaily")
+    pacific_tz = pytz.timezone("US/Pacific")
+
+    totals = defaultdict(lambda: [0, 0])
+    for model_name, date, total_tokens in LLMUsage.objects.values_list(
+        "model_name", "date", "total_tokens"
+    ).iterator():
+        tz = pacific_tz if model_name.startswith("google-gla:") else pytz.UTC
+        day_totals = totals[(model_name, date.astimezone(tz).date())]
+        day_totals[0] += total_tokens
+        day_totals[1] += 1
+
+    LLMUsageDaily.objects.bulk_create(
+        [
+            LLMUsageDaily(
+                model_name=model_name,
+                day=day,
+                total_tokens=total_tokens,
+                total_requests=total_requests,
+            )
+            for (model_name, day), (total_tokens, total_requests) in totals.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0021_rssfeed_etag_last_modified'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMUsageDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(help_text='사용된 모델명', max_length=100)),
+                ('day', models.DateField(help_text='할당량 기준 날짜 (Gemini는 태평양 시간, 그 외 UTC)')),
+                ('total_tokens', models.PositiveBigIntegerField(default=0, help_text='총 토큰 수')),
+                ('total_requests', models.PositiveIntegerField(default=0, help_text='총 요청 수')),
+            ],
+            options={
+                'verbose_name': 'LLM Usage (Daily)',
+                'verbose_name_plural': 'LLM Usage (Daily)',
+                'ordering': ['-day', 'model_name'],
+                'unique_together': {('model_name', 'day')},
+            },
+        ),
+        migrations.RunPython(backfill_daily_usage, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0022_llmusagedaily'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rssfeed',
+            name='max_items',
+            field=models.PositiveIntegerField(default=100, help_text='한 번의 크롤링에서 처리할 최대 항목 수 (피드 앞쪽부터)'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0023_rssfeed_max_items'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='rssitem',
+            name='crawling_status',
+            field=models.CharField(choices=[('pending', '크롤링 대기'), ('in_progress', '크롤링 중'), ('completed', '크롤링 완료'), ('failed', '크롤링 실패')], default='pending', help_text='크롤링 상태', max_length=20),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0024_rssitem_crawling_in_progress'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rssitem',
+            index=models.Index(condition=models.Q(('crawling_status', 'pending')), fields=['-pub_date', '-created_at'], name='rssitem_crawl_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rssitem',
+            index=models.Index(condition=models.Q(('crawling_status', 'completed'), ('source_item__isnull', True)), fields=['-crawled_at', '-created_at'], name='rssitem_source_done_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rssitem',
+            index=models.Index(condition=models.Q(('crawling_status', 'completed'), ('translate_status', 'pending')), fields=['-crawled_at', '-created_at'], name='rssitem_translate_pending_idx'),
+        ),
+    ]
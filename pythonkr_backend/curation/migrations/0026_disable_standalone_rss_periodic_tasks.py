@@ -0,0 +1,47 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:50
+
+from django.db import migrations
+from django.utils import timezone
+
+# run_rss_pipeline 한 태스크가 group으로 대신 실행하는 개별 주기 태스크
+RSS_PIPELINE_STEP_TASKS = [
+    "curation.tasks.crawl_rss",
+    "curation.tasks.crawl_rss_item_content",
+    "curation.tasks.process_newsletter_items",
+    "curation.tasks.analyze_content_copyright",
+    "curation.tasks.translate_pending_rss_item",
+]
+
+
+def _set_step_tasks_enabled(apps, enabled):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTasks = apps.get_model("django_celery_beat", "PeriodicTasks")
+
+    updated = PeriodicTask.objects.filter(task__in=RSS_PIPELINE_STEP_TASKS).update(
+        enabled=enabled
+    )
+    if updated:
+        # DatabaseScheduler가 변경을 감지하도록 갱신 시각을 올립니다
+        PeriodicTasks.objects.update_or_create(
+            ident=1, defaults={"last_update": timezone.now()}
+        )
+
+
+def disable_step_tasks(apps, schema_editor):
+    _set_step_tasks_enabled(apps, False)
+
+
+def enable_step_tasks(apps, schema_editor):
+    _set_step_tasks_enabled(apps, True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0025_rssitem_picker_indexes'),
+        ('django_celery_beat', '0019_alter_periodictasks_options'),
+    ]
+
+    operations = [
+        migrations.RunPython(disable_step_tasks, enable_step_tasks),
+    ]
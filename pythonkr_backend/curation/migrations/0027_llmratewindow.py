@@ -0,0 +1,26 @@
+# Generated by Django 5.2.1 on 2026-10-16 00:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0026_disable_standalone_rss_periodic_tasks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMRateWindow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('window', models.PositiveBigIntegerField(help_text='Unix 시간 기준 분 (초 // 60)', unique=True)),
+                ('requests', models.PositiveIntegerField(default=0, help_text='시작된 요청 수')),
+            ],
+            options={
+                'verbose_name': 'LLM Rate Window',
+                'verbose_name_plural': 'LLM Rate Windows',
+                'ordering': ['-window'],
+            },
+        ),
+    ]
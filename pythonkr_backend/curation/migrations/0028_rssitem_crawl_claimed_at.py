@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-16 00:24
+
+from django.db import migrations, models
+
+
+def release_in_progress_items(apps, schema_editor):
+    # 가져간 시간이 기록되기 전에 in_progress로 남은 아이템은 다시 크롤링합니다
+    RSSItem = apps.get_model("curation", "RSSItem")
+    RSSItem.objects.filter(crawling_status="in_progress").update(
+        crawling_status="pending"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curation', '0027_llmratewindow'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rssitem',
+            name='crawl_claimed_at',
+            field=models.DateTimeField(blank=True, help_text='크롤링 워커가 아이템을 가져간 시간', null=True),
+        ),
+        migrations.RunPython(release_in_progress_items, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,52 @@
-from django.db import models
+import asyncio
+import json
+import logging
+from functools import cache
+
+import httpx
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.cache import caches
+from django.db import IntegrityError, models, transaction
 from django.utils.text import slugify
-from .utils import get_summary_from_url, translate_to_korean, categorize_summary
-import readtime
+from .utils import (
+    LLMRateLimitError,
+    translate_to_korean,
+    categorize_summary,
+    aget_summary_from_url,
+    atranslate_to_korean,
+    acategorize_summary,
+)
+import math
+import time
 from datetime import timedelta, datetime
 from django.utils import timezone
 import pytz
 
 
+logger = logging.getLogger(__name__)
+
+# Average reading speed used for Article.reading_time_minutes
+WORDS_PER_MINUTE = 265
+
+# Categories the LLM may assign to an Article
+DEFINED_CATEGORY_NAMES = (
+    "Web Development",
+    "MLOps",
+    "Large Language Models",
+    "Data Science",
+    "AI General",
+    "Software Engineering",
+    "Other",
+)
+
+# Seconds LLMService caches the models still within their daily quota
+LLM_QUOTA_CACHE_TIMEOUT = 60
+
+# Picking a category only needs the start of the summary, so the categorizer
+# gets a truncated copy. Translation always gets the full text.
+CATEGORIZE_SUMMARY_MAX_CHARS = 2000
+
+
 def rss_item_upload_path(instance, filename):
     """Generate upload path for RSS item crawled content"""
     now = datetime.now()
@@ -24,13 +64,7 @@ class Category(models.Model):
         unique=True,
         help_text="A URL-friendly slug for the category.",
         blank=True,
-    )  # Optional but good practice
-
-    def save(self, *args, **kwargs):
-        # Auto-generate slug if blank (optional)
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
+    )  # Optional but good practice; filled in by curation.signals if blank
 
     def __str__(self):
         return self.name
@@ -40,6 +74,30 @@ class Category(models.Model):
         ordering = ["name"]  # Optional: Order categories alphabetically
 
 
+class ArticleQuerySet(models.QuerySet):
+    def for_listing(self):
+        """
+        Loads only the columns article lists show, leaving out the large
+        summary and summary_ko text fields.
+
+        When combining with a Prefetch(queryset=...) that uses only(), keep the
+        foreign key column in that queryset too, or Django fetches it per row.
+        """
+        return self.only("id", "url", "title", "reading_time_minutes")
+
+
+class ArticleManager(models.Manager.from_queryset(ArticleQuerySet)):
+    """
+    Prefetches categories, which nearly every article listing shows.
+
+    categories is a many-to-many field, so it is prefetched in one extra query;
+    use select_related() instead for foreign keys and one-to-one fields.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().prefetch_related("categories")
+
+
 class Article(models.Model):
     url = models.URLField(
         unique=True, max_length=2048, help_text="The unique URL of the article."
@@ -55,6 +113,11 @@ class Article(models.Model):
     summary_ko = models.TextField(
         blank=True, help_text="Korean translation of the summary (via OpenAI)."
     )
+    summary_ko_error = models.BooleanField(
+        default=False,
+        db_index=True,
+        help_text="Whether the last translation of the summary failed.",
+    )
     reading_time_minutes = models.PositiveIntegerField(
         null=True,
         blank=True,
@@ -69,6 +132,8 @@ class Article(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ArticleManager()
+
     def __str__(self):
         return self.title or self.url
 
@@ -77,32 +142,43 @@ class Article(models.Model):
         Calculates reading time based on the provided text.
         """
         if full_text:
-            try:
-                result = readtime.of_text(full_text)
-                self.reading_time_minutes = result.minutes
-            except Exception as e:
-                print(f"Error calculating reading time for article {self.id}: {e}")
-                self.reading_time_minutes = None  # Set to None on calculation error
+            word_count = len(full_text.split())
+            self.reading_time_minutes = max(1, math.ceil(word_count / WORDS_PER_MINUTE))
         else:
             self.reading_time_minutes = None
 
-    def fetch_and_summarize(self) -> str:
+    def fetch_and_summarize(self) -> tuple[bool, str]:
         """
         Fetches content, calculates reading time on full text, generates summary,
         translates summary, and saves all results.
+
+        Runs afetch_and_summarize, so translation and categorization are
+        requested concurrently instead of one after the other. Returns
+        (succeeded, status message); succeeded is False if any step failed.
+        """
+        try:
+            return async_to_sync(self.afetch_and_summarize)()
+        except (httpx.TransportError, LLMRateLimitError) as e:
+            logger.warning("Transient error processing article %s: %s", self.id, e)
+            return False, f"Unexpected error processing article: {str(e)}"
+
+    async def afetch_and_summarize(self) -> tuple[bool, str]:
+        """
+        Async version of fetch_and_summarize. Translation and categorization
+        both depend only on the summary, so the two LLM calls run concurrently.
         """
         if not self.url:
-            return "Error: No URL provided."
+            return False, "Error: No URL provided."
 
         try:
-            summary_text = get_summary_from_url(self.url)
+            summary_text = await aget_summary_from_url(self.url)
 
-            self.calculate_reading_time(summary_text)  # Call updated method
+            self.calculate_reading_time(summary_text)
 
             if not summary_text:
                 self.summary = ""
                 self.summary_ko = ""
-                self.save(
+                await self.asave(
                     update_fields=[
                         "title",
                         "summary",
@@ -111,59 +187,109 @@ class Article(models.Model):
                         "updated_at",
                     ]
                 )
-                return "Error extracting summary. Other details saved."
-
-            self.summary = summary_text  # Set summary
-
-            categorization_status = "Categorization skipped (no summary)."
-            if self.summary:  # Only categorize if summary was successful
-                categorization_status = (
-                    self.assign_categories()
-                )  # Call the revised method
-                print(
-                    f"Categorization status for article {self.id}: {categorization_status}"
+                return False, "Error extracting summary. Other details saved."
+
+            self.summary = summary_text
+
+            categories_by_name = await sync_to_async(
+                self._ensure_defined_categories
+            )()
+            translated_text, category_response = await asyncio.gather(
+                atranslate_to_korean(self.summary),
+                acategorize_summary(
+                    self.summary[:CATEGORIZE_SUMMARY_MAX_CHARS],
+                    list(categories_by_name),
+                ),
+                return_exceptions=True,
+            )
+            for result in (translated_text, category_response):
+                if isinstance(result, LLMRateLimitError):
+                    raise result
+
+            translation_failed = isinstance(translated_text, Exception)
+            if translation_failed:
+                logger.warning(
+                    "Error translating article %s: %s", self.id, translated_text
                 )
+                self.summary_ko = self._translation_error_message(translated_text)
+                self.summary_ko_error = True
+            else:
+                self.summary_ko = translated_text.strip() if translated_text else ""
+                self.summary_ko_error = False
+
+            categorization_status = await sync_to_async(self._save_summary_results)(
+                category_response, categories_by_name
+            )
+            logger.info(
+                "Categorization status for article %s: %s",
+                self.id,
+                categorization_status,
+            )
 
-            translation_status = self.translate_summary_to_korean()  # Call translation
-            print(f"Translation status for article {self.id}: {translation_status}")
-            translation_failed = "Error" in translation_status
+            succeeded = not translation_failed and not isinstance(
+                category_response, Exception
+            )
+            return succeeded, self._summary_status_message(
+                translation_failed, categorization_status
+            )
 
+        except (httpx.TransportError, LLMRateLimitError):
+            # Network failures and rate limits are transient; let the
+            # process_article task retry
+            raise
+        except ImportError as e:
+            return False, f"Error with required libraries: {str(e)}"
+        except Exception as e:
+            logger.exception(
+                "Unexpected error during fetch/summarize/translate for %s", self.id
+            )
+            return False, f"Unexpected error processing article: {str(e)}"
+
+    def _save_summary_results(self, category_response, categories_by_name):
+        """
+        Saves the generated fields and the categories in one transaction.
+        Returns the categorization status message.
+        """
+        with transaction.atomic():
             self.save(
                 update_fields=[
                     "title",
                     "summary",
                     "summary_ko",
+                    "summary_ko_error",
                     "reading_time_minutes",
                     "updated_at",
                 ]
             )
-
-            translation_failed = (
-                "Error" in translation_status
-            )  # Re-evaluate this variable if needed
-
-            final_message = "Fetch, Read Time, Summary completed."
-            final_message += (
-                " Translation failed."
-                if translation_failed
-                else " Translation completed."
-            )
-            final_message += (
-                f" {categorization_status}"  # Include categorization status message
-            )
-            return final_message
-
-        except ImportError as e:
-            return f"Error with required libraries: {str(e)}"
-        except Exception as e:
-            print(
-                f"Unexpected error during fetch/summarize/translate for {self.id}: {e}"
+            if isinstance(category_response, Exception):
+                logger.warning(
+                    "Error categorizing article %s: %s", self.id, category_response
+                )
+                return f"Error during categorization: {str(category_response)[:150]}"
+            return self._set_categories_from_response(
+                category_response, categories_by_name
             )
-            return f"Unexpected error processing article: {str(e)}"
 
-    def translate_summary_to_korean(self):
+    @staticmethod
+    def _translation_error_message(error):
+        """Kept in summary_ko so the admin can show why the translation failed."""
+        return f"Translation Error: {str(error)[:150]}"
+
+    @staticmethod
+    def _summary_status_message(translation_failed, categorization_status):
+        final_message = "Fetch, Read Time, Summary completed."
+        final_message += (
+            " Translation failed." if translation_failed else " Translation completed."
+        )
+        final_message += (
+            f" {categorization_status}"  # Include categorization status message
+        )
+        return final_message
+
+    def translate_summary_to_korean(self, commit=True):
         """
         Translates the summary to Korean using the OpenAI API via Langchain.
+        With commit=False the fields are only set on the instance, not saved.
         """
         if not self.summary:
             self.summary_ko = ""
@@ -173,15 +299,28 @@ class Article(models.Model):
             translated_text = translate_to_korean(self.summary)
 
             self.summary_ko = translated_text.strip() if translated_text else ""
-            self.save(update_fields=["summary_ko", "updated_at"])
+            self.summary_ko_error = False
+            if commit:
+                self._save_translation()
             return "Summary translated successfully using OpenAI."
 
         except Exception as e:
-            print(f"Error translating article {self.id} using OpenAI: {e}")
-            self.summary_ko = ""  # Clear on error
-            self.save(update_fields=["summary_ko", "updated_at"])
+            logger.warning("Error translating article %s: %s", self.id, e)
+            self.summary_ko = self._translation_error_message(e)
+            self.summary_ko_error = True
+            if commit:
+                self._save_translation()
             return f"Error during OpenAI translation: {str(e)[:150]}"
 
+    def _save_translation(self):
+        """Writes the translation fields with a single UPDATE, skipping save()."""
+        self.updated_at = timezone.now()
+        type(self).objects.filter(pk=self.pk).update(
+            summary_ko=self.summary_ko,
+            summary_ko_error=self.summary_ko_error,
+            updated_at=self.updated_at,
+        )
+
     def assign_categories(self):
         """Assigns multiple categories based on the summary using an LLM."""
         if not self.summary:
@@ -189,62 +328,190 @@ class Article(models.Model):
             return "Error: No summary available to categorize."
 
         try:
-            defined_category_names = [
-                "Web Development",
-                "MLOps",
-                "Large Language Models",
-                "Data Science",
-                "AI General",
-                "Software Engineering",
-                "Other",
-            ]
-            category_objects = []
-            created_names = []
-            for name in defined_category_names:
-                cat, created = Category.objects.get_or_create(name=name)
-                category_objects.append(cat)
-                if created:
-                    created_names.append(name)
-                    cat.save()
-
-            if created_names:
-                print(f"Ensured categories exist. Created new: {created_names}")
-
-            response_text = (
-                categorize_summary(self.summary, defined_category_names)
-                .replace("'", "")
-                .replace('"', "")
+            categories_by_name = self._ensure_defined_categories()
+            response_text = categorize_summary(
+                self.summary[:CATEGORIZE_SUMMARY_MAX_CHARS], list(categories_by_name)
+            )
+            return self._set_categories_from_response(
+                response_text, categories_by_name
+            )
+
+        except Exception as e:
+            logger.warning("Error categorizing article %s: %s", self.id, e)
+            return f"Error during categorization: {str(e)[:150]}"
+
+    @staticmethod
+    @cache
+    def _ensure_defined_categories():
+        """
+        Creates any missing predefined categories and returns them as a
+        name -> Category dict, in the predefined order.
+
+        The result is cached per process; curation.signals clears it whenever
+        a Category is saved or deleted.
+        """
+        existing = {
+            c.name: c
+            for c in Category.objects.filter(name__in=DEFINED_CATEGORY_NAMES)
+        }
+        missing_categories = [
+            Category(name=name, slug=slugify(name))
+            for name in DEFINED_CATEGORY_NAMES
+            if name not in existing
+        ]
+        if missing_categories:
+            Category.objects.bulk_create(missing_categories, ignore_conflicts=True)
+            logger.info(
+                "Ensured categories exist. Created new: %s",
+                [c.name for c in missing_categories],
             )
+            # ignore_conflicts leaves primary keys unset, so read them back
+            existing = {
+                c.name: c
+                for c in Category.objects.filter(name__in=DEFINED_CATEGORY_NAMES)
+            }
+        return {name: existing[name] for name in DEFINED_CATEGORY_NAMES}
+
+    @staticmethod
+    def _parse_category_response(response_text, categories_by_name):
+        """
+        Returns the known categories named in the LLM response, in order.
+        The response is the JSON object produced by the utils.Result schema.
+        """
+        try:
             assigned_category_names = [
-                name.strip() for name in response_text.split(",") if name.strip()
+                str(name).strip() for name in json.loads(response_text)["categories"]
             ]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Unparseable category response %r: %s", response_text, e)
+            return []
+        valid_categories = [
+            categories_by_name[name]
+            for name in dict.fromkeys(assigned_category_names)
+            if name in categories_by_name
+        ]
+        logger.debug(
+            "LLM suggested: %s, Validated & Found: %s",
+            assigned_category_names,
+            [c.name for c in valid_categories],
+        )
+        return valid_categories
+
+    def _set_categories_from_response(self, response_text, categories_by_name):
+        """Replaces the article categories with those named in the LLM response."""
+        valid_categories = self._parse_category_response(
+            response_text, categories_by_name
+        )
+        valid_category_names = [c.name for c in valid_categories]
+
+        self.categories.set(valid_categories)
+        if valid_categories:
+            return f"Article categories set to: {', '.join(valid_category_names)}."
+
+        return "Warning: No valid categories assigned based on LLM response."
 
-            valid_categories = Category.objects.filter(
-                name__in=assigned_category_names
-            ).filter(name__in=defined_category_names)
-            valid_category_names = list(valid_categories.values_list("name", flat=True))
+    @classmethod
+    def bulk_ingest(cls, urls):
+        """
+        Creates, summarizes, translates and categorizes articles for the given
+        URLs in one batch. URLs that already have an article are skipped.
 
-            print(
-                f"LLM suggested: {assigned_category_names}, Validated & Found: {valid_category_names}"
+        The LLM calls for all articles run concurrently; the articles and their
+        category links are then written with one bulk INSERT each.
+        Returns the newly created articles.
+        """
+        existing_urls = set(
+            cls.objects.filter(url__in=urls).values_list("url", flat=True)
+        )
+        new_urls = [url for url in dict.fromkeys(urls) if url not in existing_urls]
+        if not new_urls:
+            return []
+
+        categories_by_name = cls._ensure_defined_categories()
+        results = async_to_sync(cls._agather_llm_results)(
+            new_urls, list(categories_by_name)
+        )
+
+        articles = []
+        category_links = {}
+        for url, (summary_text, translated_text, category_response) in zip(
+            new_urls, results
+        ):
+            article = cls(url=url)
+            if isinstance(summary_text, Exception) or not summary_text:
+                logger.warning("Error summarizing %s: %s", url, summary_text)
+                summary_text = ""
+            article.summary = summary_text
+            article.calculate_reading_time(summary_text)
+
+            if isinstance(translated_text, Exception):
+                logger.warning("Error translating %s: %s", url, translated_text)
+                article.summary_ko = cls._translation_error_message(translated_text)
+                article.summary_ko_error = True
+            elif translated_text:
+                article.summary_ko = translated_text.strip()
+
+            if isinstance(category_response, Exception):
+                logger.warning("Error categorizing %s: %s", url, category_response)
+            elif category_response:
+                category_links[url] = cls._parse_category_response(
+                    category_response, categories_by_name
+                )
+            articles.append(article)
+
+        Through = cls.categories.through
+        with transaction.atomic():
+            cls.objects.bulk_create(articles, ignore_conflicts=True)
+            # ignore_conflicts leaves primary keys unset, so read them back
+            id_by_url = dict(
+                cls.objects.filter(url__in=new_urls).values_list("url", "id")
+            )
+            Through.objects.bulk_create(
+                [
+                    Through(article_id=id_by_url[url], category_id=category.id)
+                    for url, categories in category_links.items()
+                    for category in categories
+                ],
+                ignore_conflicts=True,
             )
 
-            self.categories.clear()  # Remove old associations first
-            if valid_categories:
-                self.categories.add(
-                    *valid_categories
-                )  # Add the new set using the splat operator
-                return f"Article categories set to: {', '.join(valid_category_names)}."
-            elif "Other" in assigned_category_names:
-                other_cat = Category.objects.filter(name="Other").first()
-                if other_cat:
-                    self.categories.add(other_cat)
-                    return "Article category set to: Other."
+        return list(cls.objects.filter(id__in=id_by_url.values()))
 
-            return "Warning: No valid categories assigned based on LLM response."
+    @staticmethod
+    async def _agather_llm_results(urls, category_names):
+        """
+        Summarizes all URLs concurrently, then translates and categorizes all
+        summaries concurrently. Returns (summary, translation, categories)
+        per URL, with exceptions in place of failed results.
+        """
+        summaries = await asyncio.gather(
+            *(aget_summary_from_url(url) for url in urls), return_exceptions=True
+        )
+
+        async def translate_and_categorize(summary_text):
+            if isinstance(summary_text, Exception) or not summary_text:
+                return None, None
+            return await asyncio.gather(
+                atranslate_to_korean(summary_text),
+                acategorize_summary(
+                    summary_text[:CATEGORIZE_SUMMARY_MAX_CHARS], category_names
+                ),
+                return_exceptions=True,
+            )
 
-        except Exception as e:
-            print(f"Error categorizing article {self.id}: {e}")
-            return f"Error during categorization: {str(e)[:150]}"
+        llm_results = await asyncio.gather(
+            *(translate_and_categorize(summary) for summary in summaries)
+        )
+        return [
+            (summary, translated, categorized)
+            for summary, (translated, categorized) in zip(summaries, llm_results)
+        ]
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-updated_at"]),
+            models.Index(fields=["-created_at"]),
+        ]
 
 
 # LicenseType Enum for license choices
@@ -333,9 +600,20 @@ class RSSFeed(models.Model):
         default=False, 
         help_text="뉴스레터형 피드 여부 (개별 링크 추출이 필요한 경우)"
     )
+    max_items = models.PositiveIntegerField(
+        default=100, help_text="한 번의 크롤링에서 처리할 최대 항목 수 (피드 앞쪽부터)"
+    )
     last_fetched = models.DateTimeField(
         null=True, blank=True, help_text="마지막 크롤링 시간"
     )
+    etag = models.CharField(
+        max_length=200, blank=True, help_text="마지막 응답의 ETag (조건부 요청용)"
+    )
+    last_modified = models.CharField(
+        max_length=200,
+        blank=True,
+        help_text="마지막 응답의 Last-Modified (조건부 요청용)",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -350,6 +628,7 @@ class RSSFeed(models.Model):
 class RSSItem(models.Model):
     CRAWLING_STATUS_CHOICES = [
         ("pending", "크롤링 대기"),
+        ("in_progress", "크롤링 중"),
         ("completed", "크롤링 완료"),
         ("failed", "크롤링 실패"),
     ]
@@ -364,6 +643,8 @@ class RSSItem(models.Model):
         RSSFeed,
         on_delete=models.CASCADE,
         related_name="items",
+        # covered by the (feed, -pub_date) index in Meta
+        db_index=False,
         help_text="이 아이템이 속한 RSS 피드",
     )
     title = models.CharField(max_length=500, help_text="제목")
@@ -434,6 +715,9 @@ class RSSItem(models.Model):
     crawled_at = models.DateTimeField(
         null=True, blank=True, help_text="크롤링 완료 시간"
     )
+    crawl_claimed_at = models.DateTimeField(
+        null=True, blank=True, help_text="크롤링 워커가 아이템을 가져간 시간"
+    )
     error_message = models.TextField(blank=True, help_text="크롤링 실패 시 에러 메시지")
     translate_status = models.CharField(
         max_length=20,
@@ -453,6 +737,28 @@ class RSSItem(models.Model):
         verbose_name = "RSS Item"
         verbose_name_plural = "RSS Items"
         ordering = ["-pub_date", "-created_at"]
+        indexes = [
+            models.Index(fields=["pub_date"]),
+            models.Index(fields=["crawling_status", "pub_date"]),
+            models.Index(fields=["language", "translate_status"]),
+            models.Index(fields=["feed", "-pub_date"]),
+            # 주기 태스크가 다음 아이템을 고르는 쿼리용 부분 인덱스
+            models.Index(
+                fields=["-pub_date", "-created_at"],
+                condition=models.Q(crawling_status="pending"),
+                name="rssitem_crawl_pending_idx",
+            ),
+            models.Index(
+                fields=["-crawled_at", "-created_at"],
+                condition=models.Q(crawling_status="completed", source_item__isnull=True),
+                name="rssitem_source_done_idx",
+            ),
+            models.Index(
+                fields=["-crawled_at", "-created_at"],
+                condition=models.Q(crawling_status="completed", translate_status="pending"),
+                name="rssitem_translate_pending_idx",
+            ),
+        ]
 
 
 class CrawlURL(models.Model):
@@ -571,7 +877,7 @@ class LLMService(models.Model):
         active_services = cls.objects.filter(is_active=True).order_by("priority")
 
         for service in active_services:
-            available_models = cls._get_available_models_for_provider(
+            available_models = cls._get_cached_available_models(
                 service.provider, MODEL_CONFIGS
             )
             if available_models:
@@ -579,6 +885,40 @@ class LLMService(models.Model):
 
         return None, None
 
+    @staticmethod
+    def _quota_cache_key(provider):
+        # Bucketed by minute so an entry never outlives its window
+        return f"llm_quota:{provider}:{int(time.time()) // 60}"
+
+    @classmethod
+    def _get_cached_available_models(cls, provider, model_configs):
+        """
+        _get_available_models_for_provider, cached for a minute in the "llm"
+        cache. New LLMUsage rows clear the cache (see curation.signals).
+        """
+        return caches["llm"].get_or_set(
+            cls._quota_cache_key(provider),
+            lambda: cls._get_available_models_for_provider(provider, model_configs),
+            LLM_QUOTA_CACHE_TIMEOUT,
+        )
+
+    @classmethod
+    def clear_quota_cache(cls):
+        """Drops the cached available models of every provider."""
+        caches["llm"].delete_many(
+            [cls._quota_cache_key(provider) for provider, _ in cls.LLM_PROVIDER_CHOICES]
+        )
+
+    @staticmethod
+    def _usage_by_model(model_keys, day):
+        """Reads the day's token and request totals per model, in one query."""
+        return {
+            row["model_name"]: row
+            for row in LLMUsageDaily.objects.filter(
+                model_name__in=model_keys, day=day
+            ).values("model_name", "total_tokens", "total_requests")
+        }
+
     @classmethod
     def _get_available_models_for_provider(cls, provider, model_configs):
         """Get available models for a specific provider based on usage limits."""
@@ -586,27 +926,22 @@ class LLMService(models.Model):
 
         if provider == "gemini":
             # Check Google Gemini models with Pacific Time reset
-            pacific_tz = pytz.timezone("US/Pacific")
-            now_pacific = timezone.now().astimezone(pacific_tz)
-            start_of_day_pacific = now_pacific.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            start_of_day_utc = start_of_day_pacific.astimezone(pytz.UTC)
+            today_pacific = timezone.now().astimezone(pytz.timezone("US/Pacific"))
 
-            for model_key, config in model_configs.items():
-                if not model_key.startswith("google-gla:"):
-                    continue
+            model_keys = [
+                model_key
+                for model_key in model_configs
+                if model_key.startswith("google-gla:")
+            ]
+            usage_by_model = cls._usage_by_model(model_keys, today_pacific.date())
 
+            for model_key in model_keys:
+                config = model_configs[model_key]
                 model_name = model_key.split(":", 1)[1]
-                today_usage = LLMUsage.objects.filter(
-                    model_name=model_key, date__gte=start_of_day_utc
-                ).aggregate(
-                    total_tokens=models.Sum(models.F("total_tokens")),
-                    total_requests=models.Count("id"),
-                )
+                today_usage = usage_by_model.get(model_key, {})
 
-                total_tokens = today_usage["total_tokens"] or 0
-                total_requests = today_usage["total_requests"] or 0
+                total_tokens = today_usage.get("total_tokens") or 0
+                total_requests = today_usage.get("total_requests") or 0
 
                 # Check daily limits
                 if (
@@ -624,25 +959,29 @@ class LLMService(models.Model):
 
         elif provider == "openai":
             # Check OpenAI models with UTC midnight reset
-            today_start = timezone.now().replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
+            today_utc = timezone.now().astimezone(pytz.UTC)
 
             # Handle combined quota models (gpt-4.1 and gpt-4.5)
             combined_models = [
                 "openai:gpt-4.1-2025-04-14",
                 "openai:gpt-4.5-preview-2025-02-27",
             ]
-            combined_usage = LLMUsage.objects.filter(
-                model_name__in=combined_models, date__gte=today_start
-            ).aggregate(total_tokens=models.Sum(models.F("total_tokens")))
-            combined_tokens = combined_usage["total_tokens"] or 0
+            model_keys = [
+                model_key
+                for model_key in model_configs
+                if model_key.startswith("openai:")
+            ]
+            usage_by_model = cls._usage_by_model(
+                set(model_keys) | set(combined_models), today_utc.date()
+            )
+            combined_tokens = sum(
+                usage_by_model.get(model_key, {}).get("total_tokens") or 0
+                for model_key in combined_models
+            )
 
             # Check individual models
-            for model_key, config in model_configs.items():
-                if not model_key.startswith("openai:"):
-                    continue
-
+            for model_key in model_keys:
+                config = model_configs[model_key]
                 model_name = model_key.split(":", 1)[1]
 
                 if model_key in combined_models:
@@ -651,10 +990,9 @@ class LLMService(models.Model):
                         available_models.append(model_name)
                 else:
                     # Check individual quota (gpt-4.1-mini)
-                    today_usage = LLMUsage.objects.filter(
-                        model_name=model_key, date__gte=today_start
-                    ).aggregate(total_tokens=models.Sum(models.F("total_tokens")))
-                    total_tokens = today_usage["total_tokens"] or 0
+                    total_tokens = (
+                        usage_by_model.get(model_key, {}).get("total_tokens") or 0
+                    )
 
                     if total_tokens < config["daily_tokens"]:
                         available_models.append(model_name)
@@ -689,6 +1027,103 @@ class LLMUsage(models.Model):
         verbose_name = "LLM Usage"
         verbose_name_plural = "LLM Usage"
         ordering = ["-date", "-created_at"]
+        indexes = [
+            models.Index(fields=["date", "model_name"]),
+            # per-model usage history, newest first
+            models.Index(fields=["model_name", "-date"]),
+        ]
+
+
+class LLMUsageDaily(models.Model):
+    """
+    Per-model daily totals of LLMUsage, so quota checks read one row per
+    model instead of summing every usage row. Kept up to date by
+    curation.signals whenever an LLMUsage row is created.
+    """
+
+    model_name = models.CharField(max_length=100, help_text="사용된 모델명")
+    day = models.DateField(help_text="할당량 기준 날짜 (Gemini는 태평양 시간, 그 외 UTC)")
+    total_tokens = models.PositiveBigIntegerField(default=0, help_text="총 토큰 수")
+    total_requests = models.PositiveIntegerField(default=0, help_text="총 요청 수")
+
+    def __str__(self):
+        return f"{self.model_name} - {self.day} ({self.total_requests} requests)"
+
+    @staticmethod
+    def quota_day(model_name, moment):
+        """The day a usage counts against: Pacific time for Gemini, UTC otherwise."""
+        if model_name.startswith("google-gla:"):
+            return moment.astimezone(pytz.timezone("US/Pacific")).date()
+        return moment.astimezone(pytz.UTC).date()
+
+    @classmethod
+    def record(cls, usage):
+        """Adds one LLMUsage row to its day's totals with an atomic increment."""
+        day = cls.quota_day(usage.model_name, usage.date)
+        increment = {
+            "total_tokens": models.F("total_tokens") + usage.total_tokens,
+            "total_requests": models.F("total_requests") + 1,
+        }
+        rows = cls.objects.filter(model_name=usage.model_name, day=day)
+        if rows.update(**increment):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    model_name=usage.model_name,
+                    day=day,
+                    total_tokens=usage.total_tokens,
+                    total_requests=1,
+                )
+        except IntegrityError:
+            # Another process created the row first
+            rows.update(**increment)
+
+    class Meta:
+        verbose_name = "LLM Usage (Daily)"
+        verbose_name_plural = "LLM Usage (Daily)"
+        ordering = ["-day", "model_name"]
+        unique_together = [("model_name", "day")]
+
+
+class LLMRateWindow(models.Model):
+    """
+    LLM requests started in one one-minute window, shared by every gunicorn
+    and Celery process. Counted by curation.utils.rate_limited_llm_call.
+    """
+
+    window = models.PositiveBigIntegerField(
+        unique=True, help_text="Unix 시간 기준 분 (초 // 60)"
+    )
+    requests = models.PositiveIntegerField(default=0, help_text="시작된 요청 수")
+
+    def __str__(self):
+        return f"{self.window} ({self.requests} requests)"
+
+    @classmethod
+    def take(cls, window):
+        """Counts one request in the window with an atomic increment and returns the new count."""
+        rows = cls.objects.filter(window=window)
+        with transaction.atomic():
+            # The UPDATE locks the row until commit, so the count read back
+            # below includes this request and no other process's
+            if not rows.update(requests=models.F("requests") + 1):
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(window=window, requests=1)
+                except IntegrityError:
+                    # Another process created the row first
+                    rows.update(requests=models.F("requests") + 1)
+                else:
+                    # The first request of a window drops the finished ones
+                    cls.objects.filter(window__lt=window - 1).delete()
+                    return 1
+            return rows.values_list("requests", flat=True).get()
+
+    class Meta:
+        verbose_name = "LLM Rate Window"
+        verbose_name_plural = "LLM Rate Windows"
+        ordering = ["-window"]
 
 
 def translated_item_upload_path(instance, filename):
@@ -697,11 +1132,86 @@ def translated_item_upload_path(instance, filename):
     return f"tr/{now.year}/{now.month:02d}/{instance.id}-ko.md"
 
 
+class Tag(models.Model):
+    name = models.CharField(max_length=100, unique=True, help_text="태그 이름")
+    slug = models.SlugField(
+        max_length=100,
+        unique=True,
+        allow_unicode=True,
+        blank=True,
+        help_text="태그 slug",
+    )
+
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            taken = set(
+                Tag.objects.exclude(pk=self.pk)
+                .filter(slug__startswith=self._base_slug(self.name))
+                .values_list("slug", flat=True)
+            )
+            self.slug = self._unique_slug(self.name, taken)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def _base_slug(name):
+        return slugify(name, allow_unicode=True)[:100] or "tag"
+
+    @classmethod
+    def _unique_slug(cls, name, taken):
+        """
+        Returns the slug of name, or the first of slug-2, slug-3, ... that is
+        not in taken, truncated to fit the 100-character field.
+        """
+        base = cls._base_slug(name)
+        slug = base
+        suffix = 1
+        while slug in taken:
+            suffix += 1
+            slug = f"{base[: 100 - len(str(suffix)) - 1]}-{suffix}"
+        return slug
+
+    @classmethod
+    def get_or_create_many(cls, names):
+        """Return Tag objects for the given names, creating missing ones in bulk."""
+        names = list(dict.fromkeys(name.strip()[:100] for name in names if name.strip()))
+        existing = set(cls.objects.filter(name__in=names).values_list("name", flat=True))
+        missing_names = [name for name in names if name not in existing]
+        if missing_names:
+            base_slugs = {cls._base_slug(name) for name in missing_names}
+            prefixes = models.Q()
+            for base in base_slugs:
+                prefixes |= models.Q(slug__startswith=base)
+            taken = set(cls.objects.filter(prefixes).values_list("slug", flat=True))
+            missing = []
+            for name in missing_names:
+                slug = cls._unique_slug(name, taken)
+                taken.add(slug)
+                missing.append(cls(name=name, slug=slug))
+            cls.objects.bulk_create(missing, ignore_conflicts=True)
+        tags = {tag.name: tag for tag in cls.objects.filter(name__in=names)}
+        for name in names:
+            if name not in tags:
+                # Another process took the slug first; save() picks a free one
+                tags[name], _ = cls.objects.get_or_create(name=name)
+        return [tags[name] for name in names]
+
+    class Meta:
+        ordering = ["name"]
+
+
 class TranslatedContent(models.Model):
     title = models.CharField(max_length=512, help_text="제목")
     slug = models.SlugField(max_length=512, help_text="slug")
     description = models.TextField(help_text="설명")
-    tags = models.JSONField(default=list, help_text="태그")
+    tags = models.ManyToManyField(
+        Tag,
+        blank=True,
+        related_name="translated_contents",
+        help_text="태그",
+    )
     written_date = models.DateField(
         help_text="작성 일자",
         blank=True,
@@ -728,3 +1238,8 @@ class TranslatedContent(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["written_date"]),
+        ]
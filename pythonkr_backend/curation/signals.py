@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils.text import slugify
+
+from .models import Article, Category, LLMService, LLMUsage, LLMUsageDaily
+
+
+@receiver(pre_save, sender=Category)
+def slugify_category(sender, instance, **kwargs):
+    """Auto-generate the slug from the name if it is blank."""
+    if not instance.slug:
+        instance.slug = slugify(instance.name)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def clear_defined_category_cache(sender, **kwargs):
+    """Drop the cached predefined categories when any Category changes."""
+    Article._ensure_defined_categories.cache_clear()
+
+
+@receiver(post_save, sender=LLMUsage)
+def record_llm_usage_daily(sender, instance, created, **kwargs):
+    """Roll new usage into the daily totals read by quota checks."""
+    if created:
+        LLMUsageDaily.record(instance)
+
+
+@receiver(post_save, sender=LLMUsage)
+def clear_llm_quota_cache(sender, created, **kwargs):
+    """New usage may exhaust a quota, so recompute the available models."""
+    if created:
+        LLMService.clear_quota_cache()
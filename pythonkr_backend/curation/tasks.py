@@ -1,141 +1,361 @@
+import asyncio
+import calendar
+from contextlib import contextmanager
+from functools import cache
+from itertools import islice
+from tempfile import SpooledTemporaryFile
+
 import logfire
 
-from celery import shared_task
+from asgiref.sync import async_to_sync
+from celery import chord, group, shared_task
 import feedparser
-import requests
+import httpx
 from datetime import datetime, timezone, timedelta
 from django.utils import timezone as django_timezone
-from django.core.files.base import ContentFile
-from .models import RSSFeed, RSSItem
+from django.core.cache import caches
+from django.core.files.base import File
+from django.db import transaction
+from django.db.models import Q
+from .models import Article, RSSFeed, RSSItem
+from .utils import LLMRateLimitError
 from .utils_trans import translate_rssitem
 
 
+# 하나의 크롤링 태스크가 동시에 내려받는 피드 수
+RSS_FEED_BATCH_SIZE = 20
+RSS_FETCH_TIMEOUT = 20  # 초
+RSS_USER_AGENT = "pythonkr-bot/1.0 (+https://python.or.kr)"
+# 워커 메모리를 지키기 위해 이보다 큰 피드는 내려받다가 중단합니다
+RSS_MAX_FEED_BYTES = 10 * 1024 * 1024
+# 한 번의 본문 크롤링 태스크가 동시에 가져오는 RSS 아이템 수
+RSS_CONTENT_BATCH_SIZE = 16
+# 한 주기에 개별 태스크로 나눠 보내는 뉴스레터/저작권 분석 아이템 수
+RSS_ANALYSIS_BATCH_SIZE = 10
+# 개별 뉴스레터/저작권 분석 태스크가 아이템을 붙잡아 두는 최대 시간 (초)
+RSS_ANALYSIS_LOCK_TIMEOUT = 60 * 60
+# in_progress로 가져간 뒤 이 시간이 지나도 끝나지 않은 아이템은 워커가 죽은 것으로 보고 다시 가져갑니다
+RSS_CONTENT_CLAIM_TIMEOUT = timedelta(minutes=30)
+# 내려받는 본문이 이보다 크면 메모리 대신 임시 파일에 씁니다
+JINA_SPOOL_MAX_BYTES = 1024 * 1024
+# 본문 크롤링이 읽고 쓰는 RSSItem 필드
+RSS_CONTENT_CRAWL_FIELDS = (
+    "id",
+    "title",
+    "link",
+    "crawling_status",
+    "crawled_content",
+    "crawled_at",
+    "crawl_claimed_at",
+    "error_message",
+)
+# 크롤링 태스크가 읽는 RSSFeed 필드
+RSS_FEED_CRAWL_FIELDS = ("id", "name", "url", "max_items", "etag", "last_modified")
+
+
 def crawl_all_rss_feeds():
-    """모든 활성화된 RSS 피드를 크롤링합니다."""
-    active_feeds = RSSFeed.objects.filter(is_active=True)
-
-    results = {
-        "total_feeds": active_feeds.count(),
-        "processed_feeds": 0,
-        "new_items": 0,
-        "errors": [],
+    """모든 활성화된 RSS 피드를 묶음 단위로 나눠 Celery chord로 병렬 크롤링합니다."""
+    feed_ids = list(
+        RSSFeed.objects.filter(is_active=True).values_list("id", flat=True)
+    )
+
+    if not feed_ids:
+        logfire.info("No active RSS feeds to crawl")
+        return {"total_feeds": 0, "task_id": None}
+
+    # 묶음별 크롤링은 병렬로 실행되고, 모두 끝나면 결과를 집계합니다
+    batches = [
+        feed_ids[i : i + RSS_FEED_BATCH_SIZE]
+        for i in range(0, len(feed_ids), RSS_FEED_BATCH_SIZE)
+    ]
+    result = chord(crawl_rss_feed_batch.s(batch) for batch in batches)(
+        aggregate_rss_crawl_results.s().on_error(log_rss_crawl_error.s())
+    )
+    logfire.info(
+        f"Queued crawling of {len(feed_ids)} RSS feeds in {len(batches)} batches"
+    )
+
+    return {"total_feeds": len(feed_ids), "task_id": result.id}
+
+
+@shared_task
+def aggregate_rss_crawl_results(results):
+    """묶음별 크롤링 결과(피드별 결과 목록)를 집계합니다."""
+    feed_results = [result for batch in results for result in batch]
+    summary = {
+        "processed_feeds": len(feed_results),
+        "new_items": sum(result.get("new_items", 0) for result in feed_results),
     }
+    logfire.info(
+        f"Crawled {summary['processed_feeds']} RSS feeds: {summary['new_items']} new items"
+    )
+    return summary
 
-    for feed in active_feeds:
-        try:
-            result = crawl_single_rss_feed(feed.id)
-            results["processed_feeds"] += 1
-            results["new_items"] += result.get("new_items", 0)
-            logfire.info(
-                f"Successfully crawled feed {feed.name}: {result.get('new_items', 0)} new items"
-            )
-        except Exception as e:
-            error_msg = f"Error crawling feed {feed.name}: {str(e)}"
-            results["errors"].append(error_msg)
-            logfire.error(error_msg)
 
-    return results
+@shared_task
+def log_rss_crawl_error(request, exc, traceback):
+    """chord에 포함된 피드 크롤링이 최종 실패했을 때 기록합니다."""
+    logfire.error(f"RSS feed crawl chord {request.id} failed: {exc}")
 
 
-def crawl_single_rss_feed(feed_id):
-    """단일 RSS 피드를 크롤링합니다."""
-    try:
-        feed = RSSFeed.objects.get(id=feed_id)
-    except RSSFeed.DoesNotExist:
-        raise Exception(f"RSS Feed with id {feed_id} not found")
+def _mark_feed_not_modified(feed):
+    """304 응답을 받은 피드는 마지막 크롤링 시간만 갱신합니다."""
+    RSSFeed.objects.filter(pk=feed.pk).update(last_fetched=django_timezone.now())
+    logfire.info(f"RSS feed {feed.name} not modified since last crawl")
+    return {"feed_name": feed.name, "new_items": 0, "total_entries": 0}
 
-    logfire.info(f"Starting to crawl RSS feed: {feed.name} ({feed.url})")
 
-    try:
-        # RSS 피드 파싱
-        parsed_feed = feedparser.parse(feed.url)
+def _save_parsed_feed(feed, parsed_feed):
+    """파싱된 피드의 새 항목을 저장하고 피드별 크롤링 결과를 반환합니다."""
+    if parsed_feed.bozo:
+        logfire.warning(
+            f"RSS feed {feed.name} has parsing issues: {parsed_feed.bozo_exception}"
+        )
 
-        if parsed_feed.bozo:
+    new_items = []
+    link_max_length = RSSItem._meta.get_field("link").max_length
+
+    # 항목마다 GUID 또는 링크를 고유 식별자로 한 번만 계산합니다
+    # 오래된 항목이 많이 쌓인 피드는 앞쪽(최신) max_items개만 봅니다
+    entries = []
+    for entry in islice(parsed_feed.entries, feed.max_items):
+        link = entry.get("link") or ""
+        guid = entry.get("id") or entry.get("guid") or link
+        entries.append((entry, guid, link))
+
+    # 중복 체크용으로 이미 저장된 GUID/링크를 한 번의 쿼리로 가져옵니다
+    entry_guids = {guid[:500] for _, guid, _ in entries if guid}
+    entry_links = {link for _, _, link in entries if link}
+    existing_guids = set()
+    existing_links = set()
+    if entry_guids or entry_links:
+        for existing_guid, existing_link in RSSItem.objects.filter(
+            Q(guid__in=entry_guids) | Q(link__in=entry_links)
+        ).values_list("guid", "link"):
+            existing_guids.add(existing_guid)
+            existing_links.add(existing_link)
+
+    for entry, guid, link in entries:
+        if not guid and not link:
             logfire.warning(
-                f"RSS feed {feed.name} has parsing issues: {parsed_feed.bozo_exception}"
+                f"Skipping entry without GUID or link in feed {feed.name}"
             )
+            continue
+
+        # 중복 체크
+        if (guid and guid[:500] in existing_guids) or (
+            link and link in existing_links
+        ):
+            continue  # 이미 존재하는 아이템은 스킵
+
+        # 발행일 파싱
+        pub_date = None
+        published = entry.get("published_parsed") or entry.get("updated_parsed")
+        if published:
+            try:
+                pub_date = datetime.fromtimestamp(
+                    calendar.timegm(published), tz=timezone.utc
+                )
+            except (ValueError, TypeError, OverflowError, OSError):
+                pass
 
-        new_items_count = 0
+        if len(link) > link_max_length:
+            logfire.error(f"Skipping RSS item with too long link: {link}")
+            continue
 
-        for entry in parsed_feed.entries:
-            # GUID 또는 링크를 고유 식별자로 사용
-            guid = (
-                getattr(entry, "id", "")
-                or getattr(entry, "guid", "")
-                or getattr(entry, "link", "")
+        # 새 RSS 아이템 생성 (저장은 루프가 끝난 뒤 한 번에)
+        try:
+            rss_item = RSSItem(
+                feed=feed,
+                title=(entry.get("title") or "")[:500],  # 길이 제한
+                link=link,
+                description=entry.get("summary") or entry.get("description") or "",
+                author=(entry.get("author") or "")[:200],  # 길이 제한
+                category=", ".join(
+                    tag.get("term") or "" for tag in entry.get("tags") or ()
+                )[:200],  # 길이 제한
+                guid=guid[:500],  # 길이 제한
+                pub_date=pub_date,
             )
-            link = getattr(entry, "link", "")
+        except Exception as e:
+            logfire.error(f"Error creating RSS item for {link}: {str(e)}")
+            continue
+
+        new_items.append(rss_item)
+        # 같은 피드 안의 중복 항목도 건너뛰도록 기록합니다
+        existing_guids.add(rss_item.guid)
+        existing_links.add(rss_item.link)
+
+    with transaction.atomic():
+        # 동시에 실행된 크롤링이 먼저 저장한 아이템은 무시됩니다
+        RSSItem.objects.bulk_create(
+            new_items, ignore_conflicts=True, batch_size=500
+        )
+        new_items_count = len(new_items)
 
-            if not guid and not link:
-                logfire.warning(
-                    f"Skipping entry without GUID or link in feed {feed.name}"
-                )
-                continue
+        # 마지막 크롤링 시간과 다음 조건부 요청에 쓸 헤더 값 업데이트
+        RSSFeed.objects.filter(pk=feed.pk).update(
+            last_fetched=django_timezone.now(),
+            etag=(getattr(parsed_feed, "etag", "") or "")[:200],
+            last_modified=(getattr(parsed_feed, "modified", "") or "")[:200],
+        )
 
-            # 중복 체크
-            existing_item = None
-            if guid:
-                existing_item = RSSItem.objects.filter(guid=guid).first()
-            if not existing_item and link:
-                existing_item = RSSItem.objects.filter(link=link).first()
-
-            if existing_item:
-                continue  # 이미 존재하는 아이템은 스킵
-
-            # 발행일 파싱
-            pub_date = None
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                try:
-                    pub_date = datetime(
-                        *entry.published_parsed[:6], tzinfo=timezone.utc
-                    )
-                except (ValueError, TypeError):
-                    pass
-            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                try:
-                    pub_date = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-                except (ValueError, TypeError):
-                    pass
-
-            # 새 RSS 아이템 생성
-            try:
-                rss_item = RSSItem.objects.create(
-                    feed=feed,
-                    title=getattr(entry, "title", "")[:500],  # 길이 제한
-                    link=link,
-                    description=getattr(entry, "summary", "")
-                    or getattr(entry, "description", ""),
-                    author=getattr(entry, "author", "")[:200],  # 길이 제한
-                    category=", ".join(
-                        [tag.term for tag in getattr(entry, "tags", [])]
-                    )[:200],  # 길이 제한
-                    guid=guid[:500],  # 길이 제한
-                    pub_date=pub_date,
-                )
-                new_items_count += 1
-                logfire.debug(f"Created new RSS item: {rss_item.title}")
+    result = {
+        "feed_name": feed.name,
+        "new_items": new_items_count,
+        "total_entries": len(parsed_feed.entries),
+    }
 
-            except Exception as e:
-                logfire.error(f"Error creating RSS item for {link}: {str(e)}")
-                continue
+    logfire.info(
+        f"Completed crawling {feed.name}: {new_items_count} new items out of {len(parsed_feed.entries)} total entries"
+    )
+    return result
+
+
+def _conditional_headers(feed):
+    """이전 응답의 ETag/Last-Modified로 조건부 요청 헤더를 만듭니다."""
+    headers = {}
+    if feed.etag:
+        headers["If-None-Match"] = feed.etag
+    if feed.last_modified:
+        headers["If-Modified-Since"] = feed.last_modified
+    return headers
+
+
+def _parse_feed_response(response, content):
+    """내려받은 피드 본문을 파싱하고 다음 조건부 요청에 쓸 헤더 값을 붙입니다."""
+    # 크롤링은 항목의 link 필드만 쓰므로 본문 속 상대 URI를 바꾸는 후처리는 건너뜁니다
+    parsed_feed = feedparser.parse(
+        content,
+        response_headers=dict(response.headers),
+        resolve_relative_uris=False,
+    )
+    parsed_feed.etag = response.headers.get("etag", "")
+    parsed_feed.modified = response.headers.get("last-modified", "")
+    return parsed_feed
 
-        # 마지막 크롤링 시간 업데이트
-        feed.last_fetched = django_timezone.now()
-        feed.save(update_fields=["last_fetched"])
 
-        result = {
-            "feed_name": feed.name,
-            "new_items": new_items_count,
-            "total_entries": len(parsed_feed.entries),
-        }
+def _check_feed_size(feed, size):
+    """피드 본문이 RSS_MAX_FEED_BYTES를 넘으면 더 읽지 않고 중단합니다."""
+    if size > RSS_MAX_FEED_BYTES:
+        raise ValueError(
+            f"RSS feed {feed.name} is larger than {RSS_MAX_FEED_BYTES} bytes"
+        )
 
-        logfire.info(
-            f"Completed crawling {feed.name}: {new_items_count} new items out of {len(parsed_feed.entries)} total entries"
+
+@cache
+def _rss_http_client():
+    """워커 프로세스마다 하나씩 두고 연결을 재사용하는 피드용 HTTP 클라이언트"""
+    return httpx.Client(
+        timeout=RSS_FETCH_TIMEOUT,
+        follow_redirects=True,
+        headers={"User-Agent": RSS_USER_AGENT},
+    )
+
+
+def _fetch_feed(feed):
+    """피드를 스트리밍으로 내려받아 (응답, 본문)을 반환합니다. 304이면 본문은 비어 있습니다."""
+    with _rss_http_client().stream(
+        "GET", feed.url, headers=_conditional_headers(feed)
+    ) as response:
+        if response.status_code == 304:
+            return response, b""
+        response.raise_for_status()
+        _check_feed_size(feed, int(response.headers.get("content-length") or 0))
+        body = bytearray()
+        for chunk in response.iter_bytes():
+            body += chunk
+            _check_feed_size(feed, len(body))
+        return response, bytes(body)
+
+
+async def _afetch_feed(client, feed):
+    """Async version of _fetch_feed."""
+    async with client.stream(
+        "GET", feed.url, headers=_conditional_headers(feed)
+    ) as response:
+        if response.status_code == 304:
+            return response, b""
+        response.raise_for_status()
+        _check_feed_size(feed, int(response.headers.get("content-length") or 0))
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            _check_feed_size(feed, len(body))
+        return response, bytes(body)
+
+
+async def afetch_rss_feeds(feeds):
+    """피드들을 하나의 AsyncClient로 동시에 내려받습니다.
+
+    피드마다 (응답, 본문)을 반환하고, 실패한 요청은 예외 객체로 반환되므로
+    결과 순서는 ``feeds`` 와 같습니다.
+    """
+    async with httpx.AsyncClient(
+        timeout=RSS_FETCH_TIMEOUT,
+        follow_redirects=True,
+        headers={"User-Agent": RSS_USER_AGENT},
+    ) as client:
+        return await asyncio.gather(
+            *(_afetch_feed(client, feed) for feed in feeds),
+            return_exceptions=True,
         )
-        return result
 
-    except requests.RequestException as e:
-        raise Exception(f"Network error while fetching RSS feed: {str(e)}")
+
+@shared_task
+def crawl_rss_feed_batch(feed_ids):
+    """여러 RSS 피드를 동시에 내려받은 뒤 순서대로 파싱해 저장합니다."""
+    feeds = list(
+        RSSFeed.objects.filter(id__in=feed_ids).only(*RSS_FEED_CRAWL_FIELDS)
+    )
+    downloads = async_to_sync(afetch_rss_feeds)(feeds)
+
+    results = []
+    for feed, download in zip(feeds, downloads):
+        try:
+            if isinstance(download, Exception):
+                raise download
+            response, content = download
+            if response.status_code == 304:
+                results.append(_mark_feed_not_modified(feed))
+                continue
+            parsed_feed = _parse_feed_response(response, content)
+            results.append(_save_parsed_feed(feed, parsed_feed))
+        except Exception as e:
+            # 한 피드의 실패가 같은 묶음의 다른 피드에 영향을 주지 않도록 합니다
+            logfire.error(f"Error crawling RSS feed {feed.name}: {str(e)}")
+            results.append({"feed_name": feed.name, "new_items": 0, "error": str(e)})
+
+    return results
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(httpx.HTTPError,),
+    retry_backoff=True,
+    max_retries=3,
+)
+def crawl_single_rss_feed(self, feed_id):
+    """단일 RSS 피드를 크롤링합니다."""
+    try:
+        feed = RSSFeed.objects.only(*RSS_FEED_CRAWL_FIELDS).get(id=feed_id)
+    except RSSFeed.DoesNotExist:
+        raise Exception(f"RSS Feed with id {feed_id} not found")
+
+    logfire.info(f"Starting to crawl RSS feed: {feed.name} ({feed.url})")
+
+    try:
+        response, content = _fetch_feed(feed)
+        if response.status_code == 304:
+            return _mark_feed_not_modified(feed)
+
+        return _save_parsed_feed(feed, _parse_feed_response(response, content))
+
+    except httpx.HTTPError as e:
+        # HTTPError로 다시 올려서 autoretry 대상이 되게 합니다
+        raise httpx.HTTPError(
+            f"Network error while fetching RSS feed: {str(e)}"
+        ) from e
     except Exception as e:
         raise Exception(f"Unexpected error while crawling RSS feed: {str(e)}")
 
@@ -147,89 +367,177 @@ def crawl_rss():
     return crawl_all_rss_feeds()
 
 
-@shared_task
-def crawl_rss_item_content():
-    """RSS 아이템의 본문을 크롤링하는 태스크 (10분마다 실행)"""
-    logfire.info("Starting RSS item content crawling")
+def _claim_pending_rss_items(limit):
+    """2주 이내의 최신 pending 아이템을 in_progress로 바꿔 이 워커가 가져갑니다.
 
-    # 2주 이내의 크롤링되지 않은 최신 1개 아이템 가져오기
-    two_weeks_ago = django_timezone.now() - timedelta(days=14)
-    pending_item = (
-        RSSItem.objects.filter(crawling_status="pending", pub_date__gte=two_weeks_ago)
-        .order_by("-pub_date", "-created_at")
-        .first()
+    RSS_CONTENT_CLAIM_TIMEOUT보다 오래된 in_progress 아이템도 다시 가져갑니다.
+    """
+    now = django_timezone.now()
+    two_weeks_ago = now - timedelta(days=14)
+    claimable = Q(crawling_status="pending") | Q(
+        crawling_status="in_progress",
+        crawl_claimed_at__lt=now - RSS_CONTENT_CLAIM_TIMEOUT,
     )
+    with transaction.atomic():
+        # 잠긴 행은 건너뛰므로 동시에 실행된 워커끼리 같은 아이템을 가져가지 않습니다
+        items = list(
+            RSSItem.objects.select_for_update(skip_locked=True)
+            .filter(claimable, pub_date__gte=two_weeks_ago)
+            .order_by("-pub_date", "-created_at")
+            .only(*RSS_CONTENT_CRAWL_FIELDS)[:limit]
+        )
+        RSSItem.objects.filter(id__in=[item.id for item in items]).update(
+            crawling_status="in_progress", crawl_claimed_at=now
+        )
+    for item in items:
+        item.crawling_status = "in_progress"
+        item.crawl_claimed_at = now
+    return items
 
-    if not pending_item:
-        logfire.info("No pending RSS items to crawl")
-        return {"status": "no_items", "message": "No pending items to crawl"}
 
-    logfire.info(f"Crawling RSS item: {pending_item.title} ({pending_item.link})")
+def _release_rss_items(items):
+    """저장하지 못한 아이템을 pending으로 되돌려 다음 주기에 다시 크롤링하게 합니다."""
+    RSSItem.objects.filter(
+        id__in=[item.id for item in items], crawling_status="in_progress"
+    ).update(crawling_status="pending", crawl_claimed_at=None)
+
 
-    # 크롤링 상태를 진행 중으로 변경 (동시 처리 방지)
-    pending_item.crawling_status = "completed"  # 임시로 설정하여 중복 처리 방지
-    pending_item.save(update_fields=["crawling_status"])
+async def _afetch_jina_content(client, semaphore, item):
+    """Jina AI Reader로 아이템 본문(마크다운)을 임시 파일로 내려받습니다.
 
+    (임시 파일, 바이트 수)를 반환합니다. 큰 본문은 디스크로 넘어가므로
+    메모리에 통째로 올라가지 않습니다.
+    """
+    content_file = SpooledTemporaryFile(max_size=JINA_SPOOL_MAX_BYTES)
     try:
-        # Jina AI를 사용하여 콘텐츠 크롤링
-        jina_url = f"https://r.jina.ai/{pending_item.link}"
+        async with semaphore, client.stream(
+            "GET", f"https://r.jina.ai/{item.link}"
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(64 * 1024):
+                content_file.write(chunk)
+    except BaseException:
+        content_file.close()
+        raise
+    size = content_file.tell()
+    content_file.seek(0)
+    return content_file, size
+
+
+async def afetch_jina_contents(items):
+    """아이템 본문들을 하나의 AsyncClient로 동시에 가져옵니다.
+
+    실패한 요청은 예외 객체로 반환되므로 결과 순서는 ``items`` 와 같습니다.
+    """
+    semaphore = asyncio.Semaphore(RSS_CONTENT_BATCH_SIZE)
+    async with httpx.AsyncClient(
+        timeout=30,
+        limits=httpx.Limits(max_connections=RSS_CONTENT_BATCH_SIZE),
+    ) as client:
+        return await asyncio.gather(
+            *(_afetch_jina_content(client, semaphore, item) for item in items),
+            return_exceptions=True,
+        )
 
-        response = requests.get(jina_url, timeout=30)
-        response.raise_for_status()
 
-        # 마크다운 콘텐츠 저장
-        markdown_content = response.text
+def _store_jina_contents(items, contents):
+    """내려받은 본문을 아이템에 반영하고 결과 목록을 반환합니다. DB에는 저장하지 않습니다."""
+    results = []
+    crawled_at = django_timezone.now()
+    for item, downloaded in zip(items, contents):
+        try:
+            if isinstance(downloaded, Exception):
+                raise downloaded
+
+            # 내려받은 임시 파일을 그대로 저장
+            content_file, content_length = downloaded
+            filename = f"{item.id}-crawl.md"
+            with content_file:
+                item.crawled_content.save(
+                    filename, File(content_file, name=filename), save=False
+                )
+            item.crawling_status = "completed"
+            item.crawled_at = crawled_at
+            item.error_message = ""  # 성공 시 에러 메시지 초기화
+
+            logfire.info(f"Successfully crawled RSS item: {item.title}")
+            results.append(
+                {
+                    "status": "success",
+                    "item_id": item.id,
+                    "item_title": item.title,
+                    "content_length": content_length,
+                }
+            )
+        except Exception as e:
+            if isinstance(e, httpx.HTTPError):
+                error_msg = f"Network error while crawling {item.link}: {str(e)}"
+            else:
+                error_msg = f"Unexpected error while crawling {item.link}: {str(e)}"
+            item.crawling_status = "failed"
+            item.error_message = error_msg
 
-        # 파일 저장
-        filename = f"{pending_item.id}-crawl.md"
-        content_file = ContentFile(markdown_content.encode("utf-8"))
+            logfire.error(error_msg)
+            results.append({"status": "failed", "item_id": item.id, "error": error_msg})
+    return results
 
-        pending_item.crawled_content.save(filename, content_file, save=False)
-        pending_item.crawling_status = "completed"
-        pending_item.crawled_at = django_timezone.now()
-        pending_item.error_message = ""  # 성공 시 에러 메시지 초기화
-        pending_item.save()
 
-        logfire.info(f"Successfully crawled RSS item: {pending_item.title}")
+@shared_task
+def crawl_rss_item_content():
+    """RSS 아이템의 본문을 크롤링하는 태스크 (10분마다 실행)
 
-        return {
-            "status": "success",
-            "item_id": pending_item.id,
-            "item_title": pending_item.title,
-            "content_length": len(markdown_content),
-        }
+    최신 pending 아이템을 RSS_CONTENT_BATCH_SIZE개까지 가져와 동시에 크롤링합니다.
+    """
+    logfire.info("Starting RSS item content crawling")
 
-    except requests.RequestException as e:
-        error_msg = f"Network error while crawling {pending_item.link}: {str(e)}"
-        pending_item.crawling_status = "failed"
-        pending_item.error_message = error_msg
-        pending_item.save(update_fields=["crawling_status", "error_message"])
+    items = _claim_pending_rss_items(RSS_CONTENT_BATCH_SIZE)
+    if not items:
+        logfire.info("No pending RSS items to crawl")
+        return {"status": "no_items", "message": "No pending items to crawl"}
 
-        logfire.error(error_msg)
+    logfire.info(f"Crawling {len(items)} RSS items")
 
-        return {"status": "failed", "item_id": pending_item.id, "error": error_msg}
+    try:
+        contents = async_to_sync(afetch_jina_contents)(items)
+        results = _store_jina_contents(items, contents)
+        RSSItem.objects.bulk_update(
+            items, ["crawled_content", "crawling_status", "crawled_at", "error_message"]
+        )
+    except BaseException:
+        # 저장하지 못했으면 in_progress로 남기지 않고 바로 되돌립니다
+        _release_rss_items(items)
+        raise
+
+    return {
+        "status": "processed",
+        "crawled": sum(result["status"] == "success" for result in results),
+        "failed": sum(result["status"] == "failed" for result in results),
+        "items": results,
+    }
 
-    except Exception as e:
-        error_msg = f"Unexpected error while crawling {pending_item.link}: {str(e)}"
-        pending_item.crawling_status = "failed"
-        pending_item.error_message = error_msg
-        pending_item.save(update_fields=["crawling_status", "error_message"])
 
-        logfire.error(error_msg)
+@contextmanager
+def _rss_analysis_lock(kind, item_id):
+    """아이템 하나를 이 워커만 처리하도록 "llm" 캐시에 잠금을 잡습니다.
 
-        return {"status": "failed", "item_id": pending_item.id, "error": error_msg}
+    잠금을 잡았으면 True, 다른 워커가 처리 중이면 False를 넘깁니다.
+    """
+    lock_key = f"rss-{kind}:{item_id}"
+    cache = caches["llm"]
+    if not cache.add(lock_key, 1, RSS_ANALYSIS_LOCK_TIMEOUT):
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        cache.delete(lock_key)
 
 
-@shared_task
-def process_newsletter_items():
-    """뉴스레터 아이템에서 개별 링크를 추출하는 태스크 (10분마다 실행)"""
-    from .utils_newsletter import process_newsletter_rss_item
-    
-    logfire.info("Starting newsletter processing")
-    
-    # 뉴스레터 피드에서 크롤링이 완료되었지만 아직 처리되지 않은 아이템 찾기
+def _pending_newsletter_items():
+    """링크 추출을 기다리는 원본 뉴스레터 아이템 (최근 크롤링 순)"""
+    # 뉴스레터 피드에서 크롤링이 완료되었지만 아직 처리되지 않은 아이템
     # source_item이 None인 것들은 원본 뉴스레터 아이템
-    pending_newsletter = (
+    return (
         RSSItem.objects.filter(
             feed__is_newsletter=True,
             crawling_status="completed",
@@ -237,74 +545,138 @@ def process_newsletter_items():
         )
         .exclude(extracted_items__isnull=False)  # 이미 링크가 추출된 것은 제외
         .order_by("-crawled_at", "-created_at")
-        .first()
     )
-    
-    if not pending_newsletter:
+
+
+@shared_task
+def process_newsletter_items():
+    """뉴스레터 아이템에서 개별 링크를 추출하는 태스크 (10분마다 실행)
+
+    처리할 뉴스레터를 RSS_ANALYSIS_BATCH_SIZE개까지 골라 아이템마다
+    process_newsletter_item 태스크로 보내 여러 워커가 나눠 처리하게 합니다.
+    """
+    logfire.info("Starting newsletter processing")
+
+    newsletter_ids = list(
+        _pending_newsletter_items().values_list("id", flat=True)[:RSS_ANALYSIS_BATCH_SIZE]
+    )
+    if not newsletter_ids:
         logfire.info("No newsletter items to process")
         return {"status": "no_items", "message": "No newsletter items to process"}
-    
-    logfire.info(f"Processing newsletter: {pending_newsletter.title}")
-    
+
+    group(process_newsletter_item.s(item_id) for item_id in newsletter_ids).apply_async()
+    logfire.info(f"Dispatched {len(newsletter_ids)} newsletter items")
+    return {"status": "dispatched", "item_ids": newsletter_ids}
+
+
+@shared_task(acks_late=True)
+def process_newsletter_item(item_id):
+    """뉴스레터 아이템 하나에서 개별 링크를 추출합니다."""
+    # 두 주기에 걸쳐 같은 아이템이 보내져도 한 워커만 처리합니다
+    with _rss_analysis_lock("newsletter", item_id) as claimed:
+        if not claimed:
+            return {"status": "skipped", "newsletter_id": item_id}
+        return _process_newsletter_item(item_id)
+
+
+def _process_newsletter_item(item_id):
+    from .utils_newsletter import process_newsletter_rss_item
+
+    # 이전 주기에 보낸 태스크가 먼저 처리했다면 건너뜁니다
+    newsletter = _pending_newsletter_items().filter(pk=item_id).only("id", "title").first()
+    if newsletter is None:
+        return {"status": "skipped", "newsletter_id": item_id}
+
+    logfire.info(f"Processing newsletter: {newsletter.title}")
+
     try:
-        result = process_newsletter_rss_item(pending_newsletter.id)
-        
+        result = process_newsletter_rss_item(newsletter.id)
+
         if 'error' in result:
             logfire.error(f"Newsletter processing failed: {result['error']}")
             return {"status": "failed", "error": result['error']}
-        
+
         logfire.info(
             f"Newsletter processing completed: {result['created_count']} items created "
             f"from {result['extracted_count']} links"
         )
-        
+
         return {
             "status": "success",
-            "newsletter_id": pending_newsletter.id,
-            "newsletter_title": pending_newsletter.title,
+            "newsletter_id": newsletter.id,
+            "newsletter_title": newsletter.title,
             **result
         }
-        
+
     except Exception as e:
-        error_msg = f"Unexpected error processing newsletter {pending_newsletter.id}: {str(e)}"
+        error_msg = f"Unexpected error processing newsletter {newsletter.id}: {str(e)}"
         logfire.error(error_msg)
         return {"status": "failed", "error": error_msg}
 
 
-@shared_task
-def analyze_content_copyright():
-    """크롤링된 콘텐츠의 언어 감지 및 저작권 분석을 수행하는 태스크 (10분마다 실행)"""
-    from .utils_copyright import analyze_content_for_copyright
-    
-    logfire.info("Starting content copyright analysis")
-    
-    # 크롤링이 완료되었지만 언어 분석이 안된 아이템 찾기
-    pending_item = (
+def _pending_copyright_items():
+    """언어 감지·저작권 분석을 기다리는 아이템 (최근 크롤링 순)"""
+    return (
         RSSItem.objects.filter(
             crawling_status="completed",
             language=""  # 언어가 아직 감지되지 않은 아이템
         )
         .exclude(source_item__isnull=False)  # 뉴스레터에서 추출된 아이템은 제외 (원본만 분석)
         .order_by("-crawled_at", "-created_at")
-        .first()
     )
-    
-    if not pending_item:
+
+
+@shared_task
+def analyze_content_copyright():
+    """크롤링된 콘텐츠의 언어 감지 및 저작권 분석을 수행하는 태스크 (10분마다 실행)
+
+    분석할 아이템을 RSS_ANALYSIS_BATCH_SIZE개까지 골라 아이템마다
+    analyze_item_copyright 태스크로 보내 여러 워커가 나눠 처리하게 합니다.
+    """
+    logfire.info("Starting content copyright analysis")
+
+    item_ids = list(
+        _pending_copyright_items().values_list("id", flat=True)[:RSS_ANALYSIS_BATCH_SIZE]
+    )
+    if not item_ids:
         logfire.info("No items pending copyright analysis")
         return {"status": "no_items", "message": "No items pending analysis"}
-    
+
+    group(analyze_item_copyright.s(item_id) for item_id in item_ids).apply_async()
+    logfire.info(f"Dispatched {len(item_ids)} items for copyright analysis")
+    return {"status": "dispatched", "item_ids": item_ids}
+
+
+@shared_task(acks_late=True)
+def analyze_item_copyright(item_id):
+    """아이템 하나의 언어 감지 및 저작권 분석을 수행합니다."""
+    # 두 주기에 걸쳐 같은 아이템이 보내져도 LLM은 한 번만 호출합니다
+    with _rss_analysis_lock("analysis", item_id) as claimed:
+        if not claimed:
+            return {"status": "skipped", "item_id": item_id}
+        return _analyze_item_copyright(item_id)
+
+
+def _analyze_item_copyright(item_id):
+    from .utils_copyright import analyze_content_for_copyright
+
+    # 이전 주기에 보낸 태스크가 먼저 분석했다면 건너뜁니다
+    pending_item = _pending_copyright_items().filter(pk=item_id).only("id", "title").first()
+    if pending_item is None:
+        return {"status": "skipped", "item_id": item_id}
+
     logfire.info(f"Analyzing content: {pending_item.title}")
-    
+
     try:
         result = analyze_content_for_copyright(pending_item.id)
-        
+
         if 'error' in result:
             logfire.error(f"Content analysis failed: {result['error']}")
             return {"status": "failed", "error": result['error']}
-        
+
         analysis_type = "summary" if result.get('summary') else "copyright"
         logfire.info(f"Content analysis completed ({analysis_type}): {pending_item.title}")
-        
+
         return {
             "status": "success",
             "item_id": pending_item.id,
@@ -312,13 +684,20 @@ def analyze_content_copyright():
             "analysis_type": analysis_type,
             **result
         }
-        
+
     except Exception as e:
         error_msg = f"Unexpected error analyzing content {pending_item.id}: {str(e)}"
         logfire.error(error_msg)
         return {"status": "failed", "error": error_msg}
 
 
+def _set_translate_status(item_id, status, error_message=""):
+    """번역 상태를 모델을 저장하지 않고 UPDATE 한 번으로 기록합니다."""
+    RSSItem.objects.filter(pk=item_id).update(
+        translate_status=status, translate_error_message=error_message
+    )
+
+
 @shared_task
 def translate_pending_rss_item():
     """외국어 콘텐츠 중 번역이 허용된 RSS 아이템을 번역하는 태스크 (10분마다 실행)"""
@@ -335,6 +714,12 @@ def translate_pending_rss_item():
         .exclude(language="ko")  # Exclude Korean content (gets summarized instead)
         .exclude(translated_contents__isnull=False)  # Don't re-translate
         .order_by("-crawled_at", "-created_at")
+        .only(
+            "id",
+            "title",
+            "language",
+            "license_type",
+        )
         .first()
     )
 
@@ -352,9 +737,7 @@ def translate_pending_rss_item():
         translated_content = translate_rssitem(pending_item.id)
 
         # 번역 상태를 완료로 변경
-        pending_item.translate_status = "completed"
-        pending_item.translate_error_message = ""  # 성공 시 에러 메시지 초기화
-        pending_item.save(update_fields=["translate_status", "translate_error_message"])
+        _set_translate_status(pending_item.id, "completed")
 
         logfire.info(f"Successfully translated RSS item: {pending_item.title}")
 
@@ -370,9 +753,7 @@ def translate_pending_rss_item():
     except ValueError as e:
         # Permission or validation errors - mark as failed with specific message
         error_msg = f"Translation not permitted: {str(e)}"
-        pending_item.translate_status = "failed"
-        pending_item.translate_error_message = error_msg
-        pending_item.save(update_fields=["translate_status", "translate_error_message"])
+        _set_translate_status(pending_item.id, "failed", error_msg)
 
         logfire.warning(error_msg)
 
@@ -381,10 +762,83 @@ def translate_pending_rss_item():
     except Exception as e:
         # Other errors
         error_msg = f"Error translating RSS item {pending_item.id}: {str(e)}"
-        pending_item.translate_status = "failed"
-        pending_item.translate_error_message = error_msg
-        pending_item.save(update_fields=["translate_status", "translate_error_message"])
+        _set_translate_status(pending_item.id, "failed", error_msg)
 
         logfire.error(error_msg)
 
         return {"status": "failed", "item_id": pending_item.id, "error": error_msg}
+
+
+@shared_task
+def run_rss_pipeline():
+    """10분마다 실행되는 RSS 처리 파이프라인
+
+    피드 크롤링, 본문 크롤링, 뉴스레터 링크 추출, 저작권 분석, 번역을 하나의 group으로
+    보내 주기마다 스케줄되는 태스크를 하나로 줄입니다. 각 단계는 이전 주기까지
+    쌓인 아이템을 처리하므로 순서를 맞출 필요가 없고, 한 단계가 실패해도 나머지
+    단계는 그대로 실행됩니다. 피드 크롤링은 chord를 보내고 바로 끝나므로 새로
+    가져온 아이템은 다음 주기의 본문 크롤링이 처리합니다.
+    """
+    logfire.info("Starting RSS pipeline")
+    result = group(
+        crawl_rss.si(),
+        crawl_rss_item_content.si(),
+        process_newsletter_items.si(),
+        analyze_content_copyright.si(),
+        translate_pending_rss_item.si(),
+    ).apply_async()
+    return {"status": "started", "group_id": result.id}
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(httpx.TransportError, LLMRateLimitError),
+    retry_backoff=True,
+    max_retries=3,
+)
+def process_article(self, article_id):
+    """Article 요약, 번역, 카테고리 분류를 처리합니다 (번역/분류는 동시 실행)."""
+    article = Article.objects.get(id=article_id)
+    _, message = async_to_sync(article.afetch_and_summarize)()
+    logfire.info(f"Processed article {article_id}: {message}")
+    return message
+
+
+async def _asummarize_articles(articles):
+    """기사들을 동시에 처리합니다. 예외가 난 기사는 예외 객체로 반환됩니다."""
+    return await asyncio.gather(
+        *(article.afetch_and_summarize() for article in articles),
+        return_exceptions=True,
+    )
+
+
+@shared_task
+def bulk_summarize_articles(article_ids):
+    """급하지 않은 일괄 재처리용으로 여러 기사를 한 태스크에서 동시에 요약합니다.
+
+    LLM 호출 수는 rate_limited_llm_call의 동시 실행/분당 제한을 따릅니다.
+    LLM 요청 한도에 걸린 기사는 재시도하는 process_article 태스크로 다시 보냅니다.
+    """
+    articles = list(Article.objects.filter(id__in=article_ids))
+    results = async_to_sync(_asummarize_articles)(articles)
+
+    failed = []
+    requeued = []
+    for article, result in zip(articles, results):
+        if isinstance(result, LLMRateLimitError):
+            process_article.delay(article.id)
+            requeued.append(article.id)
+            continue
+        if isinstance(result, Exception):
+            succeeded, message = False, str(result)
+        else:
+            succeeded, message = result
+        if not succeeded:
+            logfire.error(f"Error processing article {article.id}: {message}")
+            failed.append(article.id)
+
+    logfire.info(
+        f"Bulk processed {len(articles)} articles "
+        f"({len(failed)} failed, {len(requeued)} requeued)"
+    )
+    return {"processed": len(articles), "failed": failed, "requeued": requeued}
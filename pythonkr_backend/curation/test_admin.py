@@ -1,19 +1,46 @@
+import os
+from functools import cache
+
+import lxml.html
 import pytest
-from django.test import Client
+from pytest_django.asserts import assertContains, assertNotContains
+from django.test import Client, RequestFactory
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.contrib.admin import site
+from django.contrib.admin.actions import delete_selected
 from django.contrib.admin.sites import AdminSite
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.db import connection
 from django.http import HttpRequest
-from unittest.mock import patch
+from django.test.utils import CaptureQueriesContext
+from unittest.mock import MagicMock, patch
+
+from . import admin as curation_admin
+from .models import Article, Category, Tag, TranslatedContent, RSSFeed, RSSItem
+from .admin import (
+    ArticleAdmin,
+    RSSFeedAdmin,
+    RSSItemAdmin,
+    TranslatedContentAdmin,
+    _translated_content_detail_url_parts,
+    summarize_selected_articles,
+)
 
-from .models import TranslatedContent, RSSFeed, RSSItem
-from .admin import TranslatedContentAdmin
+
+@cache
+def _changelist_url():
+    """TranslatedContent changelist URL, resolved once per test run."""
+    return reverse("admin:curation_translatedcontent_changelist")
 
 
 @pytest.mark.django_db
 class TestTranslatedContentAdmin:
     """Test cases for TranslatedContent admin interface."""
 
+    # Shared so the handler's middleware chain is built once for the class
+    client = Client()
+
     def setup_method(self):
         """Set up test data for each test method."""
         # Create superuser for admin access
@@ -26,7 +53,8 @@ class TestTranslatedContentAdmin:
             username="user", email="user@test.com", password="userpass123"
         )
 
-        self.client = Client()
+        # Drop the previous test's session cookie
+        self.client.cookies.clear()
 
         # Create test data
         self.feed = RSSFeed.objects.create(
@@ -46,34 +74,71 @@ class TestTranslatedContentAdmin:
             title="어드민 테스트 콘텐츠",
             slug="admin-test-content",
             description="어드민 테스트 설명입니다.",
-            tags=["admin", "test", "django"],
             written_date="2024-01-15",
             author="어드민 테스트 작성자",
             model_name="admin-test-model",
             source_rss_item=self.rss_item,
             source_url="https://example.com/admin-source",
         )
+        self.translated_content.tags.set(
+            Tag.get_or_create_many(["admin", "test", "django"])
+        )
 
-    def test_admin_list_display(self):
-        """Test that admin list display shows all expected fields."""
-        # Login as admin
-        self.client.login(username="admin", password="adminpass123")
-
-        # Access admin change list
-        url = reverse("admin:curation_translatedcontent_changelist")
+    def _admin_html(self, url):
+        """Fetch an admin page as the superuser and parse it once."""
+        self.client.force_login(self.admin_user)
         response = self.client.get(url)
 
         assert response.status_code == 200
+        parser = lxml.html.HTMLParser(encoding=response.charset)
+        return lxml.html.fromstring(response.content, parser=parser)
 
-        content = response.content.decode()
+    def test_admin_list_display(self):
+        """Test that admin list display shows all expected fields."""
+        tree = self._admin_html(_changelist_url())
+
+        # Check that list_display fields are shown in the content's row
+        (row,) = tree.xpath('//table[@id="result_list"]/tbody/tr')
+        cells = [cell.text_content().strip() for cell in row.xpath("./th | ./td")]
+        assert cells[1:8] == [
+            "어드민 테스트 콘텐츠",  # title
+            "보기",  # view_link
+            "admin-test-content",  # slug
+            "어드민 테스트 작성자",  # author
+            "Jan. 15, 2024",  # written_date
+            "admin-test-model",  # model_name
+            "Admin Test Item",  # source_rss_item
+        ]
+
+    def _changelist_view(self, query):
+        """Call the changelist view directly, skipping the middleware stack."""
+        request = RequestFactory().get(_changelist_url(), query)
+        request.user = self.admin_user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return site._registry[TranslatedContent].changelist_view(request)
+
+    def test_admin_changelist_queries(self):
+        """Test admin search, list filter and date hierarchy on the changelist view."""
+        # A row that none of the queries below should match
+        TranslatedContent.objects.create(
+            title="Other Content",
+            slug="other-content",
+            description="Other description",
+            written_date="2023-06-01",
+            model_name="other-model",
+            source_url="https://example.com/other",
+        )
 
-        # Check that list_display fields are shown
-        assert "어드민 테스트 콘텐츠" in content  # title
-        assert "admin-test-content" in content  # slug
-        assert "어드민 테스트 작성자" in content  # author
-        assert "admin-test-model" in content  # model_name
-        assert "Admin Test Item" in content  # source_rss_item
-        assert "보기" in content  # view_link
+        for query in (
+            {"q": "어드민"},  # search_fields
+            {"model_name__exact": "admin-test-model"},  # list_filter
+            {"written_date__year": "2024"},  # date_hierarchy
+        ):
+            response = self._changelist_view(query)
+
+            assertContains(response, "어드민 테스트 콘텐츠", msg_prefix=str(query))
+            assertNotContains(response, "Other Content", msg_prefix=str(query))
 
     def test_admin_view_link_generation(self):
         """Test the view_link method in admin."""
@@ -110,10 +175,10 @@ class TestTranslatedContentAdmin:
     def test_admin_view_link_functionality(self):
         """Test that view link actually works from admin."""
         # Login as admin
-        self.client.login(username="admin", password="adminpass123")
+        self.client.force_login(self.admin_user)
 
         # Access admin change list
-        changelist_url = reverse("admin:curation_translatedcontent_changelist")
+        changelist_url = _changelist_url()
         response = self.client.get(changelist_url)
 
         assert response.status_code == 200
@@ -127,52 +192,6 @@ class TestTranslatedContentAdmin:
         # Should be accessible (200) or have content issues but still resolve (200)
         assert view_response.status_code == 200
 
-    def test_admin_search_fields(self):
-        """Test admin search functionality."""
-        # Login as admin
-        self.client.login(username="admin", password="adminpass123")
-
-        # Test search by title
-        url = reverse("admin:curation_translatedcontent_changelist")
-        response = self.client.get(url, {"q": "어드민"})
-
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert "어드민 테스트 콘텐츠" in content
-
-    def test_admin_list_filter(self):
-        """Test admin list filters."""
-        # Login as admin
-        self.client.login(username="admin", password="adminpass123")
-
-        # Test filter by model_name
-        url = reverse("admin:curation_translatedcontent_changelist")
-        response = self.client.get(url, {"model_name__exact": "admin-test-model"})
-
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert "어드민 테스트 콘텐츠" in content
-
-    def test_admin_fieldsets(self):
-        """Test admin form fieldsets."""
-        # Login as admin
-        self.client.login(username="admin", password="adminpass123")
-
-        # Access admin change form
-        url = reverse(
-            "admin:curation_translatedcontent_change", args=[self.translated_content.id]
-        )
-        response = self.client.get(url)
-
-        assert response.status_code == 200
-        content = response.content.decode()
-
-        # Check that fieldset sections are present
-        assert "Content Information" in content
-        assert "Content File" in content
-        assert "Source Information" in content
-        assert "Metadata" in content
-
     def test_admin_readonly_fields(self):
         """Test that readonly fields are properly set."""
         admin_site = AdminSite()
@@ -183,41 +202,78 @@ class TestTranslatedContentAdmin:
         assert "created_at" in readonly_fields
         assert "updated_at" in readonly_fields
 
-    def test_admin_queryset_optimization(self):
-        """Test that admin queryset is optimized with select_related."""
-        admin_site = AdminSite()
-        admin = TranslatedContentAdmin(TranslatedContent, admin_site)
-
-        # Create mock request
-        request = HttpRequest()
-
-        # Get queryset
-        queryset = admin.get_queryset(request)
-
-        # Check that select_related is used
-        # This is indicated by checking the query's select_related fields
-        query = str(queryset.query)
-        assert "source_rss_item" in query or "SELECT" in query
-
-    def test_admin_date_hierarchy(self):
-        """Test admin date hierarchy functionality."""
-        # Login as admin
-        self.client.login(username="admin", password="adminpass123")
-
-        # Test date hierarchy by written_date
-        url = reverse("admin:curation_translatedcontent_changelist")
-        response = self.client.get(url, {"written_date__year": "2024"})
+    def _create_sourced_contents(self, count):
+        """Create translated contents that each have their own source item."""
+        rss_items = RSSItem.objects.bulk_create(
+            RSSItem(
+                feed=self.feed,
+                title=f"Source Item {i}",
+                link=f"https://example.com/source-{i}",
+                guid=f"source-{i}",
+                crawling_status="completed",
+            )
+            for i in range(count)
+        )
+        contents = TranslatedContent.objects.bulk_create(
+            TranslatedContent(
+                title=f"추가 콘텐츠 {i}",
+                slug=f"extra-content-{i}",
+                description="추가 설명",
+                model_name="admin-test-model",
+                source_rss_item=rss_item,
+                source_url=f"https://example.com/extra-{i}",
+            )
+            for i, rss_item in enumerate(rss_items)
+        )
+        (tag,) = Tag.get_or_create_many(["admin"])
+        TranslatedContent.tags.through.objects.bulk_create(
+            TranslatedContent.tags.through(translatedcontent=content, tag=tag)
+            for content in contents
+        )
 
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert "어드민 테스트 콘텐츠" in content
+    def test_admin_queryset_optimization(self):
+        """Test that the admin queryset loads sources and tags without N+1."""
+        self._create_sourced_contents(5)
+        admin = TranslatedContentAdmin(TranslatedContent, AdminSite())
+
+        with CaptureQueriesContext(connection) as ctx:
+            contents = list(admin.get_queryset(HttpRequest())[:10])
+            for content in contents:
+                str(content.source_rss_item)
+                str(content.source_rss_item.feed)
+                list(content.tags.all())
+
+        # 본문 쿼리(JOIN) 1번 + 태그 prefetch 1번
+        assert len(ctx.captured_queries) == 2
+        assert "JOIN" in ctx.captured_queries[0]["sql"].upper()
+
+    def test_admin_uses_list_select_related(self):
+        """Test that the changelist joins the source item shown in list_display."""
+        assert "source_rss_item" in TranslatedContentAdmin.list_display
+        assert "source_rss_item" in TranslatedContentAdmin.list_select_related
+
+    def test_admin_changelist_query_count_is_constant(self):
+        """Test that the changelist query count does not grow with rows."""
+        self.client.force_login(self.admin_user)
+        url = _changelist_url()
+
+        def changelist_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            assert response.status_code == 200
+            return len(ctx.captured_queries)
+
+        single_row_queries = changelist_queries()
+        self._create_sourced_contents(10)
+
+        assert changelist_queries() == single_row_queries
 
     def test_admin_permissions(self):
         """Test admin permissions for regular users."""
         # Try to access admin as regular user (should be redirected to login)
-        self.client.login(username="user", password="userpass123")
+        self.client.force_login(self.regular_user)
 
-        url = reverse("admin:curation_translatedcontent_changelist")
+        url = _changelist_url()
         response = self.client.get(url)
 
         # Should redirect to login or show permission denied
@@ -225,61 +281,60 @@ class TestTranslatedContentAdmin:
 
     def test_admin_add_form(self):
         """Test admin add form."""
-        # Login as admin
-        self.client.login(username="admin", password="adminpass123")
-
-        # Access admin add form
-        url = reverse("admin:curation_translatedcontent_add")
-        response = self.client.get(url)
-
-        assert response.status_code == 200
-        content = response.content.decode()
+        tree = self._admin_html(reverse("admin:curation_translatedcontent_add"))
 
         # Check that form fields are present
-        assert 'name="title"' in content
-        assert 'name="slug"' in content
-        assert 'name="description"' in content
-        assert 'name="model_name"' in content
-        assert 'name="source_url"' in content
+        field_names = set(tree.xpath("//form//*[self::input or self::textarea]/@name"))
+        assert {
+            "title",
+            "slug",
+            "description",
+            "model_name",
+            "source_url",
+        } <= field_names
 
     def test_admin_change_form(self):
-        """Test admin change form."""
-        # Login as admin
-        self.client.login(username="admin", password="adminpass123")
-
-        # Access admin change form
-        url = reverse(
-            "admin:curation_translatedcontent_change", args=[self.translated_content.id]
+        """Test admin change form fieldsets and pre-populated values."""
+        tree = self._admin_html(
+            reverse(
+                "admin:curation_translatedcontent_change",
+                args=[self.translated_content.id],
+            )
         )
-        response = self.client.get(url)
 
-        assert response.status_code == 200
-        content = response.content.decode()
+        # Check that fieldset sections are present
+        headings = [heading.strip() for heading in tree.xpath("//fieldset//h2/text()")]
+        assert headings == [
+            "Content Information",
+            "Content File",
+            "Source Information",
+            "Metadata",
+        ]
 
         # Check that existing values are pre-populated
-        assert (
-            'value="어드민 테스트 콘텐츠"' in content
-            or "어드민 테스트 콘텐츠" in content
-        )
-        assert (
-            'value="admin-test-content"' in content or "admin-test-content" in content
-        )
+        assert tree.xpath('//input[@name="title"]/@value') == ["어드민 테스트 콘텐츠"]
+        assert tree.xpath('//input[@name="slug"]/@value') == ["admin-test-content"]
 
-    @patch("curation.admin.reverse")
+    @patch.object(curation_admin, "reverse", autospec=True)
     def test_admin_view_link_url_generation(self, mock_reverse):
-        """Test that view_link generates correct URL."""
-        mock_reverse.return_value = "/tr/123/"
+        """Test that view_link resolves the URL once and formats it per row."""
+        mock_reverse.return_value = "/tr/0/"
+        _translated_content_detail_url_parts.cache_clear()
 
         admin_site = AdminSite()
         admin = TranslatedContentAdmin(TranslatedContent, admin_site)
 
-        link_html = admin.view_link(self.translated_content)
+        try:
+            link_html = admin.view_link(self.translated_content)
+            admin.view_link(self.translated_content)
+        finally:
+            _translated_content_detail_url_parts.cache_clear()
 
         mock_reverse.assert_called_once_with(
-            "curation:translated_content_detail", args=[self.translated_content.pk]
+            "curation:translated_content_detail", args=[0]
         )
 
-        assert "/tr/123/" in link_html
+        assert f"/tr/{self.translated_content.pk}/" in link_html
 
     def test_admin_list_display_methods(self):
         """Test that all list_display methods work correctly."""
@@ -305,10 +360,10 @@ class TestTranslatedContentAdmin:
     def test_admin_integration_with_view(self):
         """Test integration between admin and the detail view."""
         # Login as admin
-        self.client.login(username="admin", password="adminpass123")
+        self.client.force_login(self.admin_user)
 
         # Get the admin change list
-        changelist_url = reverse("admin:curation_translatedcontent_changelist")
+        changelist_url = _changelist_url()
         changelist_response = self.client.get(changelist_url)
 
         assert changelist_response.status_code == 200
@@ -319,12 +374,12 @@ class TestTranslatedContentAdmin:
         )
 
         # Test that the detail view works
-        with patch("os.path.exists", return_value=False):
+        with patch.object(os.path, "exists", return_value=False):
             detail_response = self.client.get(detail_url)
             assert detail_response.status_code == 200
 
     def test_admin_bulk_operations(self):
-        """Test admin bulk operations."""
+        """Test the delete_selected bulk action."""
         # Create additional content for bulk testing
         additional_content = TranslatedContent.objects.create(
             title="추가 콘텐츠",
@@ -334,22 +389,23 @@ class TestTranslatedContentAdmin:
             source_url="https://example.com/additional",
         )
 
-        # Login as admin
-        self.client.login(username="admin", password="adminpass123")
-
-        # Test bulk delete
-        url = reverse("admin:curation_translatedcontent_changelist")
-        response = self.client.post(
-            url,
-            {
-                "action": "delete_selected",
-                "_selected_action": [str(additional_content.id)],
-                "post": "yes",
-            },
-        )
+        # Run the bulk delete action directly, as if the confirmation was posted
+        model_admin = site._registry[TranslatedContent]
+        request = RequestFactory().post("/", {"post": "yes"})
+        request.user = self.admin_user
+
+        with patch.object(model_admin, "message_user") as mock_message:
+            response = delete_selected(
+                model_admin,
+                request,
+                TranslatedContent.objects.filter(pk=additional_content.pk),
+            )
 
-        # Should either process the action or show confirmation
-        assert response.status_code in [200, 302]
+        # Confirmed deletes return to the changelist without rendering a page
+        assert response is None
+        mock_message.assert_called_once()
+        assert not TranslatedContent.objects.filter(pk=additional_content.pk).exists()
+        assert TranslatedContent.objects.filter(pk=self.translated_content.pk).exists()
 
     def test_admin_model_registration(self):
         """Test that TranslatedContent model is properly registered with admin."""
@@ -361,3 +417,183 @@ class TestTranslatedContentAdmin:
         # Check that it's registered with the correct admin class
         admin_class = admin.site._registry[TranslatedContent]
         assert isinstance(admin_class, TranslatedContentAdmin)
+
+
+@pytest.mark.django_db
+class TestArticleAdmin:
+    """Test cases for Article admin interface."""
+
+    def setup_method(self):
+        self.web = Category.objects.create(name="Web Development")
+        self.llm = Category.objects.create(name="Large Language Models")
+        self.article = Article.objects.create(
+            url="https://example.com/article", title="Admin Article"
+        )
+        self.article.categories.add(self.web, self.llm)
+        self.empty_article = Article.objects.create(
+            url="https://example.com/empty", title="Empty Article"
+        )
+
+    def test_display_categories_uses_prefetch(self):
+        """display_categories should not query once categories are prefetched."""
+        admin = ArticleAdmin(Article, AdminSite())
+        articles = list(admin.get_queryset(HttpRequest()).order_by("id"))
+
+        with CaptureQueriesContext(connection) as ctx:
+            results = [admin.display_categories(article) for article in articles]
+
+        assert len(ctx.captured_queries) == 0
+        assert results == ["Large Language Models, Web Development", "-"]
+
+    def test_summary_previews_use_truncated_annotations(self):
+        """Previews should be built from the DB-side substrings."""
+        self.article.summary = "a" * 300
+        self.article.summary_ko = "가" * 30
+        self.article.save()
+        admin = ArticleAdmin(Article, AdminSite())
+        article = admin.get_queryset(HttpRequest()).get(pk=self.article.pk)
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert admin.summary_preview(article) == "a" * 100 + "..."
+            assert admin.summary_ko_preview(article) == "가" * 30
+
+        assert len(ctx.captured_queries) == 0
+        assert (
+            admin.summary_preview(
+                admin.get_queryset(HttpRequest()).get(pk=self.empty_article.pk)
+            )
+            == "No summary available"
+        )
+
+    def test_summary_ko_preview_reports_translation_error(self):
+        """A failed translation should show its whole stored error message."""
+        error = "Translation Error: " + "quota exceeded " * 5
+        self.article.summary_ko = error
+        self.article.summary_ko_error = True
+        self.article.save()
+        admin = ArticleAdmin(Article, AdminSite())
+        article = admin.get_queryset(HttpRequest()).get(pk=self.article.pk)
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert admin.summary_ko_preview(article) == error
+
+        assert len(ctx.captured_queries) == 0
+
+    def test_summarize_selected_articles_queues_tasks(self):
+        """The summarize action should enqueue one Celery task per article."""
+        modeladmin = MagicMock()
+
+        with patch("curation.tasks.process_article.delay") as mock_delay:
+            mock_delay.return_value.id = "task-1"
+            summarize_selected_articles(
+                modeladmin, HttpRequest(), Article.objects.filter(pk=self.article.pk)
+            )
+
+        mock_delay.assert_called_once_with(self.article.pk)
+        message = modeladmin.message_user.call_args.args[1]
+        assert "Queued 1 article(s)" in message
+
+    def test_summarize_selected_articles_reports_queue_errors(self):
+        """Articles that could not be queued should be reported."""
+        modeladmin = MagicMock()
+
+        with patch(
+            "curation.tasks.process_article.delay",
+            side_effect=Exception("broker down"),
+        ):
+            summarize_selected_articles(
+                modeladmin, HttpRequest(), Article.objects.filter(pk=self.article.pk)
+            )
+
+        message = modeladmin.message_user.call_args.args[1]
+        assert f"{self.article.url}: broker down" in message
+
+
+@pytest.mark.django_db
+class TestRSSFeedAdmin:
+    """Test cases for RSSFeed admin interface."""
+
+    def test_item_count_is_annotated(self):
+        """item_count should come from a single annotated query."""
+        feed = RSSFeed.objects.create(name="Feed", url="https://example.com/feed.xml")
+        empty_feed = RSSFeed.objects.create(
+            name="Empty Feed", url="https://example.com/empty.xml"
+        )
+        for i in range(3):
+            RSSItem.objects.create(
+                feed=feed,
+                title=f"Item {i}",
+                link=f"https://example.com/{i}",
+                guid=f"{i}",
+            )
+
+        admin = RSSFeedAdmin(RSSFeed, AdminSite())
+        with CaptureQueriesContext(connection) as ctx:
+            counts = {
+                f.pk: admin.item_count(f) for f in admin.get_queryset(HttpRequest())
+            }
+
+        assert len(ctx.captured_queries) == 1
+        assert counts == {feed.pk: 3, empty_feed.pk: 0}
+
+    def test_crawl_selected_feeds_queues_tasks(self):
+        """The crawl action should enqueue one Celery task per feed."""
+        feed = RSSFeed.objects.create(name="Feed", url="https://example.com/feed.xml")
+        admin = RSSFeedAdmin(RSSFeed, AdminSite())
+
+        with (
+            patch("curation.tasks.crawl_single_rss_feed.delay") as mock_delay,
+            patch.object(admin, "message_user") as mock_message,
+        ):
+            mock_delay.return_value.id = "task-1"
+            admin.crawl_selected_feeds(HttpRequest(), RSSFeed.objects.all())
+
+        mock_delay.assert_called_once_with(feed.id)
+        assert "Queued 1 crawl job(s)." in mock_message.call_args.args[1]
+
+    def test_crawl_selected_feeds_caps_reported_errors(self):
+        """Only the first errors should be listed, with a count of the rest."""
+        for i in range(25):
+            RSSFeed.objects.create(name=f"Feed {i}", url=f"https://example.com/{i}.xml")
+        admin = RSSFeedAdmin(RSSFeed, AdminSite())
+
+        with (
+            patch(
+                "curation.tasks.crawl_single_rss_feed.delay",
+                side_effect=Exception("broker down"),
+            ),
+            patch.object(admin, "message_user") as mock_message,
+        ):
+            admin.crawl_selected_feeds(HttpRequest(), RSSFeed.objects.all())
+
+        error_message = mock_message.call_args.args[1]
+        assert error_message.count("broker down") == 20
+        assert error_message.endswith("...and 5 more")
+
+
+@pytest.mark.django_db
+class TestRSSItemAdmin:
+    """Test cases for RSSItem admin interface."""
+
+    def setup_method(self):
+        self.feed = RSSFeed.objects.create(
+            name="Feed", url="https://example.com/feed.xml"
+        )
+        self.admin = RSSItemAdmin(RSSItem, AdminSite())
+
+    def _fieldset_names(self, language):
+        item = RSSItem(feed=self.feed, title="Item", language=language)
+        return [name for name, _ in self.admin.get_fieldsets(HttpRequest(), item)]
+
+    def test_fieldsets_follow_content_language(self):
+        """The language-specific fieldset should depend on the detected language."""
+        korean = self._fieldset_names("ko")
+        foreign = self._fieldset_names("en")
+        pending = self._fieldset_names("")
+
+        assert korean[3] == "🇰🇷 Korean Content Processing"
+        assert foreign[3] == "🌐 Copyright Analysis (Foreign Content)"
+        assert pending[3] == "🔍 Content Analysis"
+        for names in (korean, foreign, pending):
+            assert names[:3] == ["⚠️ 법적 고지", "Item Information", "Content"]
+            assert names[4:] == ["Crawling Status", "Translation Status", "Metadata"]
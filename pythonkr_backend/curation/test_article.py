@@ -0,0 +1,479 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+import httpx
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .models import DEFINED_CATEGORY_NAMES, Article, Category
+
+
+@pytest.mark.django_db
+class TestArticleCategorization:
+    """Test cases for Article.assign_categories."""
+
+    def setup_method(self):
+        """Set up test data for each test method."""
+        Article._ensure_defined_categories.cache_clear()
+        self.article = Article.objects.create(
+            url="https://example.com/article",
+            title="Test Article",
+            summary="An article about Django and LLMs.",
+        )
+
+    @patch("curation.models.categorize_summary")
+    def test_assign_categories_seeds_defined_categories(self, mock_categorize):
+        """Missing categories should be created once, with slugs."""
+        mock_categorize.return_value = '{"categories": ["Web Development"]}'
+
+        self.article.assign_categories()
+        self.article.assign_categories()
+
+        assert sorted(Category.objects.values_list("name", flat=True)) == sorted(
+            DEFINED_CATEGORY_NAMES
+        )
+        assert Category.objects.get(name="Large Language Models").slug == (
+            "large-language-models"
+        )
+
+    @patch("curation.models.categorize_summary")
+    def test_assign_categories_sets_valid_categories(self, mock_categorize):
+        """Only categories from the defined list should be assigned."""
+        mock_categorize.return_value = (
+            '{"categories": [" Web Development", "Large Language Models", "Cooking"]}'
+        )
+
+        status = self.article.assign_categories()
+
+        assert sorted(c.name for c in self.article.categories.all()) == [
+            "Large Language Models",
+            "Web Development",
+        ]
+        assert status.startswith("Article categories set to:")
+
+    @patch("curation.models.categorize_summary")
+    def test_assign_categories_replaces_previous_categories(self, mock_categorize):
+        """Re-categorizing should drop categories that no longer apply."""
+        mock_categorize.return_value = '{"categories": ["Data Science"]}'
+        self.article.assign_categories()
+
+        mock_categorize.return_value = '{"categories": ["MLOps"]}'
+        self.article.assign_categories()
+
+        assert [c.name for c in self.article.categories.all()] == ["MLOps"]
+
+    @patch("curation.models.categorize_summary")
+    def test_assign_categories_query_count(self, mock_categorize):
+        """Once categories are seeded, assignment should not re-query them."""
+        mock_categorize.return_value = (
+            '{"categories": ["Data Science", "MLOps", "Data Science"]}'
+        )
+        self.article.assign_categories()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.article.assign_categories()
+
+        category_selects = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('SELECT "curation_category"')
+            and "curation_article_categories" not in q["sql"]
+        ]
+        assert len(category_selects) == 0
+        assert sorted(c.name for c in self.article.categories.all()) == [
+            "Data Science",
+            "MLOps",
+        ]
+
+    @patch("curation.models.categorize_summary")
+    def test_defined_categories_are_cached(self, mock_categorize):
+        """The category map should be reused until a Category changes."""
+        mock_categorize.return_value = '{"categories": ["MLOps"]}'
+        self.article.assign_categories()
+
+        with CaptureQueriesContext(connection) as ctx:
+            Article._ensure_defined_categories()
+        assert len(ctx.captured_queries) == 0
+
+        other = Category.objects.get(name="Other")
+        other.delete()
+        categories = Article._ensure_defined_categories()
+
+        assert categories["Other"].pk != other.pk
+        assert categories["Other"].pk is not None
+
+    @patch("curation.models.categorize_summary")
+    def test_assign_categories_truncates_summary(self, mock_categorize):
+        """Only the start of a long summary should be sent to the categorizer."""
+        mock_categorize.return_value = '{"categories": ["MLOps"]}'
+        self.article.summary = "x" * 5000
+
+        self.article.assign_categories()
+
+        assert len(mock_categorize.call_args.args[0]) == 2000
+
+    @patch("curation.models.categorize_summary")
+    def test_assign_categories_other(self, mock_categorize):
+        """An 'Other' response should assign the Other category."""
+        mock_categorize.return_value = '{"categories": ["Other"]}'
+
+        self.article.assign_categories()
+
+        assert [c.name for c in self.article.categories.all()] == ["Other"]
+
+    @patch("curation.models.categorize_summary")
+    def test_assign_categories_unparseable_response(self, mock_categorize):
+        """A response that is not the expected JSON should assign nothing."""
+        mock_categorize.return_value = "Web Development, MLOps"
+
+        status = self.article.assign_categories()
+
+        assert status == "Warning: No valid categories assigned based on LLM response."
+        assert not self.article.categories.exists()
+
+    def test_assign_categories_without_summary(self):
+        """Without a summary, existing categories should be cleared."""
+        self.article.categories.add(Category.objects.create(name="MLOps"))
+        self.article.summary = ""
+
+        status = self.article.assign_categories()
+
+        assert status == "Error: No summary available to categorize."
+        assert not self.article.categories.exists()
+
+
+@pytest.mark.django_db
+class TestArticleTranslation:
+    """Test cases for Article.translate_summary_to_korean."""
+
+    def setup_method(self):
+        """Set up test data for each test method."""
+        self.article = Article.objects.create(
+            url="https://example.com/article",
+            title="Test Article",
+            summary="A short summary.",
+        )
+
+    @patch("curation.models.translate_to_korean", return_value="번역된 요약")
+    def test_translate_updates_translation_fields(self, mock_translate):
+        """The translation should be written without touching other fields."""
+        Article.objects.filter(pk=self.article.pk).update(title="Edited elsewhere")
+        previous_updated_at = self.article.updated_at
+
+        with patch("django.db.models.signals.pre_save.send") as mock_pre_save:
+            status = self.article.translate_summary_to_korean()
+
+        mock_pre_save.assert_not_called()
+        assert status == "Summary translated successfully using OpenAI."
+        self.article.refresh_from_db()
+        assert self.article.summary_ko == "번역된 요약"
+        assert self.article.title == "Edited elsewhere"
+        assert self.article.updated_at > previous_updated_at
+
+    @patch("curation.models.translate_to_korean", side_effect=Exception("API down"))
+    def test_translate_error_sets_flag(self, mock_translate):
+        """A failed translation should persist the error flag."""
+        status = self.article.translate_summary_to_korean()
+
+        assert status.startswith("Error during OpenAI translation")
+        self.article.refresh_from_db()
+        assert self.article.summary_ko == "Translation Error: API down"
+        assert self.article.summary_ko_error is True
+
+
+@pytest.mark.django_db
+class TestArticleManager:
+    """Test cases for the default Article manager."""
+
+    def test_categories_are_prefetched(self):
+        """Listing articles with categories should not query per article."""
+        category = Category.objects.create(name="MLOps")
+        for i in range(3):
+            article = Article.objects.create(url=f"https://example.com/{i}")
+            article.categories.add(category)
+
+        with CaptureQueriesContext(connection) as ctx:
+            names = [
+                [c.name for c in article.categories.all()]
+                for article in Article.objects.all()
+            ]
+
+        assert len(ctx.captured_queries) == 2
+        assert names == [["MLOps"]] * 3
+
+    def test_for_listing_skips_summaries(self):
+        """for_listing should not load the summary text fields."""
+        Article.objects.create(
+            url="https://example.com/long", summary="x" * 1000, summary_ko="y"
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            article = Article.objects.for_listing().get()
+
+        assert "summary" not in ctx.captured_queries[0]["sql"]
+        assert article.get_deferred_fields() >= {"summary", "summary_ko"}
+
+
+@pytest.mark.django_db
+class TestCategorySlug:
+    """Test cases for Category slug generation."""
+
+    def test_blank_slug_is_generated(self):
+        """Saving a category without a slug should slugify its name."""
+        category = Category.objects.create(name="Large Language Models")
+
+        assert category.slug == "large-language-models"
+
+    def test_explicit_slug_is_kept(self):
+        """An explicit slug should not be overwritten."""
+        category = Category.objects.create(name="Large Language Models", slug="llm")
+        category.name = "LLMs"
+        category.save()
+
+        assert category.slug == "llm"
+
+
+class TestArticleReadingTime:
+    """Test cases for Article.calculate_reading_time."""
+
+    def test_reading_time_rounds_up_words(self):
+        """Reading time should be words / 265 rounded up, at least one minute."""
+        article = Article()
+
+        article.calculate_reading_time("word " * 10)
+        assert article.reading_time_minutes == 1
+
+        article.calculate_reading_time("word " * 266)
+        assert article.reading_time_minutes == 2
+
+    def test_reading_time_without_text(self):
+        """Empty text should leave the reading time unset."""
+        article = Article(reading_time_minutes=3)
+
+        article.calculate_reading_time("")
+
+        assert article.reading_time_minutes is None
+
+
+@pytest.mark.django_db
+class TestArticleFetchAndSummarize:
+    """Test cases for Article.fetch_and_summarize."""
+
+    def setup_method(self):
+        """Set up test data for each test method."""
+        Article._ensure_defined_categories.cache_clear()
+        self.article = Article.objects.create(
+            url="https://example.com/article", title="Test Article"
+        )
+
+    @patch(
+        "curation.models.acategorize_summary",
+        new_callable=AsyncMock,
+        return_value='{"categories": ["MLOps"]}',
+    )
+    @patch(
+        "curation.models.atranslate_to_korean",
+        new_callable=AsyncMock,
+        return_value=" 번역된 요약 ",
+    )
+    @patch(
+        "curation.models.aget_summary_from_url",
+        new_callable=AsyncMock,
+        return_value="A short summary.",
+    )
+    def test_fetch_and_summarize_saves_once(
+        self, mock_summary, mock_translate, mock_categorize
+    ):
+        """All generated fields should be written with a single UPDATE."""
+        with CaptureQueriesContext(connection) as ctx:
+            succeeded, result = self.article.fetch_and_summarize()
+
+        article_updates = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "curation_article"')
+        ]
+        assert len(article_updates) == 1
+        assert succeeded is True
+        assert "Translation completed." in result
+        mock_translate.assert_awaited_once_with("A short summary.")
+        mock_categorize.assert_awaited_once()
+
+        self.article.refresh_from_db()
+        assert self.article.summary == "A short summary."
+        assert self.article.summary_ko == "번역된 요약"
+        assert self.article.summary_ko_error is False
+        assert [c.name for c in self.article.categories.all()] == ["MLOps"]
+
+    @patch(
+        "curation.models.acategorize_summary",
+        new_callable=AsyncMock,
+        return_value='{"categories": ["MLOps"]}',
+    )
+    @patch(
+        "curation.models.atranslate_to_korean",
+        new_callable=AsyncMock,
+        side_effect=Exception("API down"),
+    )
+    @patch(
+        "curation.models.aget_summary_from_url",
+        new_callable=AsyncMock,
+        return_value="A short summary.",
+    )
+    def test_fetch_and_summarize_translation_error(
+        self, mock_summary, mock_translate, mock_categorize
+    ):
+        """A translation failure should be persisted as the error flag."""
+        succeeded, result = self.article.fetch_and_summarize()
+
+        assert succeeded is False
+        assert "Translation failed." in result
+        self.article.refresh_from_db()
+        assert self.article.summary_ko == "Translation Error: API down"
+        assert self.article.summary_ko_error is True
+
+    @patch(
+        "curation.models.aget_summary_from_url",
+        new_callable=AsyncMock,
+        side_effect=httpx.ConnectError("Connection failed"),
+    )
+    def test_fetch_and_summarize_network_error(self, mock_summary):
+        """Transient errors should be reported instead of raised."""
+        succeeded, result = self.article.fetch_and_summarize()
+
+        assert succeeded is False
+        assert result.startswith("Unexpected error processing article")
+
+
+@pytest.mark.django_db
+class TestArticleAsyncFetchAndSummarize:
+    """Test cases for Article.afetch_and_summarize."""
+
+    def setup_method(self):
+        """Set up test data for each test method."""
+        Article._ensure_defined_categories.cache_clear()
+        self.article = Article.objects.create(
+            url="https://example.com/article", title="Test Article"
+        )
+
+    @patch("curation.models.acategorize_summary", new_callable=AsyncMock)
+    @patch("curation.models.atranslate_to_korean", new_callable=AsyncMock)
+    @patch("curation.models.aget_summary_from_url", new_callable=AsyncMock)
+    def test_afetch_and_summarize_runs_llm_calls(
+        self, mock_summary, mock_translate, mock_categorize
+    ):
+        """Translation and categorization results should both be saved."""
+        mock_summary.return_value = "A short summary."
+        mock_translate.return_value = "번역된 요약"
+        mock_categorize.return_value = '{"categories": ["Data Science", "MLOps"]}'
+
+        succeeded, result = async_to_sync(self.article.afetch_and_summarize)()
+
+        assert succeeded is True
+        assert "Translation completed." in result
+        mock_translate.assert_awaited_once_with("A short summary.")
+        assert mock_categorize.await_args.args[0] == "A short summary."
+
+        self.article.refresh_from_db()
+        assert self.article.summary_ko == "번역된 요약"
+        assert sorted(c.name for c in self.article.categories.all()) == [
+            "Data Science",
+            "MLOps",
+        ]
+
+    @patch("curation.models.acategorize_summary", new_callable=AsyncMock)
+    @patch("curation.models.atranslate_to_korean", new_callable=AsyncMock)
+    @patch("curation.models.aget_summary_from_url", new_callable=AsyncMock)
+    def test_afetch_and_summarize_translation_error(
+        self, mock_summary, mock_translate, mock_categorize
+    ):
+        """A failed translation should not prevent categorization."""
+        mock_summary.return_value = "A short summary."
+        mock_translate.side_effect = Exception("API down")
+        mock_categorize.return_value = '{"categories": ["MLOps"]}'
+
+        succeeded, result = async_to_sync(self.article.afetch_and_summarize)()
+
+        assert succeeded is False
+        assert "Translation failed." in result
+        self.article.refresh_from_db()
+        assert self.article.summary_ko_error is True
+        assert [c.name for c in self.article.categories.all()] == ["MLOps"]
+
+
+@pytest.mark.django_db
+class TestArticleBulkIngest:
+    """Test cases for Article.bulk_ingest."""
+
+    def setup_method(self):
+        """Start each test without cached categories."""
+        Article._ensure_defined_categories.cache_clear()
+
+    @patch("curation.models.acategorize_summary", new_callable=AsyncMock)
+    @patch("curation.models.atranslate_to_korean", new_callable=AsyncMock)
+    @patch("curation.models.aget_summary_from_url", new_callable=AsyncMock)
+    def test_bulk_ingest_creates_articles(
+        self, mock_summary, mock_translate, mock_categorize
+    ):
+        """New URLs should be created and categorized with bulk INSERTs."""
+        Article.objects.create(url="https://example.com/existing")
+        mock_summary.side_effect = lambda url: f"Summary of {url}"
+        mock_translate.side_effect = lambda text: f"번역: {text}"
+        mock_categorize.return_value = '{"categories": ["MLOps", "Data Science"]}'
+        urls = [
+            "https://example.com/existing",
+            "https://example.com/1",
+            "https://example.com/2",
+            "https://example.com/1",
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            articles = Article.bulk_ingest(urls)
+
+        inserts = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith(
+                (
+                    'INSERT INTO "curation_article"',
+                    'INSERT OR IGNORE INTO "curation_article',
+                )
+            )
+        ]
+        assert len(inserts) == 2
+        assert sorted(a.url for a in articles) == [
+            "https://example.com/1",
+            "https://example.com/2",
+        ]
+        article = Article.objects.get(url="https://example.com/1")
+        assert article.summary_ko == "번역: Summary of https://example.com/1"
+        assert sorted(c.name for c in article.categories.all()) == [
+            "Data Science",
+            "MLOps",
+        ]
+        assert mock_summary.await_count == 2
+
+    @patch("curation.models.acategorize_summary", new_callable=AsyncMock)
+    @patch("curation.models.atranslate_to_korean", new_callable=AsyncMock)
+    @patch("curation.models.aget_summary_from_url", new_callable=AsyncMock)
+    def test_bulk_ingest_records_failures(
+        self, mock_summary, mock_translate, mock_categorize
+    ):
+        """Failed LLM calls should leave the article in place without results."""
+        mock_summary.side_effect = lambda url: (
+            "" if url.endswith("empty") else "A summary."
+        )
+        mock_translate.side_effect = Exception("API down")
+        mock_categorize.side_effect = Exception("API down")
+
+        Article.bulk_ingest(["https://example.com/empty", "https://example.com/ok"])
+
+        empty = Article.objects.get(url="https://example.com/empty")
+        ok = Article.objects.get(url="https://example.com/ok")
+        assert empty.summary == ""
+        assert empty.summary_ko_error is False
+        assert ok.summary == "A summary."
+        assert ok.summary_ko_error is True
+        assert ok.summary_ko.startswith("Translation Error: ")
+        assert not ok.categories.exists()
+        mock_translate.assert_awaited_once_with("A summary.")
@@ -1,10 +1,13 @@
 import pytest
 from unittest.mock import patch
 from datetime import datetime, timedelta
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 import pytz
 
-from .models import LLMService, LLMUsage
+from .models import LLMService, LLMUsage, LLMUsageDaily
 
 
 @pytest.mark.django_db
@@ -13,6 +16,7 @@ class TestLLMService:
 
     def setup_method(self):
         """Set up test data for each test method."""
+        caches["llm"].clear()
         # Create test LLM services with different priorities
         self.gemini_service = LLMService.objects.create(
             provider="gemini", priority=1, is_active=True
@@ -219,6 +223,25 @@ class TestLLMService:
         assert "gpt-4.5-preview-2025-02-27" not in available_models
         assert "gpt-4.1-mini-2025-04-14" in available_models
 
+    @pytest.mark.parametrize("provider", ["gemini", "openai"])
+    def test_get_available_models_for_provider_single_query(self, provider):
+        """Usage for all models of a provider should be read in one query."""
+        model_configs = {
+            "google-gla:gemini-2.5-pro-preview-06-05": {"daily_requests": 25},
+            "google-gla:gemini-2.5-flash-preview-05-20": {"daily_requests": 500},
+            "openai:gpt-4.1-2025-04-14": {"daily_tokens": 250000},
+            "openai:gpt-4.5-preview-2025-02-27": {"daily_tokens": 250000},
+            "openai:gpt-4.1-mini-2025-04-14": {"daily_tokens": 2500000},
+        }
+
+        with CaptureQueriesContext(connection) as ctx:
+            available_models = LLMService._get_available_models_for_provider(
+                provider, model_configs
+            )
+
+        assert len(ctx.captured_queries) == 1
+        assert len(available_models) == {"gemini": 2, "openai": 3}[provider]
+
     def test_get_available_models_for_provider_claude_always_available(self):
         """Test that Claude is always available as fallback."""
         model_configs = {}  # Empty config
@@ -277,6 +300,62 @@ class TestLLMService:
             # Should be available since it's a new Pacific day
             assert "gemini-2.5-pro-preview-06-05" in available_models
 
+    def test_get_llm_provider_model_caches_quota(self):
+        """Quota lookups should be cached until new usage is recorded."""
+        with patch.object(
+            LLMService,
+            "_get_available_models_for_provider",
+            wraps=LLMService._get_available_models_for_provider,
+        ) as mock_get_available:
+            assert LLMService.get_llm_provider_model() == (
+                "gemini",
+                "gemini-2.5-pro-preview-06-05",
+            )
+            LLMService.get_llm_provider_model()
+            assert mock_get_available.call_count == 1
+
+            for _ in range(25):
+                LLMUsage.objects.create(
+                    model_name="google-gla:gemini-2.5-pro-preview-06-05",
+                    input_tokens=10,
+                    output_tokens=10,
+                    total_tokens=20,
+                )
+
+            assert LLMService.get_llm_provider_model() == (
+                "gemini",
+                "gemini-2.5-flash-preview-05-20",
+            )
+            assert mock_get_available.call_count == 2
+
+    def test_llm_usage_rolls_into_daily_totals(self):
+        """Each LLMUsage row should increment its model's daily totals."""
+        for total_tokens in (100, 250):
+            LLMUsage.objects.create(
+                model_name="openai:gpt-4.1-mini-2025-04-14",
+                input_tokens=0,
+                output_tokens=0,
+                total_tokens=total_tokens,
+            )
+
+        daily = LLMUsageDaily.objects.get(model_name="openai:gpt-4.1-mini-2025-04-14")
+        assert daily.day == timezone.now().astimezone(pytz.UTC).date()
+        assert daily.total_tokens == 350
+        assert daily.total_requests == 2
+
+    def test_quota_day_uses_pacific_time_for_gemini(self):
+        """Gemini usage should count against the Pacific day, others against UTC."""
+        moment = pytz.UTC.localize(datetime(2024, 1, 16, 3, 0, 0))
+
+        assert (
+            LLMUsageDaily.quota_day("google-gla:gemini-2.5-pro-preview-06-05", moment)
+            == datetime(2024, 1, 15).date()
+        )
+        assert (
+            LLMUsageDaily.quota_day("openai:gpt-4.1-2025-04-14", moment)
+            == datetime(2024, 1, 16).date()
+        )
+
     def test_meta_options(self):
         """Test model meta options."""
         meta = LLMService._meta
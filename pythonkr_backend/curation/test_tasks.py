@@ -1,19 +1,49 @@
 import pytest
-from unittest.mock import patch, MagicMock
-from datetime import timedelta
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
+from unittest.mock import AsyncMock, patch, MagicMock
+from datetime import datetime, timedelta, timezone as dt_timezone
 from django.utils import timezone
-import requests
+import feedparser
+import httpx
+from celery.exceptions import Retry
 
-from .models import RSSFeed, RSSItem
+from .models import Article, RSSFeed, RSSItem
+from .utils import LLMRateLimitError
 from .tasks import (
+    RSS_CONTENT_BATCH_SIZE,
+    RSS_CONTENT_CLAIM_TIMEOUT,
+    aggregate_rss_crawl_results,
+    bulk_summarize_articles,
+    process_article,
     crawl_all_rss_feeds,
+    crawl_rss_feed_batch,
     crawl_single_rss_feed,
     crawl_rss,
     crawl_rss_item_content,
+    process_newsletter_items,
+    analyze_content_copyright,
+    analyze_item_copyright,
+    run_rss_pipeline,
     translate_pending_rss_item,
 )
 
 
+def _entry(fields):
+    """Build a feed entry the way feedparser does, with key aliases applied."""
+    entry = feedparser.FeedParserDict()
+    for key, value in fields.items():
+        entry[key] = value
+    return entry
+
+
+RSS_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>First</title><link>https://example.com/first</link><guid>first</guid></item>
+<item><title>Second</title><link>https://example.com/second</link><guid>second</guid></item>
+</channel></rss>"""
+
+
 @pytest.mark.django_db
 class TestRSSCrawlingTasks:
     """Test cases for RSS crawling tasks and functions."""
@@ -31,58 +61,156 @@ class TestRSSCrawlingTasks:
             url="https://example.com/inactive.xml",
             is_active=False,
         )
+        # Single-feed crawls download through the shared client; the tests
+        # below patch feedparser.parse to control the parsed entries
+        self.http_patcher = self._patch_http_client(
+            lambda request: httpx.Response(200, content=b"")
+        )
+        self.http_patcher.start()
+
+    def teardown_method(self):
+        """Stop the default HTTP client patch."""
+        self.http_patcher.stop()
+
+    def _patch_http_client(self, handler):
+        """Route single-feed downloads through an httpx.MockTransport."""
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        return patch("curation.tasks._rss_http_client", return_value=client)
+
+    def _patch_async_client(self, handler):
+        """Route async downloads through an httpx.MockTransport."""
+        transport = httpx.MockTransport(handler)
+        real_client = httpx.AsyncClient
+        return patch(
+            "curation.tasks.httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        )
 
     def test_crawl_all_rss_feeds_success(self):
-        """Test crawl_all_rss_feeds with successful crawling."""
-        with patch("curation.tasks.crawl_single_rss_feed") as mock_crawl:
-            mock_crawl.return_value = {"new_items": 3}
-
+        """Test crawl_all_rss_feeds fans out over active feeds and aggregates."""
+        requested_urls = []
+
+        def handler(request):
+            requested_urls.append(str(request.url))
+            return httpx.Response(200, content=RSS_XML)
+
+        with (
+            self._patch_async_client(handler),
+            patch(
+                "curation.tasks.aggregate_rss_crawl_results.run",
+                wraps=aggregate_rss_crawl_results.run,
+            ) as mock_aggregate,
+        ):
             results = crawl_all_rss_feeds()
 
             assert results["total_feeds"] == 2  # Only active feeds
-            assert results["processed_feeds"] == 2
-            assert results["new_items"] == 6  # 3 * 2 feeds
-            assert len(results["errors"]) == 0
-            assert mock_crawl.call_count == 2
+            assert results["task_id"] is not None
+            assert sorted(requested_urls) == [
+                "https://example.com/feed1.xml",
+                "https://example.com/feed2.xml",
+            ]
+            mock_aggregate.assert_called_once()
+            batches = mock_aggregate.call_args.args[0]
+            assert [len(batch) for batch in batches] == [2]
+
+        # Both feeds serve the same entries, so the second one is deduplicated
+        assert RSSItem.objects.count() == 2
+
+    def test_crawl_all_rss_feeds_batches_feeds(self):
+        """Test crawl_all_rss_feeds queues one crawl per batch of feeds."""
+        with (
+            patch("curation.tasks.RSS_FEED_BATCH_SIZE", 1),
+            patch("curation.tasks.chord") as mock_chord,
+        ):
+            results = crawl_all_rss_feeds()
 
-    def test_crawl_all_rss_feeds_with_errors(self):
-        """Test crawl_all_rss_feeds when some feeds fail."""
-        with patch("curation.tasks.crawl_single_rss_feed") as mock_crawl:
-            # First feed succeeds, second fails
-            mock_crawl.side_effect = [{"new_items": 2}, Exception("Network error")]
+        signatures = list(mock_chord.call_args.args[0])
+        assert results["total_feeds"] == 2
+        assert [sig.args for sig in signatures] == [
+            ([self.feed1.id],),
+            ([self.feed2.id],),
+        ]
 
+    def test_crawl_all_rss_feeds_no_active_feeds(self):
+        """Test crawl_all_rss_feeds without active feeds queues nothing."""
+        RSSFeed.objects.update(is_active=False)
+
+        with patch("curation.tasks.chord") as mock_chord:
             results = crawl_all_rss_feeds()
 
-            assert results["total_feeds"] == 2
-            assert results["processed_feeds"] == 1  # Only first succeeded
-            assert results["new_items"] == 2
-            assert len(results["errors"]) == 1
-            assert "Network error" in results["errors"][0]
+        assert results == {"total_feeds": 0, "task_id": None}
+        mock_chord.assert_not_called()
+
+    def test_aggregate_rss_crawl_results(self):
+        """Test aggregate_rss_crawl_results sums the per-batch results."""
+        summary = aggregate_rss_crawl_results(
+            [
+                [{"feed_name": "Feed 1", "new_items": 2}],
+                [
+                    {"feed_name": "Feed 2", "new_items": 3},
+                    {"feed_name": "Feed 3", "new_items": 0, "error": "boom"},
+                ],
+            ]
+        )
+
+        assert summary == {"processed_feeds": 3, "new_items": 5}
+
+    def test_crawl_rss_feed_batch_conditional_and_errors(self):
+        """Test the batch sends validators, honours 304 and isolates failures."""
+        self.feed1.etag = '"abc"'
+        self.feed1.last_modified = "Mon, 15 Jan 2024 12:00:00 GMT"
+        self.feed1.save()
+        feed3 = RSSFeed.objects.create(
+            name="Test Feed 3", url="https://example.com/feed3.xml"
+        )
+        seen_headers = {}
+
+        def handler(request):
+            url = str(request.url)
+            seen_headers[url] = request.headers
+            if url == self.feed1.url:
+                return httpx.Response(304)
+            if url == self.feed2.url:
+                raise httpx.ConnectError("Connection failed", request=request)
+            return httpx.Response(200, content=RSS_XML, headers={"ETag": '"new"'})
+
+        with self._patch_async_client(handler):
+            results = crawl_rss_feed_batch([self.feed1.id, self.feed2.id, feed3.id])
+
+        by_name = {result["feed_name"]: result for result in results}
+        assert seen_headers[self.feed1.url]["If-None-Match"] == '"abc"'
+        assert (
+            seen_headers[self.feed1.url]["If-Modified-Since"]
+            == "Mon, 15 Jan 2024 12:00:00 GMT"
+        )
+        assert "If-None-Match" not in seen_headers[feed3.url]
+        assert by_name["Test Feed 1"]["new_items"] == 0
+        assert "error" in by_name["Test Feed 2"]
+        assert by_name["Test Feed 3"]["new_items"] == 2
+        feed3.refresh_from_db()
+        assert feed3.etag == '"new"'
+        assert RSSItem.objects.filter(feed=feed3).count() == 2
 
     def test_crawl_single_rss_feed_success(self):
         """Test crawl_single_rss_feed with valid RSS feed."""
-        mock_feed_data = MagicMock()
+        mock_feed_data = feedparser.FeedParserDict()
         mock_feed_data.bozo = False
         mock_feed_data.entries = [
-            type(
-                "Entry",
-                (),
+            _entry(
                 {
                     "title": "Test Article 1",
                     "link": "https://example.com/article1",
                     "summary": "Test summary 1",
                     "author": "Test Author",
                     "tags": [
-                        type("Tag", (), {"term": "python"})(),
-                        type("Tag", (), {"term": "django"})(),
+                        feedparser.FeedParserDict(term="python"),
+                        feedparser.FeedParserDict(term="django"),
                     ],
                     "id": "article1",
                     "published_parsed": (2024, 1, 15, 12, 0, 0, 0, 15, 0),
-                },
-            )(),
-            type(
-                "Entry",
-                (),
+                }
+            ),
+            _entry(
                 {
                     "title": "Test Article 2",
                     "link": "https://example.com/article2",
@@ -91,8 +219,8 @@ class TestRSSCrawlingTasks:
                     "tags": [],
                     "guid": "article2",
                     "updated_parsed": (2024, 1, 16, 10, 0, 0, 0, 16, 0),
-                },
-            )(),
+                }
+            ),
         ]
 
         with patch("feedparser.parse") as mock_parse:
@@ -113,10 +241,16 @@ class TestRSSCrawlingTasks:
             assert item1.author == "Test Author"
             assert item1.category == "python, django"
             assert item1.guid == "article1"
+            assert item1.pub_date == datetime(
+                2024, 1, 15, 12, 0, tzinfo=dt_timezone.utc
+            )
 
             item2 = items.get(link="https://example.com/article2")
             assert item2.title == "Test Article 2"
             assert item2.guid == "article2"
+            assert item2.pub_date == datetime(
+                2024, 1, 16, 10, 0, tzinfo=dt_timezone.utc
+            )
 
     def test_crawl_single_rss_feed_duplicate_prevention(self):
         """Test that duplicate entries are not created."""
@@ -128,12 +262,10 @@ class TestRSSCrawlingTasks:
             guid="existing",
         )
 
-        mock_feed_data = MagicMock()
+        mock_feed_data = feedparser.FeedParserDict()
         mock_feed_data.bozo = False
         mock_feed_data.entries = [
-            type(
-                "Entry",
-                (),
+            _entry(
                 {
                     "title": "Existing Article",
                     "link": "https://example.com/existing",
@@ -141,11 +273,9 @@ class TestRSSCrawlingTasks:
                     "author": "Test Author",
                     "tags": [],
                     "id": "existing",
-                },
-            )(),
-            type(
-                "Entry",
-                (),
+                }
+            ),
+            _entry(
                 {
                     "title": "New Article",
                     "link": "https://example.com/new",
@@ -153,8 +283,8 @@ class TestRSSCrawlingTasks:
                     "author": "Test Author",
                     "tags": [],
                     "id": "new",
-                },
-            )(),
+                }
+            ),
         ]
 
         with patch("feedparser.parse") as mock_parse:
@@ -168,6 +298,146 @@ class TestRSSCrawlingTasks:
             # Should still have only 2 items total (1 existing + 1 new)
             assert RSSItem.objects.filter(feed=self.feed1).count() == 2
 
+    def test_crawl_single_rss_feed_duplicate_check_single_query(self):
+        """Duplicates should be looked up with one query for all entries."""
+        RSSItem.objects.create(
+            feed=self.feed2,
+            title="Existing Article",
+            link="https://example.com/existing",
+            guid="existing-guid",
+        )
+        mock_feed_data = feedparser.FeedParserDict()
+        mock_feed_data.bozo = False
+        mock_feed_data.entries = [
+            _entry(
+                {
+                    "title": f"Article {i}",
+                    "link": f"https://example.com/{i}",
+                    "id": f"{i}",
+                }
+            )
+            for i in range(5)
+        ] + [
+            # same link as an item of another feed, different GUID
+            _entry(
+                {
+                    "title": "Moved",
+                    "link": "https://example.com/existing",
+                    "id": "moved",
+                }
+            ),
+            # repeated entry within the same feed
+            _entry({"title": "Article 0", "link": "https://example.com/0", "id": "0"}),
+        ]
+
+        with (
+            patch("feedparser.parse", return_value=mock_feed_data),
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            result = crawl_single_rss_feed(self.feed1.id)
+
+        rssitem_selects = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('SELECT "curation_rssitem"')
+        ]
+        rssitem_inserts = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if 'INTO "curation_rssitem"' in q["sql"]
+        ]
+        assert len(rssitem_selects) == 1
+        assert len(rssitem_inserts) == 1
+        assert result["new_items"] == 5
+        assert RSSItem.objects.filter(feed=self.feed1).count() == 5
+
+    def test_crawl_single_rss_feed_skips_too_long_link(self):
+        """Entries whose link does not fit the column should not fail the batch."""
+        mock_feed_data = feedparser.FeedParserDict()
+        mock_feed_data.bozo = False
+        mock_feed_data.entries = [
+            _entry(
+                {
+                    "title": "Long",
+                    "link": "https://example.com/" + "a" * 300,
+                    "id": "long",
+                }
+            ),
+            _entry(
+                {"title": "Short", "link": "https://example.com/short", "id": "short"}
+            ),
+        ]
+
+        with patch("feedparser.parse", return_value=mock_feed_data):
+            result = crawl_single_rss_feed(self.feed1.id)
+
+        assert result["new_items"] == 1
+        assert RSSItem.objects.get(feed=self.feed1).guid == "short"
+
+    def test_crawl_single_rss_feed_conditional_get(self):
+        """Stored validators should be sent and a 304 should skip parsing."""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers)
+            if len(seen_headers) == 1:
+                return httpx.Response(
+                    200,
+                    content=RSS_XML,
+                    headers={
+                        "ETag": '"abc"',
+                        "Last-Modified": "Mon, 15 Jan 2024 12:00:00 GMT",
+                    },
+                )
+            return httpx.Response(304)
+
+        with self._patch_http_client(handler):
+            first = crawl_single_rss_feed(self.feed1.id)
+            result = crawl_single_rss_feed(self.feed1.id)
+
+        assert first["new_items"] == 2
+        assert "If-None-Match" not in seen_headers[0]
+        assert seen_headers[1]["If-None-Match"] == '"abc"'
+        assert seen_headers[1]["If-Modified-Since"] == "Mon, 15 Jan 2024 12:00:00 GMT"
+        assert result == {
+            "feed_name": "Test Feed 1",
+            "new_items": 0,
+            "total_entries": 0,
+        }
+        self.feed1.refresh_from_db()
+        assert self.feed1.etag == '"abc"'
+        assert self.feed1.last_fetched is not None
+
+    @patch("curation.tasks.RSS_MAX_FEED_BYTES", 100)
+    def test_crawl_rss_feeds_reject_oversized_feeds(self):
+        """Feeds larger than RSS_MAX_FEED_BYTES should not be parsed."""
+
+        def handler(request):
+            return httpx.Response(200, content=RSS_XML)
+
+        with self._patch_http_client(handler), pytest.raises(Exception) as exc_info:
+            crawl_single_rss_feed(self.feed1.id)
+        assert "larger than 100 bytes" in str(exc_info.value)
+
+        with self._patch_async_client(handler):
+            results = crawl_rss_feed_batch([self.feed2.id])
+        assert "larger than 100 bytes" in results[0]["error"]
+        assert not RSSItem.objects.exists()
+
+    def test_crawl_single_rss_feed_respects_max_items(self):
+        """Only the first max_items entries of a feed should be considered."""
+        self.feed1.max_items = 1
+        self.feed1.save()
+
+        with self._patch_http_client(
+            lambda request: httpx.Response(200, content=RSS_XML)
+        ):
+            result = crawl_single_rss_feed(self.feed1.id)
+
+        assert result["new_items"] == 1
+        assert result["total_entries"] == 2
+        assert list(RSSItem.objects.values_list("guid", flat=True)) == ["first"]
+
     def test_crawl_single_rss_feed_nonexistent_feed(self):
         """Test crawl_single_rss_feed with non-existent feed ID."""
         with pytest.raises(Exception) as exc_info:
@@ -177,7 +447,7 @@ class TestRSSCrawlingTasks:
 
     def test_crawl_single_rss_feed_malformed_feed(self):
         """Test crawl_single_rss_feed with malformed RSS feed."""
-        mock_feed_data = MagicMock()
+        mock_feed_data = feedparser.FeedParserDict()
         mock_feed_data.bozo = True
         mock_feed_data.bozo_exception = "XML parsing error"
         mock_feed_data.entries = []
@@ -192,34 +462,35 @@ class TestRSSCrawlingTasks:
 
     def test_crawl_single_rss_feed_network_error(self):
         """Test crawl_single_rss_feed with network error."""
-        with patch("feedparser.parse") as mock_parse:
-            mock_parse.side_effect = requests.RequestException("Connection failed")
 
-            with pytest.raises(Exception) as exc_info:
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        with self._patch_http_client(handler):
+            with pytest.raises(httpx.HTTPError) as exc_info:
                 crawl_single_rss_feed(self.feed1.id)
 
-            assert "Network error while fetching RSS feed" in str(exc_info.value)
+        assert "Network error while fetching RSS feed" in str(exc_info.value)
 
     def test_crawl_single_rss_feed_field_truncation(self):
         """Test that long field values are properly truncated."""
-        mock_feed_data = MagicMock()
+        mock_feed_data = feedparser.FeedParserDict()
         mock_feed_data.bozo = False
         mock_feed_data.entries = [
-            type(
-                "Entry",
-                (),
+            _entry(
                 {
                     "title": "A" * 600,  # Longer than 500 char limit
                     "link": "https://example.com/long",
                     "summary": "Test summary",
                     "author": "B" * 250,  # Longer than 200 char limit
                     "tags": [
-                        type("Tag", (), {"term": "tag" + str(i)})() for i in range(50)
+                        feedparser.FeedParserDict(term="tag" + str(i))
+                        for i in range(50)
                     ],  # Many tags
                     "id": "C" * 600,  # Longer than 500 char limit
                     "published_parsed": (2024, 1, 15, 12, 0, 0, 0, 15, 0),
-                },
-            )()
+                }
+            )
         ]
 
         with patch("feedparser.parse") as mock_parse:
@@ -244,6 +515,33 @@ class TestRSSCrawlingTasks:
         assert result["new_items"] == 5
         mock_crawl_all.assert_called_once()
 
+    def test_run_rss_pipeline_runs_every_step(self):
+        """Test run_rss_pipeline sends every RSS processing step as its own task."""
+        steps = [
+            crawl_rss,
+            crawl_rss_item_content,
+            process_newsletter_items,
+            analyze_content_copyright,
+            translate_pending_rss_item,
+        ]
+        called = []
+        patches = [
+            patch.object(
+                step, "run", side_effect=lambda name=step.name: called.append(name)
+            )
+            for step in steps
+        ]
+        for step_patch in patches:
+            step_patch.start()
+        try:
+            result = run_rss_pipeline()
+        finally:
+            for step_patch in patches:
+                step_patch.stop()
+
+        assert result["status"] == "started"
+        assert sorted(called) == sorted(step.name for step in steps)
+
     def test_crawl_rss_item_content_success(self):
         """Test crawl_rss_item_content with successful crawling."""
         # Create pending RSS item
@@ -256,19 +554,23 @@ class TestRSSCrawlingTasks:
             pub_date=pub_date,
         )
 
-        mock_response = MagicMock()
-        mock_response.text = "# Test Article\n\nThis is test content."
-        mock_response.raise_for_status = MagicMock()
+        content = "# Test Article\n\nThis is test content. 테스트 본문입니다."
+        requested_urls = []
 
-        with patch("requests.get") as mock_get:
-            mock_get.return_value = mock_response
+        def handler(request):
+            requested_urls.append(str(request.url))
+            return httpx.Response(200, text=content)
 
+        with self._patch_async_client(handler):
             result = crawl_rss_item_content()
 
-            assert result["status"] == "success"
-            assert result["item_id"] == rss_item.id
-            assert result["item_title"] == "Test Article"
-            assert result["content_length"] == len(mock_response.text)
+            assert result["status"] == "processed"
+            assert result["crawled"] == 1
+            item_result = result["items"][0]
+            assert item_result["status"] == "success"
+            assert item_result["item_id"] == rss_item.id
+            assert item_result["item_title"] == "Test Article"
+            assert item_result["content_length"] == len(content.encode("utf-8"))
 
             # Check that item was updated
             rss_item.refresh_from_db()
@@ -276,10 +578,163 @@ class TestRSSCrawlingTasks:
             assert rss_item.crawled_at is not None
             assert rss_item.error_message == ""
             assert rss_item.crawled_content is not None
+            with rss_item.crawled_content.open("rb") as crawled_file:
+                assert crawled_file.read().decode("utf-8") == content
 
             # Verify Jina URL was called
-            expected_url = f"https://r.jina.ai/{rss_item.link}"
-            mock_get.assert_called_once_with(expected_url, timeout=30)
+            assert requested_urls == [f"https://r.jina.ai/{rss_item.link}"]
+
+    def test_crawl_rss_item_content_spools_large_content_to_disk(self):
+        """Test that content larger than the spool limit is stored intact."""
+        rss_item = RSSItem.objects.create(
+            feed=self.feed1,
+            title="Long Article",
+            link="https://example.com/long-article",
+            crawling_status="pending",
+            pub_date=timezone.now() - timedelta(days=1),
+        )
+        content = ("# Long Article\n\n" + "본문 " * 5000).encode("utf-8")
+
+        def handler(request):
+            return httpx.Response(200, content=content)
+
+        with (
+            self._patch_async_client(handler),
+            patch("curation.tasks.JINA_SPOOL_MAX_BYTES", 1024),
+        ):
+            result = crawl_rss_item_content()
+
+        assert result["items"][0]["content_length"] == len(content)
+        rss_item.refresh_from_db()
+        with rss_item.crawled_content.open("rb") as crawled_file:
+            assert crawled_file.read() == content
+
+    def test_crawl_rss_item_content_batches_newest_pending_items(self):
+        """Test that one run claims at most RSS_CONTENT_BATCH_SIZE newest items."""
+        now = timezone.now()
+        items = [
+            RSSItem.objects.create(
+                feed=self.feed1,
+                title=f"Article {i}",
+                link=f"https://example.com/article-{i}",
+                guid=f"article-{i}",
+                crawling_status="pending",
+                pub_date=now - timedelta(hours=i),
+            )
+            for i in range(RSS_CONTENT_BATCH_SIZE + 2)
+        ]
+
+        requested_urls = []
+
+        def handler(request):
+            requested_urls.append(str(request.url))
+            return httpx.Response(200, text="# Content")
+
+        with self._patch_async_client(handler):
+            result = crawl_rss_item_content()
+
+        assert result["crawled"] == RSS_CONTENT_BATCH_SIZE
+        assert len(requested_urls) == RSS_CONTENT_BATCH_SIZE
+        statuses = [
+            item.crawling_status
+            for item in RSSItem.objects.filter(
+                id__in=[item.id for item in items]
+            ).order_by("-pub_date")
+        ]
+        assert statuses == ["completed"] * RSS_CONTENT_BATCH_SIZE + ["pending"] * 2
+
+    def test_crawl_rss_item_content_query_count_is_constant(self):
+        """Test that crawling more items does not add per-item queries."""
+
+        def crawl_queries(count, prefix):
+            for i in range(count):
+                RSSItem.objects.create(
+                    feed=self.feed1,
+                    title=f"{prefix} {i}",
+                    link=f"https://example.com/{prefix}-{i}",
+                    guid=f"{prefix}-{i}",
+                    crawling_status="pending",
+                    pub_date=timezone.now() - timedelta(hours=i + 1),
+                )
+
+            def handler(request):
+                return httpx.Response(200, text="# Content")
+
+            with (
+                self._patch_async_client(handler),
+                CaptureQueriesContext(connection) as ctx,
+            ):
+                result = crawl_rss_item_content()
+            assert result["crawled"] == count
+            return len(ctx.captured_queries)
+
+        assert crawl_queries(1, "single") == crawl_queries(3, "many")
+
+    def test_crawl_rss_item_content_skips_claimed_items(self):
+        """Test that items already being crawled are not picked up again."""
+        RSSItem.objects.create(
+            feed=self.feed1,
+            title="Claimed Article",
+            link="https://example.com/claimed-article",
+            crawling_status="in_progress",
+            crawl_claimed_at=timezone.now(),
+            pub_date=timezone.now() - timedelta(days=1),
+        )
+
+        result = crawl_rss_item_content()
+
+        assert result["status"] == "no_items"
+
+    def test_crawl_rss_item_content_reclaims_stale_items(self):
+        """Test that items left in_progress by a dead worker are crawled again."""
+        rss_item = RSSItem.objects.create(
+            feed=self.feed1,
+            title="Stale Article",
+            link="https://example.com/stale-article",
+            crawling_status="in_progress",
+            crawl_claimed_at=timezone.now()
+            - RSS_CONTENT_CLAIM_TIMEOUT
+            - timedelta(minutes=1),
+            pub_date=timezone.now() - timedelta(days=1),
+        )
+
+        def handler(request):
+            return httpx.Response(200, text="# Content")
+
+        with self._patch_async_client(handler):
+            result = crawl_rss_item_content()
+
+        assert result["crawled"] == 1
+        rss_item.refresh_from_db()
+        assert rss_item.crawling_status == "completed"
+
+    def test_crawl_rss_item_content_releases_items_when_save_fails(self):
+        """Test that claimed items go back to pending if saving the batch fails."""
+        rss_item = RSSItem.objects.create(
+            feed=self.feed1,
+            title="Test Article",
+            link="https://example.com/test-article",
+            crawling_status="pending",
+            pub_date=timezone.now() - timedelta(days=1),
+        )
+
+        def handler(request):
+            return httpx.Response(200, text="# Content")
+
+        with (
+            self._patch_async_client(handler),
+            patch.object(
+                RSSItem.objects,
+                "bulk_update",
+                side_effect=DatabaseError("connection lost"),
+            ),
+        ):
+            with pytest.raises(DatabaseError):
+                crawl_rss_item_content()
+
+        rss_item.refresh_from_db()
+        assert rss_item.crawling_status == "pending"
+        assert rss_item.crawl_claimed_at is None
 
     def test_crawl_rss_item_content_no_pending_items(self):
         """Test crawl_rss_item_content when no pending items exist."""
@@ -315,14 +770,17 @@ class TestRSSCrawlingTasks:
             pub_date=pub_date,
         )
 
-        with patch("requests.get") as mock_get:
-            mock_get.side_effect = requests.RequestException("Connection failed")
+        def handler(request):
+            raise httpx.ConnectError("Connection failed")
 
+        with self._patch_async_client(handler):
             result = crawl_rss_item_content()
 
-            assert result["status"] == "failed"
-            assert result["item_id"] == rss_item.id
-            assert "Network error" in result["error"]
+            assert result["failed"] == 1
+            item_result = result["items"][0]
+            assert item_result["status"] == "failed"
+            assert item_result["item_id"] == rss_item.id
+            assert "Network error" in item_result["error"]
 
             # Check that item status was updated
             rss_item.refresh_from_db()
@@ -340,20 +798,144 @@ class TestRSSCrawlingTasks:
             pub_date=pub_date,
         )
 
-        with patch("requests.get") as mock_get:
-            mock_get.side_effect = Exception("Unexpected error")
+        def handler(request):
+            raise ValueError("Unexpected error")
 
+        with self._patch_async_client(handler):
             result = crawl_rss_item_content()
 
-            assert result["status"] == "failed"
-            assert result["item_id"] == rss_item.id
-            assert "Unexpected error" in result["error"]
+            assert result["failed"] == 1
+            item_result = result["items"][0]
+            assert item_result["status"] == "failed"
+            assert item_result["item_id"] == rss_item.id
+            assert "Unexpected error" in item_result["error"]
 
             # Check that item status was updated
             rss_item.refresh_from_db()
             assert rss_item.crawling_status == "failed"
             assert "Unexpected error" in rss_item.error_message
 
+    @patch("curation.utils_copyright.analyze_content_for_copyright")
+    def test_analyze_content_copyright_fans_out_per_item(self, mock_analyze):
+        """Test that each pending item is analyzed by its own task."""
+        items = [
+            RSSItem.objects.create(
+                feed=self.feed1,
+                title=f"Crawled {i}",
+                link=f"https://example.com/crawled-{i}",
+                guid=f"crawled-{i}",
+                crawling_status="completed",
+                crawled_at=timezone.now() - timedelta(minutes=i),
+            )
+            for i in range(3)
+        ]
+        mock_analyze.return_value = {"language": "en"}
+
+        result = analyze_content_copyright()
+
+        assert result["status"] == "dispatched"
+        assert result["item_ids"] == [item.id for item in items]
+        assert sorted(call.args[0] for call in mock_analyze.call_args_list) == sorted(
+            item.id for item in items
+        )
+
+    @patch("curation.utils_copyright.analyze_content_for_copyright")
+    def test_analyze_item_copyright_skips_analyzed_item(self, mock_analyze):
+        """Test that an item analyzed in the meantime is not analyzed again."""
+        rss_item = RSSItem.objects.create(
+            feed=self.feed1,
+            title="Analyzed",
+            link="https://example.com/analyzed",
+            crawling_status="completed",
+            language="en",
+        )
+
+        result = analyze_item_copyright(rss_item.id)
+
+        assert result == {"status": "skipped", "item_id": rss_item.id}
+        mock_analyze.assert_not_called()
+
+    @patch("curation.utils_newsletter.process_newsletter_rss_item")
+    def test_process_newsletter_items_fans_out_per_item(self, mock_process):
+        """Test that each pending newsletter is processed by its own task."""
+        newsletter_feed = RSSFeed.objects.create(
+            name="Newsletter",
+            url="https://example.com/newsletter.xml",
+            is_newsletter=True,
+        )
+        newsletter = RSSItem.objects.create(
+            feed=newsletter_feed,
+            title="Weekly",
+            link="https://example.com/weekly",
+            crawling_status="completed",
+        )
+        RSSItem.objects.create(
+            feed=self.feed1,
+            title="Not a newsletter",
+            link="https://example.com/regular",
+            guid="regular",
+            crawling_status="completed",
+        )
+        mock_process.return_value = {"created_count": 2, "extracted_count": 3}
+
+        result = process_newsletter_items()
+
+        assert result == {"status": "dispatched", "item_ids": [newsletter.id]}
+        mock_process.assert_called_once_with(newsletter.id)
+
+    @patch("curation.utils_copyright.analyze_content_for_copyright")
+    def test_analyze_content_copyright_runs_item_once_across_ticks(self, mock_analyze):
+        """Test that an item dispatched by two ticks is analyzed by one worker."""
+        rss_item = RSSItem.objects.create(
+            feed=self.feed1,
+            title="Crawled",
+            link="https://example.com/crawled",
+            crawling_status="completed",
+            crawled_at=timezone.now(),
+        )
+        next_tick = []
+
+        def analyze(item_id):
+            # 첫 태스크가 분석하는 동안 다음 주기가 같은 아이템을 다시 보냅니다
+            next_tick.append(analyze_content_copyright())
+            return {"language": "en"}
+
+        mock_analyze.side_effect = analyze
+
+        result = analyze_content_copyright()
+
+        assert result["item_ids"] == [rss_item.id]
+        assert next_tick[0]["item_ids"] == [rss_item.id]
+        mock_analyze.assert_called_once_with(rss_item.id)
+
+    @patch("curation.utils_newsletter.process_newsletter_rss_item")
+    def test_process_newsletter_items_runs_item_once_across_ticks(self, mock_process):
+        """Test that a newsletter dispatched by two ticks is processed by one worker."""
+        newsletter_feed = RSSFeed.objects.create(
+            name="Newsletter",
+            url="https://example.com/newsletter.xml",
+            is_newsletter=True,
+        )
+        newsletter = RSSItem.objects.create(
+            feed=newsletter_feed,
+            title="Weekly",
+            link="https://example.com/weekly",
+            crawling_status="completed",
+        )
+        next_tick = []
+
+        def process(item_id):
+            next_tick.append(process_newsletter_items())
+            return {"created_count": 2, "extracted_count": 3}
+
+        mock_process.side_effect = process
+
+        result = process_newsletter_items()
+
+        assert result["item_ids"] == [newsletter.id]
+        assert next_tick[0]["item_ids"] == [newsletter.id]
+        mock_process.assert_called_once_with(newsletter.id)
+
     @patch("curation.tasks.translate_rssitem")
     def test_translate_pending_rss_item_success(self, mock_translate):
         """Test translate_pending_rss_item with successful translation."""
@@ -449,3 +1031,85 @@ class TestRSSCrawlingTasks:
         result = translate_pending_rss_item()
 
         assert result["status"] == "no_items"
+
+
+@pytest.mark.django_db
+class TestProcessArticleTask:
+    """Test cases for the process_article task."""
+
+    def setup_method(self):
+        """Set up test data for each test method."""
+        self.article = Article.objects.create(url="https://example.com/article")
+
+    @patch.object(Article, "afetch_and_summarize", new_callable=AsyncMock)
+    def test_process_article(self, mock_afetch):
+        """The task should run the async pipeline for the article."""
+        mock_afetch.return_value = (True, "Fetch, Read Time, Summary completed.")
+
+        result = process_article.delay(self.article.id).get()
+
+        assert result == "Fetch, Read Time, Summary completed."
+        mock_afetch.assert_awaited_once()
+
+    @patch("curation.models.aget_summary_from_url", new_callable=AsyncMock)
+    def test_process_article_retries_network_errors(self, mock_summary):
+        """Transient network errors should make Celery retry the task."""
+        mock_summary.side_effect = httpx.ConnectError("connection refused")
+
+        with pytest.raises(Retry):
+            process_article.apply(args=[self.article.id], throw=True)
+
+
+@pytest.mark.django_db
+class TestBulkSummarizeArticlesTask:
+    """Test cases for the bulk_summarize_articles task."""
+
+    def setup_method(self):
+        """Set up test data for each test method."""
+        self.article1 = Article.objects.create(url="https://example.com/one")
+        self.article2 = Article.objects.create(url="https://example.com/two")
+
+    @patch.object(Article, "afetch_and_summarize", new_callable=AsyncMock)
+    def test_bulk_summarize_articles(self, mock_afetch):
+        """Every article should be processed and failures reported by id."""
+        mock_afetch.side_effect = [
+            (True, "Fetch, Read Time, Summary completed."),
+            httpx.ConnectError("connection refused"),
+        ]
+
+        result = bulk_summarize_articles([self.article1.id, self.article2.id])
+
+        assert result["processed"] == 2
+        assert len(result["failed"]) == 1
+        assert mock_afetch.await_count == 2
+
+    @patch.object(Article, "afetch_and_summarize", new_callable=AsyncMock)
+    def test_bulk_summarize_articles_reports_returned_errors(self, mock_afetch):
+        """Articles whose summary steps fail without raising should be reported."""
+        mock_afetch.side_effect = [
+            (True, "Fetch, Read Time, Summary completed."),
+            (False, "Error extracting summary. Other details saved."),
+        ]
+
+        result = bulk_summarize_articles([self.article1.id, self.article2.id])
+
+        assert result["processed"] == 2
+        assert len(result["failed"]) == 1
+        assert result["requeued"] == []
+
+    @patch.object(process_article, "delay")
+    @patch.object(Article, "afetch_and_summarize", new_callable=AsyncMock)
+    def test_bulk_summarize_articles_requeues_rate_limited(
+        self, mock_afetch, mock_delay
+    ):
+        """Rate-limited articles should be sent to the retrying process_article task."""
+        mock_afetch.side_effect = [
+            (True, "Fetch, Read Time, Summary completed."),
+            LLMRateLimitError("Resource has been exhausted"),
+        ]
+
+        result = bulk_summarize_articles([self.article1.id, self.article2.id])
+
+        assert result["failed"] == []
+        assert len(result["requeued"]) == 1
+        mock_delay.assert_called_once_with(result["requeued"][0])
@@ -1,9 +1,24 @@
+import llm
 import pytest
 from unittest.mock import patch, MagicMock, mock_open
+from django.core.cache import caches
 from django.core.files.base import ContentFile
-
-from .models import RSSItem, RSSFeed, TranslatedContent, LLMService, LLMUsage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .models import (
+    RSSItem,
+    RSSFeed,
+    Tag,
+    TranslatedContent,
+    LLMRateWindow,
+    LLMService,
+    LLMUsage,
+)
 from .utils import (
+    LLMRateLimitError,
+    Result,
+    _llm_cache_key,
     fetch_content_from_url,
     parse_contents,
     get_summary_from_url,
@@ -17,6 +32,10 @@ from .utils_trans import translate_rssitem
 class TestUtilsFunctions:
     """Test cases for utility functions in utils.py."""
 
+    def setup_method(self):
+        """Start each test with an empty LLM response cache."""
+        caches["llm"].clear()
+
     @patch("httpx.get")
     def test_fetch_content_from_url_success(self, mock_get):
         """Test fetch_content_from_url with successful response."""
@@ -168,6 +187,7 @@ Just some content."""
         system_prompt = call_args[1]["system"]
         assert "'Web Development'" in system_prompt
         assert "'Large Language Models'" in system_prompt
+        assert call_args[1]["schema"] is Result
 
     @patch("llm.get_model")
     def test_categorize_summary_other_category(self, mock_get_model):
@@ -185,6 +205,131 @@ Just some content."""
 
         assert result == "Other"
 
+    @patch("llm.get_model")
+    def test_translate_to_korean_cached(self, mock_get_model):
+        """Repeated translations of the same text should reuse the response."""
+        mock_model = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text.return_value = "캐시된 번역"
+        mock_model.prompt.return_value = mock_response
+        mock_get_model.return_value = mock_model
+
+        assert translate_to_korean("Cache me.") == "캐시된 번역"
+        assert translate_to_korean("  Cache   me. ") == "캐시된 번역"
+
+        mock_model.prompt.assert_called_once()
+
+    @patch("llm.get_model")
+    def test_translate_to_korean_empty_text_not_cached(self, mock_get_model):
+        """Empty input should always reach the model and never be cached."""
+        mock_model = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text.return_value = ""
+        mock_model.prompt.return_value = mock_response
+        mock_get_model.return_value = mock_model
+
+        translate_to_korean("   ")
+        translate_to_korean("   ")
+
+        assert mock_model.prompt.call_count == 2
+
+    def test_llm_cache_key_includes_template_version(self):
+        """Changing the prompt template version should change the cache key."""
+        assert _llm_cache_key("trk", "1", "text") != _llm_cache_key("trk", "2", "text")
+        assert _llm_cache_key("trk", "1", "a  text") == _llm_cache_key(
+            "trk", "1", " a text "
+        )
+
+    @patch("curation.utils.time.sleep")
+    @patch("llm.get_model")
+    def test_translate_to_korean_waits_for_inflight_call(
+        self, mock_get_model, mock_sleep
+    ):
+        """A caller that finds the lock taken should reuse the holder's result."""
+        cache = caches["llm"]
+        key = _llm_cache_key("trk", "1", "In flight.")
+        cache.add(f"{key}:lock", 1)
+        mock_sleep.side_effect = lambda seconds: cache.set(key, "다른 워커의 번역")
+
+        assert translate_to_korean("In flight.") == "다른 워커의 번역"
+        mock_get_model.assert_not_called()
+
+    @patch("curation.utils.time.sleep")
+    @patch("llm.get_model")
+    def test_translate_to_korean_calls_llm_when_lock_released_without_result(
+        self, mock_get_model, mock_sleep
+    ):
+        """If the lock holder fails, the waiting caller should make the call."""
+        mock_model = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text.return_value = "번역"
+        mock_model.prompt.return_value = mock_response
+        mock_get_model.return_value = mock_model
+        cache = caches["llm"]
+        lock_key = _llm_cache_key("trk", "1", "Failed.") + ":lock"
+        cache.add(lock_key, 1)
+        mock_sleep.side_effect = lambda seconds: cache.delete(lock_key)
+
+        assert translate_to_korean("Failed.") == "번역"
+        mock_model.prompt.assert_called_once()
+
+    @patch("llm.get_model")
+    def test_categorize_summary_cache_keyed_by_categories(self, mock_get_model):
+        """A different category list should not reuse a cached response."""
+        mock_model = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text.return_value = "Other"
+        mock_model.prompt.return_value = mock_response
+        mock_get_model.return_value = mock_model
+
+        categorize_summary("Same summary.", ["Data Science", "Other"])
+        categorize_summary("Same summary.", ["Data Science", "Other"])
+        categorize_summary("Same summary.", ["MLOps", "Other"])
+
+        assert mock_model.prompt.call_count == 2
+
+    @patch("curation.utils.time.sleep")
+    @patch("curation.utils.LLM_REQUESTS_PER_MINUTE", 2)
+    @patch("llm.get_model")
+    def test_llm_calls_wait_when_rate_limited(self, mock_get_model, mock_sleep):
+        """Requests past the per-minute limit should wait for the next window."""
+        mock_model = MagicMock()
+        mock_model.prompt.return_value.text.return_value = "번역"
+        mock_get_model.return_value = mock_model
+
+        with patch(
+            "curation.utils._llm_rate_window",
+            side_effect=[(1, 30), (1, 30), (1, 30), (2, 60)],
+        ):
+            for text in ("one", "two", "three"):
+                translate_to_korean(text)
+
+        mock_sleep.assert_called_once_with(30)
+        assert mock_model.prompt.call_count == 3
+
+    def test_llm_rate_window_counts_in_database(self):
+        """Each window counts its own requests and drops the finished ones."""
+        assert [LLMRateWindow.take(100) for _ in range(3)] == [1, 2, 3]
+        assert LLMRateWindow.take(101) == 1
+        assert LLMRateWindow.take(102) == 1
+
+        assert list(LLMRateWindow.objects.values_list("window", "requests")) == [
+            (102, 1),
+            (101, 1),
+        ]
+
+    @patch("llm.get_model")
+    def test_llm_quota_errors_raise_rate_limit_error(self, mock_get_model):
+        """Provider quota errors should surface as LLMRateLimitError."""
+        mock_model = MagicMock()
+        mock_model.prompt.return_value.text.side_effect = llm.ModelError(
+            "Resource has been exhausted (e.g. check quota)."
+        )
+        mock_get_model.return_value = mock_model
+
+        with pytest.raises(LLMRateLimitError):
+            translate_to_korean("Rate limited text.")
+
 
 @pytest.mark.django_db
 class TestUtilsTransFunctions:
@@ -257,7 +402,7 @@ class TestUtilsTransFunctions:
             assert result.slug == "test-article"
             assert result.description == "테스트 기사 설명"
             assert result.author == "테스트 작성자"
-            assert result.tags == ["python", "django"]
+            assert [tag.name for tag in result.tags.all()] == ["django", "python"]
             assert result.model_name == "gemini:gemini-2.5-pro"
             assert result.source_rss_item == rss_item
             assert result.source_url == rss_item.link
@@ -392,11 +537,24 @@ class TestUtilsTransFunctions:
         mock_agent.run_sync.return_value = mock_result
 
         mock_file = mock_open(read_data=mock_content)
-        with patch("builtins.open", mock_file):
+        with (
+            patch("builtins.open", mock_file),
+            CaptureQueriesContext(connection) as ctx,
+        ):
             result = translate_rssitem(rss_item.id)
 
             # Verify the result is saved to database
             assert TranslatedContent.objects.filter(source_rss_item=rss_item).exists()
+            assert result.content.name.startswith("tr/")
+
+        # One INSERT and one UPDATE for the file name
+        content_writes = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if 'INTO "curation_translatedcontent"' in q["sql"]
+            or q["sql"].startswith('UPDATE "curation_translatedcontent"')
+        ]
+        assert len(content_writes) == 2
 
     @patch("curation.utils_trans.Agent")
     @patch.object(LLMService, "get_llm_provider_model")
@@ -475,19 +633,23 @@ class TestTranslatedContentModelIntegration:
             title="모델 테스트 제목",
             slug="model-test-title",
             description="모델 테스트 설명입니다.",
-            tags=["model", "test", "integration"],
             written_date="2024-01-15",
             author="모델 테스트 작성자",
             model_name="test-model:v1.0",
             source_rss_item=self.rss_item,
             source_url="https://example.com/model-source",
         )
+        content.tags.set(Tag.get_or_create_many(["model", "test", "integration"]))
 
         assert content.id is not None
         assert content.title == "모델 테스트 제목"
         assert content.slug == "model-test-title"
         assert content.description == "모델 테스트 설명입니다."
-        assert content.tags == ["model", "test", "integration"]
+        assert [tag.name for tag in content.tags.all()] == [
+            "integration",
+            "model",
+            "test",
+        ]
         assert str(content.written_date) == "2024-01-15"
         assert content.author == "모델 테스트 작성자"
         assert content.model_name == "test-model:v1.0"
@@ -506,7 +668,7 @@ class TestTranslatedContentModelIntegration:
 
         assert content.id is not None
         assert content.title == "최소 필드 테스트"
-        assert content.tags == []  # Default empty list
+        assert not content.tags.exists()  # No tags by default
         assert content.author is None
         assert content.written_date is None
         assert content.source_rss_item is None
@@ -555,7 +717,7 @@ class TestTranslatedContentModelIntegration:
         assert translated_contents.count() == 1
 
     def test_translated_content_tags_field(self):
-        """Test TranslatedContent JSONField for tags."""
+        """Test TranslatedContent many-to-many tags."""
         # Test with various tag formats
         test_cases = [
             [],  # Empty list
@@ -570,13 +732,32 @@ class TestTranslatedContentModelIntegration:
                 title=f"태그 테스트 {i}",
                 slug=f"tag-test-{i}",
                 description=f"태그 테스트 {i} 설명",
-                tags=tags,
                 model_name="tag-model",
                 source_url=f"https://example.com/tag-test-{i}",
             )
+            content.tags.set(Tag.get_or_create_many(tags))
 
             content.refresh_from_db()
-            assert content.tags == tags
+            assert sorted(tag.name for tag in content.tags.all()) == sorted(tags)
+
+        assert Tag.objects.get(name="한글").slug == "한글"
+        assert Tag.objects.get(name="spaces in tags").slug == "spaces-in-tags"
+
+    def test_tag_slugs_are_unique(self):
+        """Names that slugify to the same value should get distinct slugs."""
+        long_name = "x" * 100
+        tags = Tag.get_or_create_many(
+            ["Django ORM", "django-orm", long_name, long_name.upper()]
+        )
+        saved = Tag.objects.create(name="DJANGO ORM")
+
+        assert [tag.slug for tag in tags] == [
+            "django-orm",
+            "django-orm-2",
+            long_name,
+            "x" * 98 + "-2",
+        ]
+        assert saved.slug == "django-orm-3"
 
     def test_translated_content_cascade_delete(self):
         """Test CASCADE delete behavior with RSS item."""
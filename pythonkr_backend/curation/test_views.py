@@ -5,7 +5,7 @@ from unittest.mock import patch, mock_open, MagicMock
 from django.test import Client
 from django.urls import reverse
 
-from .models import TranslatedContent, RSSFeed, RSSItem
+from .models import Tag, TranslatedContent, RSSFeed, RSSItem
 
 
 @pytest.mark.django_db
@@ -33,13 +33,15 @@ class TestTranslatedContentView:
             title="테스트 기사",
             slug="test-article",
             description="테스트 기사 설명입니다.",
-            tags=["python", "django", "test"],
             written_date="2024-01-15",
             author="테스트 작성자",
             model_name="gemini:gemini-2.5-pro",
             source_rss_item=self.rss_item,
             source_url="https://example.com/original-article",
         )
+        self.translated_content.tags.set(
+            Tag.get_or_create_many(["python", "django", "test"])
+        )
 
     def test_translated_content_detail_success(self):
         """Test successful rendering of TranslatedContent detail page."""
@@ -178,7 +180,11 @@ class TestTranslatedContentView:
                     assert content.title == "테스트 기사"
                     assert content.slug == "test-article"
                     assert content.description == "테스트 기사 설명입니다."
-                    assert content.tags == ["python", "django", "test"]
+                    assert [tag.name for tag in content.tags.all()] == [
+                        "django",
+                        "python",
+                        "test",
+                    ]
                     assert content.author == "테스트 작성자"
                     assert content.model_name == "gemini:gemini-2.5-pro"
                     assert content.source_rss_item == self.rss_item
@@ -285,13 +291,13 @@ class TestTranslatedContentTemplateIntegration:
             title="템플릿 테스트",
             slug="template-test",
             description="템플릿 렌더링 테스트입니다.",
-            tags=["template", "test", "django"],
             written_date="2024-01-20",
             author="템플릿 작성자",
             model_name="template-model",
             source_rss_item=self.rss_item,
             source_url="https://example.com/template-source",
         )
+        self.content.tags.set(Tag.get_or_create_many(["template", "test", "django"]))
 
     def test_template_inheritance(self):
         """Test that template properly extends base template."""
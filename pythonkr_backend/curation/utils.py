@@ -1,5 +1,14 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import time
+import weakref
+
 import httpx
 import llm
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
 from pydantic import BaseModel
 
 import os
@@ -11,6 +20,206 @@ class Result(BaseModel):
 
 
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
+GEMINI_MODEL_NAME = "gemini-2.5-pro-exp-03-25"
+
+# LLM responses are cached in the "llm" cache alias for this many seconds
+LLM_CACHE_TIMEOUT = 30 * 24 * 60 * 60
+
+
+def _llm_cache_key(prefix: str, version: str, text: str, *extra) -> str:
+    """Builds a cache key from the model name and the whitespace-normalized text."""
+    normalized = " ".join(text.split())
+    payload = "\x1f".join([GEMINI_MODEL_NAME, normalized, *map(str, extra)])
+    return f"{prefix}:v{version}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+# While one worker computes an uncached response it holds a lock for at most
+# this many seconds; other workers wait for its result instead of calling the LLM
+LLM_LOCK_TIMEOUT = 60
+LLM_LOCK_POLL_INTERVAL = 0.5
+
+
+def _wait_for_llm_response(cache, key, lock_key):
+    """Polls for a response another worker is computing; None if it gave up."""
+    deadline = time.monotonic() + LLM_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(LLM_LOCK_POLL_INTERVAL)
+        cached = cache.get(key)
+        if cached is not None or cache.get(lock_key) is None:
+            return cached
+    return None
+
+
+async def _await_llm_response(cache, key, lock_key):
+    """Async version of _wait_for_llm_response."""
+    deadline = time.monotonic() + LLM_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LLM_LOCK_POLL_INTERVAL)
+        cached = await cache.aget(key)
+        if cached is not None or await cache.aget(lock_key) is None:
+            return cached
+    return None
+
+
+def cached_llm_response(prefix: str, template_version: str = "1"):
+    """
+    Caches the text returned by an LLM helper, keyed by its arguments.
+
+    Bump ``template_version`` when the helper's prompt changes so that stale
+    responses are not reused. Concurrent misses for the same key make a single
+    LLM call: the first caller takes a lock and the others wait for its result.
+    Works for both sync and async helpers; empty inputs bypass the cache and
+    failures are not cached.
+    """
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(text, *args):
+                if not text or not text.strip():
+                    return await func(text, *args)
+                cache = caches["llm"]
+                key = _llm_cache_key(prefix, template_version, text, *args)
+                cached = await cache.aget(key)
+                if cached is not None:
+                    return cached
+                lock_key = f"{key}:lock"
+                locked = await cache.aadd(lock_key, 1, LLM_LOCK_TIMEOUT)
+                if not locked:
+                    cached = await _await_llm_response(cache, key, lock_key)
+                    if cached is not None:
+                        return cached
+                try:
+                    result = await func(text, *args)
+                    await cache.aset(key, result, LLM_CACHE_TIMEOUT)
+                finally:
+                    if locked:
+                        await cache.adelete(lock_key)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(text, *args):
+            if not text or not text.strip():
+                return func(text, *args)
+            cache = caches["llm"]
+            key = _llm_cache_key(prefix, template_version, text, *args)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            lock_key = f"{key}:lock"
+            locked = cache.add(lock_key, 1, LLM_LOCK_TIMEOUT)
+            if not locked:
+                cached = _wait_for_llm_response(cache, key, lock_key)
+                if cached is not None:
+                    return cached
+            try:
+                result = func(text, *args)
+                cache.set(key, result, LLM_CACHE_TIMEOUT)
+            finally:
+                if locked:
+                    cache.delete(lock_key)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# At most this many async LLM requests run at once in one process
+LLM_MAX_CONCURRENCY = 8
+# At most this many LLM requests start per minute across all processes,
+# counted in the LLMRateWindow table
+LLM_REQUESTS_PER_MINUTE = 60
+
+_llm_semaphores = weakref.WeakKeyDictionary()
+
+
+class LLMRateLimitError(Exception):
+    """The LLM provider rejected a request because a rate limit or quota was hit."""
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    # llm.ModelError only carries the provider message, e.g. Gemini's
+    # "Resource has been exhausted (e.g. check quota)."
+    message = str(error).lower()
+    return any(marker in message for marker in ("exhausted", "quota", "rate limit"))
+
+
+def _llm_rate_window():
+    """Returns the current one-minute window and its remaining seconds."""
+    now = time.time()
+    return int(now // 60), 60 - now % 60
+
+
+def _llm_semaphore():
+    # asyncio primitives are bound to one event loop, and async_to_sync may
+    # run each call in a new one
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return semaphore
+
+
+def _acquire_llm_slot():
+    # cache incr() is a plain get-then-set on the database cache, so the
+    # count lives in a table and is incremented in SQL
+    from .models import LLMRateWindow
+
+    while True:
+        window, remaining = _llm_rate_window()
+        if LLMRateWindow.take(window) <= LLM_REQUESTS_PER_MINUTE:
+            return
+        time.sleep(remaining)
+
+
+async def _aacquire_llm_slot():
+    from .models import LLMRateWindow
+
+    while True:
+        window, remaining = _llm_rate_window()
+        if await sync_to_async(LLMRateWindow.take)(window) <= LLM_REQUESTS_PER_MINUTE:
+            return
+        await asyncio.sleep(remaining)
+
+
+def rate_limited_llm_call(func):
+    """
+    Throttles an LLM helper to LLM_REQUESTS_PER_MINUTE across processes and,
+    for async helpers, LLM_MAX_CONCURRENCY concurrent calls per process.
+
+    Provider rate limit errors are re-raised as LLMRateLimitError so Celery
+    tasks can retry them.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            async with _llm_semaphore():
+                await _aacquire_llm_slot()
+                try:
+                    return await func(*args, **kwargs)
+                except llm.ModelError as e:
+                    if _is_rate_limit_error(e):
+                        raise LLMRateLimitError(str(e)) from e
+                    raise
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _acquire_llm_slot()
+        try:
+            return func(*args, **kwargs)
+        except llm.ModelError as e:
+            if _is_rate_limit_error(e):
+                raise LLMRateLimitError(str(e)) from e
+            raise
+
+    return wrapper
 
 
 def fetch_content_from_url(url: str) -> str:
@@ -28,6 +237,14 @@ def fetch_content_from_url(url: str) -> str:
     return response.text
 
 
+async def afetch_content_from_url(url: str) -> str:
+    """Async version of fetch_content_from_url."""
+    llm_friendly_jina_ai_url = f"https://r.jina.ai/{url}"
+    async with httpx.AsyncClient() as client:
+        response = await client.get(llm_friendly_jina_ai_url)
+    return response.text
+
+
 def parse_contents(contents: str):
     headers, markdown_body = contents.split("Markdown Content:", 1)
     header = {}
@@ -40,43 +257,90 @@ def parse_contents(contents: str):
     return header, markdown_body
 
 
+SUMMARY_SYSTEM_PROMPT = """make readable title and summary in korean as markdown format,
+                summary should be list of minimum 3, maximum 5 items"""
+
+
+def _translate_prompt(content: str):
+    english_text = content
+    return (
+        f"Please translate the following English text accurately to Korean.\n\n{english_text}",
+        "Your are a helpful assistant that translates English text to Korean.",
+    )
+
+
+def _categorize_prompt(summary: str, categories: list[str]):
+    category_list_str = [f"'{category}'" for category in categories]
+    return (
+        f"Please categories the following article summary:\n\n{summary}",
+        f"""
+- You are a helpful assistant that categorizes technical articles based on their summary. 
+- Assign one or more relevant categories from the following list: {category_list_str}. 
+- Respond with a JSON object listing the category names (e.g., {{"categories": ["Web Development", "Large Language Models"]}}). 
+- If none fit well, respond with {{"categories": ["Other"]}}.
+        """,
+    )
+
+
+@rate_limited_llm_call
 def get_summary_from_url(url: str):
     contents = fetch_content_from_url(url)
-    model = llm.get_model("gemini-2.5-pro-exp-03-25")
+    model = llm.get_model(GEMINI_MODEL_NAME)
     model.key = GEMINI_API_KEY
-    response = model.prompt(
-        contents,
-        system="""make readable title and summary in korean as markdown format,
-                summary should be list of minimum 3, maximum 5 items""",
-    )
+    response = model.prompt(contents, system=SUMMARY_SYSTEM_PROMPT)
     # header, markdown_body = parse_contents(contents)
     return response.text()
 
 
+@cached_llm_response("trk")
+@rate_limited_llm_call
 def translate_to_korean(content: str):
-    english_text = content
-    model = llm.get_model("gemini-2.5-pro-exp-03-25")
+    prompt, system = _translate_prompt(content)
+    model = llm.get_model(GEMINI_MODEL_NAME)
     model.key = GEMINI_API_KEY
-    response = model.prompt(
-        f"Please translate the following English text accurately to Korean.\n\n{english_text}",
-        system="Your are a helpful assistant that translates English text to Korean.",
-    )
+    response = model.prompt(prompt, system=system)
 
     return response.text()
 
 
+@cached_llm_response("cat-json")
+@rate_limited_llm_call
 def categorize_summary(summary: str, categories: list[str]):
-    category_list_str = [f"'{category}'" for category in categories]
-    model = llm.get_model("gemini-2.5-pro-exp-03-25")
+    prompt, system = _categorize_prompt(summary, categories)
+    model = llm.get_model(GEMINI_MODEL_NAME)
     model.key = GEMINI_API_KEY
-    response = model.prompt(
-        f"Please categories the following article summary:\n\n{summary}",
-        system=f"""
-- You are a helpful assistant that categorizes technical articles based on their summary. 
-- Assign one or more relevant categories from the following list: {category_list_str}. 
-- Respond with ONLY the category names, separated by commas (e.g., 'Web Development, Large Language Models'). 
-- If none fit well, respond with 'Other'.
-        """,
-    )
+    response = model.prompt(prompt, system=system, schema=Result)
 
     return response.text()
+
+
+@rate_limited_llm_call
+async def aget_summary_from_url(url: str):
+    """Async version of get_summary_from_url."""
+    contents = await afetch_content_from_url(url)
+    model = llm.get_async_model(GEMINI_MODEL_NAME)
+    model.key = GEMINI_API_KEY
+    response = model.prompt(contents, system=SUMMARY_SYSTEM_PROMPT)
+    return await response.text()
+
+
+@cached_llm_response("trk")
+@rate_limited_llm_call
+async def atranslate_to_korean(content: str):
+    """Async version of translate_to_korean."""
+    prompt, system = _translate_prompt(content)
+    model = llm.get_async_model(GEMINI_MODEL_NAME)
+    model.key = GEMINI_API_KEY
+    response = model.prompt(prompt, system=system)
+    return await response.text()
+
+
+@cached_llm_response("cat-json")
+@rate_limited_llm_call
+async def acategorize_summary(summary: str, categories: list[str]):
+    """Async version of categorize_summary."""
+    prompt, system = _categorize_prompt(summary, categories)
+    model = llm.get_async_model(GEMINI_MODEL_NAME)
+    model.key = GEMINI_API_KEY
+    response = model.prompt(prompt, system=system, schema=Result)
+    return await response.text()
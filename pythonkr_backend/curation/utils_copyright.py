@@ -147,11 +147,11 @@ def _analyze_with_gemini(url: str) -> Optional[CopyrightAnalysisResult]:
         # Parse JSON response
         copyright_result = CopyrightAnalysisResult.model_validate_json(response.text)
         
-        logger.info(f"Gemini copyright analysis completed for {url}: {copyright_result.license_type}")
+        logger.info("Gemini copyright analysis completed for %s: %s", url, copyright_result.license_type)
         return copyright_result
         
     except Exception as e:
-        logger.error(f"Gemini copyright analysis failed for {url}: {e}")
+        logger.error("Gemini copyright analysis failed for %s: %s", url, e)
         return None
 
 
@@ -202,11 +202,11 @@ Content to analyze:
             total_tokens=usage.total_tokens,
         )
         
-        logger.info(f"Copyright analysis completed for {url}: {result.output.license_type}")
+        logger.info("Copyright analysis completed for %s: %s", url, result.output.license_type)
         return result.output
         
     except Exception as e:
-        logger.error(f"Copyright analysis failed for {url}: {e}")
+        logger.error("Copyright analysis failed for %s: %s", url, e)
         return _get_default_copyright_result(f"Analysis failed: {str(e)}")
 
 
@@ -310,7 +310,7 @@ def summarize_korean_content(content: str) -> Optional[str]:
         return result.output
         
     except Exception as e:
-        logger.error(f"Korean content summarization failed: {e}")
+        logger.error("Korean content summarization failed: %s", e)
         return None
 
 
@@ -361,7 +361,7 @@ def analyze_content_for_copyright(rss_item_id: int) -> Dict[str, Any]:
         if summary:
             rss_item.summary = summary
             result['summary'] = summary
-            logger.info(f"Summary generated for Korean content: {rss_item.title}")
+            logger.info("Summary generated for Korean content: %s", rss_item.title)
         
     elif lang_result['is_foreign']:
         # Foreign content: copyright analysis
@@ -384,11 +384,11 @@ def analyze_content_for_copyright(rss_item_id: int) -> Dict[str, Any]:
             'license_url': copyright_result.license_url
         }
         
-        logger.info(f"Copyright analysis completed for: {rss_item.title}")
+        logger.info("Copyright analysis completed for: %s", rss_item.title)
     
     else:
         # Unsupported language or low confidence
-        logger.warning(f"Unsupported or low-confidence language detection: {lang_result}")
+        logger.warning("Unsupported or low-confidence language detection: %s", lang_result)
     
     # Save updated RSSItem
     rss_item.save()
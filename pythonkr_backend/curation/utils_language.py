@@ -39,7 +39,7 @@ def detect_language(text: str, min_length: int = 50) -> Tuple[str, float]:
         Returns (DEFAULT_LANGUAGE, 0.0) if detection fails
     """
     if not text or len(text.strip()) < min_length:
-        logger.warning(f"Text too short for language detection (length: {len(text)})")
+        logger.warning("Text too short for language detection (length: %s)", len(text))
         return DEFAULT_LANGUAGE, 0.0
     
     # Clean text for better detection
@@ -62,24 +62,26 @@ def detect_language(text: str, min_length: int = 50) -> Tuple[str, float]:
         if language_code in SUPPORTED_LANGUAGES:
             min_confidence = SUPPORTED_LANGUAGES[language_code]['min_confidence']
             if confidence >= min_confidence:
-                logger.info(f"Detected language: {language_code} (confidence: {confidence:.3f})")
+                logger.info("Detected language: %s (confidence: %.3f)", language_code, confidence)
                 return language_code, confidence
             else:
                 logger.warning(
-                    f"Low confidence for {language_code}: {confidence:.3f} "
-                    f"(min required: {min_confidence})"
+                    "Low confidence for %s: %.3f (min required: %s)",
+                    language_code,
+                    confidence,
+                    min_confidence,
                 )
         else:
-            logger.info(f"Unsupported language detected: {language_code} (confidence: {confidence:.3f})")
+            logger.info("Unsupported language detected: %s (confidence: %.3f)", language_code, confidence)
         
         # Return best guess even if not supported or low confidence
         return language_code, confidence
         
     except LangDetectException as e:
-        logger.error(f"Language detection failed: {e}")
+        logger.error("Language detection failed: %s", e)
         return DEFAULT_LANGUAGE, 0.0
     except Exception as e:
-        logger.error(f"Unexpected error in language detection: {e}")
+        logger.error("Unexpected error in language detection: %s", e)
         return DEFAULT_LANGUAGE, 0.0
 
 
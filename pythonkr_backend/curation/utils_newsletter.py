@@ -81,11 +81,11 @@ def extract_newsletter_links(content: str, base_url: str) -> List[Dict[str, str]
                     })
                     processed_urls.add(processed_url)
         
-        logger.info(f"Extracted {len(links)} unique links from newsletter content")
+        logger.info("Extracted %s unique links from newsletter content", len(links))
         return links
         
     except Exception as e:
-        logger.error(f"Error extracting newsletter links: {e}")
+        logger.error("Error extracting newsletter links: %s", e)
         return []
 
 
@@ -281,7 +281,7 @@ def process_newsletter_rss_item(rss_item_id: int) -> Dict[str, any]:
     from .models import RSSItem
     
     try:
-        rss_item = RSSItem.objects.get(id=rss_item_id)
+        rss_item = RSSItem.objects.select_related("feed").get(id=rss_item_id)
     except RSSItem.DoesNotExist:
         return {'error': f'RSSItem {rss_item_id} not found'}
     
@@ -317,7 +317,7 @@ def process_newsletter_rss_item(rss_item_id: int) -> Dict[str, any]:
             # Check if link already exists
             existing_item = RSSItem.objects.filter(link=link_data['url']).first()
             if existing_item:
-                logger.debug(f"Link already exists: {link_data['url']}")
+                logger.debug("Link already exists: %s", link_data['url'])
                 continue
             
             # Create new RSSItem
@@ -340,7 +340,7 @@ def process_newsletter_rss_item(rss_item_id: int) -> Dict[str, any]:
                 'url': new_item.link
             })
             
-            logger.info(f"Created RSSItem for extracted link: {link_data['title']}")
+            logger.info("Created RSSItem for extracted link: %s", link_data['title'])
             
         except Exception as e:
             error_msg = f"Failed to create RSSItem for {link_data['url']}: {e}"
@@ -362,8 +362,9 @@ def process_newsletter_rss_item(rss_item_id: int) -> Dict[str, any]:
         result['errors'] = errors
     
     logger.info(
-        f"Newsletter processing completed. "
-        f"Extracted: {len(extracted_links)}, Created: {len(created_items)}"
+        "Newsletter processing completed. Extracted: %d, Created: %d",
+        len(extracted_links),
+        len(created_items),
     )
     
     return result
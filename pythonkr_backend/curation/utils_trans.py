@@ -3,6 +3,7 @@ from pydantic_ai import Agent
 from datetime import date
 
 from django.core.files.base import ContentFile
+from django.db import transaction
 
 
 class TranslatedResult(BaseModel):
@@ -22,7 +23,7 @@ class TranslatedResult(BaseModel):
 
 
 def translate_rssitem(rss_item_id: int):
-    from .models import LLMService, LLMUsage, TranslatedContent, RSSItem
+    from .models import LLMService, LLMUsage, TranslatedContent, RSSItem, Tag
 
     """
     Translate an RSS item to Korean using AI and save as TranslatedContent.
@@ -92,22 +93,24 @@ def translate_rssitem(rss_item_id: int):
         slug=result.output.slug,
         description=result.output.description,
         author=result.output.author,
-        tags=result.output.tags,
         written_date=result.output.written_date,
         model_name=model_name,
         source_rss_item=rss_item,
         source_url=rss_item.link,
     )
 
-    # save to get instance id
-    translated_content.save()
-    # Save the translated content to a file
-    content_file = ContentFile(
-        result.output.content, name=f"{rss_item.id}-translated.md"
-    )
-    translated_content.content.save(f"{rss_item.id}-translated.md", content_file)
-    # save again to update the content field
-    translated_content.save()
+    with transaction.atomic():
+        # save to get instance id, which the upload path uses
+        translated_content.save()
+        translated_content.tags.set(Tag.get_or_create_many(result.output.tags))
+        # Write the file without saving, then record its name with one UPDATE
+        content_file = ContentFile(
+            result.output.content, name=f"{rss_item.id}-translated.md"
+        )
+        translated_content.content.save(
+            f"{rss_item.id}-translated.md", content_file, save=False
+        )
+        translated_content.save(update_fields=["content", "updated_at"])
 
     # Create LLM usage record
     usage = result.usage()
@@ -189,6 +189,17 @@ INTERNAL_IPS = [
     "0.0.0.0",
 ]
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # responses of the curation LLM helpers (translation, categorization)
+    "llm": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "llm",
+    },
+}
+
 # import logfire
 # setup logfire
 # logfire.configure(environment='base', service_name="web")
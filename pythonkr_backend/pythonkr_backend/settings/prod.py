@@ -8,6 +8,9 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": "pk",
+        # gunicorn/celery 워커가 요청·태스크마다 새로 접속하지 않도록 연결을 재사용합니다
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -25,6 +28,17 @@ MEDIA_ROOT = "/home/pk/data/media"
 BAKERY_MULTISITE = True
 BUILD_DIR = os.path.join("/home/pk/bakery_static", "build")
 
+# share cached LLM responses between gunicorn and celery workers
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "llm": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "curation_llm_cache",
+    },
+}
+
 # Django logging to file with rotation
 LOGGING = {
     "version": 1,
@@ -70,6 +84,9 @@ if IS_PRODUCTION_SERVER:
     )
     logfire.instrument_django()
     logfire.instrument_system_metrics()
+    # 표준 logging 로그도 logfire로 보내 한 번의 호출로 두 곳에 남깁니다
+    LOGGING["handlers"]["logfire"] = {"class": "logfire.LogfireLoggingHandler"}
+    LOGGING["loggers"][""]["handlers"].append("logfire")
 
 # celery
 CELERY_BROKER_PASSWORD = os.environ.get("CELERY_BROKER_PASSWORD", "FALSE")
@@ -89,6 +106,11 @@ CELERY_BROKER_URL = f"amqp://{CELERY_BROKER_USERNAME}:{CELERY_BROKER_PASSWORD}@l
 CELERY_TASK_TIME_LIMIT = 30 * 60
 CELERY_RESULT_BACKEND = "django-db"
 # CELERY_TASK_QUEUES
+# LLM-bound tasks get their own queue so they don't hold up crawling
+CELERY_TASK_ROUTES = {
+    "curation.tasks.process_article": {"queue": "llm"},
+    "curation.tasks.bulk_summarize_articles": {"queue": "llm"},
+}
 
 # django-celery-beat
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
@@ -97,18 +119,9 @@ CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 from celery.schedules import crontab
 
 CELERY_BEAT_SCHEDULE = {
-    "crawl-rss-feeds": {
-        "task": "curation.tasks.crawl_rss",
-        "schedule": crontab(minute="*/10"),  # Every 10 minutes
-        "options": {"queue": "celery"},
-    },
-    "crawl-rss-item-content": {
-        "task": "curation.tasks.crawl_rss_item_content",
-        "schedule": crontab(minute="*/10"),  # Every 10 minutes
-        "options": {"queue": "celery"},
-    },
-    "translate-pending-rss-item": {
-        "task": "curation.tasks.translate_pending_rss_item",
+    # 피드 크롤링부터 번역까지 RSS 처리 단계를 하나의 group으로 실행합니다
+    "rss-pipeline": {
+        "task": "curation.tasks.run_rss_pipeline",
         "schedule": crontab(minute="*/10"),  # Every 10 minutes
         "options": {"queue": "celery"},
     },